@@ -0,0 +1,42 @@
+# Micro-benchmark for `_frmt_str_to_datetime` over the timestamp shapes returned by
+# trackmania.io (COTD, leaderboards, players) and trackmania.exchange.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_datetime
+import timeit
+from datetime import datetime
+
+from trackmania._util import _DATETIME_PARSERS, _frmt_str_to_datetime
+
+SAMPLES = {
+    "trackmania.io": "2022-03-06T15:35:59+00:00",
+    "trackmania.io (Z)": "2022-03-06T15:35:59Z",
+    "TMX uploaded": "2022-03-15T18:18:50.007",
+    "TMX exe build": "2022-03-31_10_56",
+}
+
+
+def _try_each_format(date_string: str) -> datetime | None:
+    for fmt in _DATETIME_PARSERS:
+        try:
+            return datetime.strptime(date_string, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def run() -> None:
+    for label, sample in SAMPLES.items():
+        timings = []
+        for func in (_try_each_format, _frmt_str_to_datetime):
+            seconds = min(timeit.repeat(lambda: func(sample), number=20_000, repeat=5))
+            timings.append(seconds / 20_000 * 1e9)
+
+        print(
+            f"{label:>18}: {timings[0]:8.1f} ns -> {timings[1]:6.1f} ns "
+            f"({timings[0] / timings[1]:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,69 @@
+# Benchmark for reading map metadata from local `.Map.Gbx` headers.
+# Writes synthetic maps with a 1 MiB body to a temporary directory and reads them back,
+# comparing the memory mapped header reader against reading every file in full.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_gbx
+import struct
+import tempfile
+import time
+from pathlib import Path
+
+from trackmania._gbx import _parse_header
+from trackmania.tmx import GbxFileMetadata
+
+MAP_COUNT = 2_000
+BODY_SIZE = 1024 * 1024
+
+HEADER_XML = (
+    '<header type="map" exever="3.3.0" exebuild="2022-05-19_15_03" title="TMStadium">'
+    '<ident uid="Fq1AbCdEfGhIjKlMnOpQrStUvW" name="Benchmark Map" author="abcDEF123"/>'
+    '<desc envir="Stadium" mood="Day" type="Race" maptype="TrackMania\\TM_Race"/>'
+    '<times bronze="68000" silver="54000" gold="48000" authortime="45123"/>'
+    "</header>"
+)
+
+
+def _build_map() -> bytes:
+    # A map header with the medal chunk and the xml chunk, followed by the body.
+    medals = struct.pack("<BI4i", 13, 0, 68000, 54000, 48000, 45123)
+    xml = HEADER_XML.encode("utf-8")
+    chunks = [(0x03043002, medals), (0x03043005, struct.pack("<I", len(xml)) + xml)]
+
+    user_data = struct.pack("<I", len(chunks))
+    user_data += b"".join(
+        struct.pack("<II", chunk_id, len(data) | 0x80000000)
+        for chunk_id, data in chunks
+    )
+    user_data += b"".join(data for _, data in chunks)
+
+    header = b"GBX" + struct.pack("<H", 6) + b"BUCR"
+    header += struct.pack("<II", 0x03043000, len(user_data))
+    return header + user_data + b"\x00" * BODY_SIZE
+
+
+def run() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        data = _build_map()
+        paths = []
+        for i in range(MAP_COUNT):
+            path = Path(directory) / f"{i}.Map.Gbx"
+            path.write_bytes(data)
+            paths.append(path)
+
+        start = time.perf_counter()
+        for path in paths:
+            _parse_header(path.read_bytes())
+        full_read = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for path in paths:
+            GbxFileMetadata.from_file(path)
+        header_only = time.perf_counter() - start
+
+    print(f"full read + header parse: {MAP_COUNT / full_read:10,.0f} maps/s")
+    print(f"mmap header + metadata:   {MAP_COUNT / header_only:10,.0f} maps/s")
+
+
+if __name__ == "__main__":
+    run()
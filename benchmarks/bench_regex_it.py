@@ -0,0 +1,52 @@
+# Micro-benchmark for `_regex_it` over the names, club tags and map names found in
+# the payloads stored in `tests/data`.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_regex_it
+import json
+import pathlib
+import re
+import timeit
+
+from trackmania._util import _FORMATTING_REGEX, _regex_it, _strip_formatting
+
+DATA_DIR = pathlib.Path(__file__).parent.parent / "tests" / "data"
+TEXT_KEYS = {"name", "tag", "displayname", "clubtag"}
+
+
+def _collect(node, texts: list[str]) -> None:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key in TEXT_KEYS and isinstance(value, str):
+                texts.append(value)
+            else:
+                _collect(value, texts)
+    elif isinstance(node, list):
+        for value in node:
+            _collect(value, texts)
+
+
+def _uncompiled(text: str) -> str:
+    return re.sub(_FORMATTING_REGEX.pattern, "", text)
+
+
+def run() -> None:
+    texts: list[str] = []
+    for path in sorted(DATA_DIR.glob("*.json")):
+        with open(path, "r", encoding="UTF-8") as file:
+            _collect(json.load(file), texts)
+
+    formatted = sum("$" in text for text in texts)
+    print(f"{len(texts)} strings, {formatted} with formatting codes")
+
+    for label, func in (("re.sub per call", _uncompiled), ("_regex_it", _regex_it)):
+        _strip_formatting.cache_clear()
+        seconds = min(
+            timeit.repeat(lambda: [func(text) for text in texts], number=200, repeat=5)
+        )
+        per_call = seconds / (200 * len(texts)) * 1e9
+        print(f"{label:>16}: {per_call:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,28 @@
+import unittest
+from unittest import mock
+
+import fakeredis
+
+from trackmania import Client
+from trackmania._names import _NAME_INDEX
+
+USER_AGENT = "NottCurious#4351 | py-trackmania.io Testing Suite"
+
+
+class CacheTestCase(unittest.TestCase):
+    """
+    Sets the user agent, serves the cache from a fresh fakeredis instance, `self.cache`, and
+    empties the player name index so names buffered by parsing never reach another test.
+    """
+
+    def setUp(self):
+        super().setUp()
+        Client.USER_AGENT = USER_AGENT
+        self.cache = fakeredis.FakeRedis()
+        patcher = mock.patch.object(
+            Client, "_get_cache_client", return_value=self.cache
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        _NAME_INDEX.clear()
+        self.addCleanup(_NAME_INDEX.clear)
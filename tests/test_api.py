@@ -0,0 +1,52 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from trackmania import Client
+from trackmania.api import _wait_for_ratelimit
+
+
+class TestRatelimit(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.multiple(
+            Client,
+            RATELIMIT_LIMIT=40,
+            RATELIMIT_REMAINING=None,
+            RATELIMIT_RESET=None,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _wait(self):
+        with mock.patch("asyncio.sleep") as sleep:
+            asyncio.get_event_loop().run_until_complete(_wait_for_ratelimit())
+        return sleep
+
+    def test_takes_from_remaining_budget(self):
+        Client.RATELIMIT_REMAINING = 5
+
+        sleep = self._wait()
+
+        sleep.assert_not_called()
+        self.assertEqual(Client.RATELIMIT_REMAINING, 4)
+
+    def test_waits_for_reset_when_exhausted(self):
+        Client.RATELIMIT_REMAINING = 0
+        Client.RATELIMIT_RESET = datetime.utcnow() + timedelta(seconds=30)
+
+        sleep = self._wait()
+
+        sleep.assert_called_once()
+        self.assertGreater(sleep.call_args.args[0], 25)
+        self.assertEqual(Client.RATELIMIT_REMAINING, 39)
+
+    def test_unknown_budget_is_not_limited(self):
+        sleep = self._wait()
+
+        sleep.assert_not_called()
+        self.assertIsNone(Client.RATELIMIT_REMAINING)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from aioresponses import aioresponses
+
+from tests.helpers import CacheTestCase
+from trackmania import TMIOException
+from trackmania._names import _NAME_INDEX
+from trackmania.club import Club
+from trackmania.player import Player
+from trackmania.tmmap import TMMap
+
+CLUB_URL = "https://trackmania.io/api/club/{}"
+MAP_URL = "https://trackmania.io/api/map/{}"
+PLAYER_URL = "https://trackmania.io/api/player/{}"
+
+
+def _club(club_id: int) -> dict:
+    return {
+        "id": club_id,
+        "name": f"$f00Club {club_id}",
+        "tag": "TAG",
+        "creationTimestamp": 1650000000,
+        "creatorplayer": {"id": "creator-id", "name": "Creator"},
+    }
+
+
+def _map(map_uid: str) -> dict:
+    return {
+        "author": "author-id",
+        "authorplayer": {"name": "Author"},
+        "submitter": "author-id",
+        "submitterplayer": {"name": "Author"},
+        "mapUid": map_uid,
+        "name": f"$o{map_uid}",
+        "timestamp": "2022-07-01T10:00:00+00:00",
+        "bronzeScore": 68000,
+        "silverScore": 54000,
+        "goldScore": 48000,
+        "authorScore": 45000,
+    }
+
+
+class TestGetMany(CacheTestCase):
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    @aioresponses()
+    def test_keeps_order_and_fetches_only_misses(self, mocked):
+        self.cache.set("map:uidTwo", json.dumps(_map("uidTwo")))
+        for map_uid in ("uidOne", "uidThree"):
+            mocked.get(MAP_URL.format(map_uid), payload=_map(map_uid))
+
+        maps = self._run(TMMap.get_many(["uidThree", "uidTwo", "uidOne", "uidThree"]))
+
+        self.assertEqual(
+            [tmmap.uid for tmmap in maps], ["uidThree", "uidTwo", "uidOne", "uidThree"]
+        )
+        self.assertEqual(sum(map(len, mocked.requests.values())), 2)
+        self.assertEqual(json.loads(self.cache.get("map:uidOne")), _map("uidOne"))
+
+    @aioresponses()
+    def test_errors_in_place_or_raised(self, mocked):
+        mocked.get(CLUB_URL.format(1), payload=_club(1), repeat=True)
+        mocked.get(CLUB_URL.format(2), payload={"error": "club not found"}, repeat=True)
+
+        clubs = self._run(Club.get_many([1, 0, 2], return_exceptions=True))
+
+        self.assertEqual(clubs[0].club_id, 1)
+        self.assertIsNone(clubs[1])
+        self.assertIsInstance(clubs[2], TMIOException)
+        self.assertIsNotNone(self.cache.get("club:1"))
+        self.assertIsNone(self.cache.get("club:2"))
+
+        with self.assertRaises(TMIOException):
+            self._run(Club.get_many([1, 2]))
+
+    @aioresponses()
+    def test_concurrency_cap(self, mocked):
+        running = 0
+        peak = 0
+
+        async def track(url, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        for map_uid in range(6):
+            mocked.get(
+                MAP_URL.format(map_uid), payload=_map(str(map_uid)), callback=track
+            )
+
+        maps = self._run(TMMap.get_many([str(i) for i in range(6)], max_concurrent=2))
+
+        self.assertEqual(len(maps), 6)
+        self.assertEqual(peak, 2)
+
+
+class TestDataLoader(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        with open("./tests/data/player_get.json", "r", encoding="UTF-8") as file:
+            self.player_data = json.load(file)
+
+    def _player(self, player_id: str, name: str) -> dict:
+        return {**self.player_data, "accountid": player_id, "displayname": name}
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    async def _gather_players(self, player_ids: list[str]) -> list:
+        return await asyncio.gather(
+            *(Player.get_player(player_id) for player_id in player_ids),
+            return_exceptions=True,
+        )
+
+    @aioresponses()
+    def test_batches_loads_of_one_iteration(self, mocked):
+        self.cache.set("player:cached-id", json.dumps(self._player("cached-id", "C")))
+        mocked.get(PLAYER_URL.format("one-id"), payload=self._player("one-id", "One"))
+        mocked.get(PLAYER_URL.format("two-id"), payload=self._player("two-id", "Two"))
+
+        with mock.patch.object(self.cache, "mget", wraps=self.cache.mget) as mget:
+            players = self._run(
+                self._gather_players(["one-id", "cached-id", "two-id", "one-id"])
+            )
+
+        self.assertEqual(
+            [player.player_id for player in players],
+            ["one-id", "cached-id", "two-id", "one-id"],
+        )
+        self.assertEqual(mget.call_count, 1)
+        self.assertEqual(sum(map(len, mocked.requests.values())), 2)
+        _NAME_INDEX.flush()
+        self.assertEqual(self.cache.get("player_id:two").decode("utf-8"), "two-id")
+        self.assertEqual(
+            self.cache.get("player_username:one-id").decode("utf-8"), "One"
+        )
+
+    @aioresponses()
+    def test_errors_only_fail_their_own_load(self, mocked):
+        mocked.get(PLAYER_URL.format("one-id"), payload=self._player("one-id", "One"))
+        mocked.get(PLAYER_URL.format("bad-id"), payload={"error": "player not found"})
+
+        players = self._run(self._gather_players(["one-id", "bad-id"]))
+
+        self.assertEqual(players[0].player_id, "one-id")
+        self.assertIsInstance(players[1], TMIOException)
+        self.assertIsNone(self.cache.get("player:bad-id"))
+
+
+if __name__ == "__main__":
+    unittest.main()
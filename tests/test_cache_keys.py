@@ -0,0 +1,90 @@
+import asyncio
+import json
+import unittest
+
+from aioresponses import aioresponses
+
+from tests.helpers import CacheTestCase
+from trackmania.club import Club
+from trackmania.trophy import PlayerTrophies
+
+PLAYER_ONE = "b73fe3d7-a92a-4a6d-ab9d-49005caec499"
+PLAYER_TWO = "c6c8d4e1-7a35-4d0c-9b8e-5a3b0a0c1a01"
+
+CLUB = {
+    "id": 9,
+    "name": "$F00Test Club",
+    "tag": "$F00TC",
+    "membercount": 2,
+    "creationTimestamp": 1640995200,
+    "creatorplayer": {"name": "NottCurious", "id": PLAYER_ONE},
+}
+MEMBERS = {
+    "members": [
+        {
+            "player": {"name": "NottCurious", "id": PLAYER_ONE},
+            "joinTime": 1640995200,
+            "role": "Creator",
+            "vip": False,
+        }
+    ]
+}
+
+
+def _request_count(mocked) -> int:
+    return sum(map(len, mocked.requests.values()))
+
+
+class TestCacheKeys(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.get_event_loop()
+
+    @aioresponses()
+    def test_trophy_history_is_cached_per_player(self, mocked):
+        for player_id, points in ((PLAYER_ONE, 10), (PLAYER_TWO, 20)):
+            mocked.get(
+                f"https://trackmania.io/api/player/{player_id}/trophies/0",
+                payload={"gains": [{"points": points}]},
+            )
+
+        trophies_one = PlayerTrophies(1, None, 0, [0] * 9, PLAYER_ONE)
+        trophies_two = PlayerTrophies(1, None, 0, [0] * 9, PLAYER_TWO)
+
+        history_one = self.loop.run_until_complete(trophies_one.history())
+        history_two = self.loop.run_until_complete(trophies_two.history())
+        cached_one = self.loop.run_until_complete(trophies_one.history())
+
+        self.assertEqual(history_one, [{"points": 10}])
+        self.assertEqual(history_two, [{"points": 20}])
+        self.assertEqual(cached_one, history_one)
+        self.assertEqual(_request_count(mocked), 2)
+        self.assertTrue(self.cache.exists(f"trophy_history:{PLAYER_ONE}:0"))
+
+    @aioresponses()
+    def test_club_is_written_to_cache(self, mocked):
+        mocked.get("https://trackmania.io/api/club/9", payload=CLUB)
+
+        club = self.loop.run_until_complete(Club.get_club(9))
+        cached_club = self.loop.run_until_complete(Club.get_club(9))
+
+        self.assertEqual(_request_count(mocked), 1)
+        self.assertEqual(json.loads(self.cache.get("club:9")), CLUB)
+        self.assertEqual(club.name, cached_club.name)
+        self.assertEqual(cached_club.tag, "TC")
+
+    @aioresponses()
+    def test_club_members_are_written_to_cache(self, mocked):
+        mocked.get("https://trackmania.io/api/club/9/members/0", payload=MEMBERS)
+        club = Club._from_dict(CLUB)
+
+        members = self.loop.run_until_complete(club.get_members())
+        cached_members = self.loop.run_until_complete(club.get_members())
+
+        self.assertEqual(_request_count(mocked), 1)
+        self.assertTrue(self.cache.exists("club_members:9:0"))
+        self.assertEqual(members[0].player_id, cached_members[0].player_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import asyncio
+import json
+import unittest
+
+from aioresponses import aioresponses
+
+from tests.helpers import CacheTestCase
+from trackmania import TMIOException
+from trackmania.campaign import Campaign
+from trackmania.tmmap import TMMap
+
+LEADERBOARD_URL = "https://trackmania.io/api/leaderboard/map/{}?offset=0&length=2"
+CAMPAIGN_URL = "https://trackmania.io/api/campaign/{}/{}"
+CLUB_URL = "https://trackmania.io/api/club/{}"
+PLAYER_URL = "https://trackmania.io/api/player/{}"
+
+
+def _tops(map_uid: str) -> dict:
+    return {
+        "tops": [
+            {
+                "player": {"id": f"{map_uid}-{position}", "name": f"Player{position}"},
+                "position": position,
+                "time": 45000 + position,
+                "url": f"/api/download/ghost/{map_uid}-{position}",
+                "timestamp": "2022-07-01T10:00:00+00:00",
+            }
+            for position in (1, 2)
+        ]
+    }
+
+
+class TestMapLeaderboards(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.map_uids = ["uidOne", "uidTwo", "uidThree"]
+        self.campaign = Campaign._from_dict(
+            {
+                "id": 1,
+                "clubid": 0,
+                "name": "Summer 2022",
+                "leaderboarduid": "campaign-uid",
+                "playlist": [{"mapUid": map_uid} for map_uid in self.map_uids],
+            },
+            official=True,
+        )
+
+    def _map_leaderboards(self, **kwargs):
+        return asyncio.get_event_loop().run_until_complete(
+            self.campaign.map_leaderboards(length=2, **kwargs)
+        )
+
+    @aioresponses()
+    def test_returns_every_map_in_campaign_order(self, mocked):
+        for map_uid in self.map_uids:
+            mocked.get(LEADERBOARD_URL.format(map_uid), payload=_tops(map_uid))
+
+        leaderboards = self._map_leaderboards()
+
+        self.assertEqual(list(leaderboards), self.map_uids)
+        self.assertEqual(
+            [lb.player_id for lb in leaderboards["uidTwo"]],
+            ["uidTwo-1", "uidTwo-2"],
+        )
+        self.assertEqual(sum(map(len, mocked.requests.values())), 3)
+        self.assertIsNotNone(self.cache.get("map_leaderboard:uidThree:0:2"))
+
+    @aioresponses()
+    def test_partial_results_keep_per_map_errors(self, mocked):
+        self.cache.set("map_leaderboard:uidOne:0:2", json.dumps(_tops("uidOne")))
+        mocked.get(LEADERBOARD_URL.format("uidTwo"), payload={"error": "Not found"})
+        mocked.get(LEADERBOARD_URL.format("uidThree"), payload=_tops("uidThree"))
+
+        leaderboards = self._map_leaderboards()
+
+        self.assertEqual(len(leaderboards["uidOne"]), 2)
+        self.assertIsInstance(leaderboards["uidTwo"], TMIOException)
+        self.assertEqual(leaderboards["uidThree"][0].position, 1)
+        self.assertEqual(sum(map(len, mocked.requests.values())), 2)
+
+    @aioresponses()
+    def test_errors_can_be_raised(self, mocked):
+        mocked.get(LEADERBOARD_URL.format("uidOne"), payload={"error": "Not found"})
+        for map_uid in self.map_uids[1:]:
+            mocked.get(LEADERBOARD_URL.format(map_uid), payload=_tops(map_uid))
+
+        with self.assertRaises(TMIOException):
+            self._map_leaderboards(return_exceptions=False)
+
+
+class TestInclude(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        with open("./tests/data/player_get.json", "r", encoding="UTF-8") as file:
+            self.player_data = json.load(file)
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def _mock_player(self, mocked, player_id: str):
+        mocked.get(
+            PLAYER_URL.format(player_id),
+            payload={**self.player_data, "accountid": player_id},
+        )
+
+    @staticmethod
+    def _map(map_uid: str, author_id: str) -> dict:
+        return {
+            "author": author_id,
+            "authorplayer": {"name": author_id},
+            "submitter": author_id,
+            "submitterplayer": {"name": author_id},
+            "mapUid": map_uid,
+            "name": map_uid,
+            "timestamp": "2022-07-01T10:00:00+00:00",
+            "bronzeScore": 68000,
+            "silverScore": 54000,
+            "goldScore": 48000,
+            "authorScore": 45000,
+        }
+
+    @aioresponses()
+    def test_campaign_prefetches_club_and_map_authors(self, mocked):
+        mocked.get(
+            CAMPAIGN_URL.format(7, 3),
+            payload={
+                "id": 3,
+                "clubid": 7,
+                "name": "Club Campaign",
+                "playlist": [
+                    self._map("uidOne", "author-a"),
+                    self._map("uidTwo", "author-b"),
+                    self._map("uidThree", "author-a"),
+                ],
+            },
+        )
+        mocked.get(
+            CLUB_URL.format(7),
+            payload={
+                "id": 7,
+                "name": "Club",
+                "tag": "TAG",
+                "creationTimestamp": 1650000000,
+                "creatorplayer": {"id": "author-a", "name": "author-a"},
+            },
+        )
+        self._mock_player(mocked, "author-a")
+        self._mock_player(mocked, "author-b")
+
+        campaign = self._run(
+            Campaign.get_campaign(3, 7, include=["club", "map_authors"])
+        )
+        self.assertEqual(sum(map(len, mocked.requests.values())), 4)
+
+        club = self._run(campaign.club())
+        authors = self._run(
+            asyncio.gather(*(tmmap.author() for tmmap in campaign.maps))
+        )
+
+        self.assertEqual(club.club_id, 7)
+        self.assertEqual(
+            [author.player_id for author in authors],
+            ["author-a", "author-b", "author-a"],
+        )
+        self.assertEqual(sum(map(len, mocked.requests.values())), 4)
+
+    @aioresponses()
+    def test_leaderboard_prefetches_players(self, mocked):
+        mocked.get(LEADERBOARD_URL.format("uidOne"), payload=_tops("uidOne"))
+        self._mock_player(mocked, "uidOne-1")
+        self._mock_player(mocked, "uidOne-2")
+        tmmap = TMMap._from_dict(self._map("uidOne", "author-a"))
+
+        leaderboards = self._run(tmmap.get_leaderboard(length=2, include=["players"]))
+        players = self._run(asyncio.gather(*(lb.get_player() for lb in leaderboards)))
+
+        self.assertEqual(
+            [player.player_id for player in players], ["uidOne-1", "uidOne-2"]
+        )
+        self.assertEqual(sum(map(len, mocked.requests.values())), 3)
+
+    @aioresponses()
+    def test_failed_include_is_retried_by_its_accessor(self, mocked):
+        campaign_data = {"id": 3, "clubid": 7, "name": "Club Campaign", "playlist": []}
+        club_data = {
+            "id": 7,
+            "name": "Club",
+            "tag": "TAG",
+            "creationTimestamp": 1650000000,
+            "creatorplayer": {"id": "author-a", "name": "author-a"},
+        }
+        mocked.get(CAMPAIGN_URL.format(7, 3), payload=campaign_data)
+        mocked.get(CLUB_URL.format(7), status=500, body="Internal Server Error")
+        mocked.get(CLUB_URL.format(7), payload=club_data)
+
+        campaign = self._run(Campaign.get_campaign(3, 7, include=["club"]))
+        club = self._run(campaign.club())
+
+        self.assertEqual(campaign.name, "Club Campaign")
+        self.assertEqual(club.club_id, 7)
+        self.assertEqual(sum(map(len, mocked.requests.values())), 3)
+
+    def test_unknown_include_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self._run(Campaign.get_campaign(3, 7, include=["members"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import fakeredis
+from aioresponses import aioresponses
+from redis.commands.core import SetCommands
+from redis.exceptions import ResponseError
+
+from tests.helpers import CacheTestCase
+from trackmania import Client
+from trackmania.cotd import PlayerCOTD
+
+PLAYER_ID = "player-id"
+PAGE_URL = "https://trackmania.io/api/player/player-id/cotd/{}"
+
+
+def _cotd(cotd_id: int) -> dict:
+    return {
+        "id": cotd_id,
+        "timestamp": "2022-07-01T17:00:00+00:00",
+        "name": f"Cup of the Day #{cotd_id}",
+        "div": 1,
+        "rank": 10,
+        "divrank": 10,
+        "score": 0,
+        "totalplayers": 2000,
+    }
+
+
+def _page(cotd_ids: list[int]) -> dict:
+    return {
+        "total": len(cotd_ids),
+        "stats": {"bestprimary": {}, "bestoverall": {}},
+        "cotds": [_cotd(cotd_id) for cotd_id in cotd_ids],
+    }
+
+
+class TestCOTDSync(CacheTestCase):
+    def _sync(self) -> int:
+        return asyncio.get_event_loop().run_until_complete(PlayerCOTD.sync(PLAYER_ID))
+
+    @aioresponses()
+    def test_first_sync_walks_every_page(self, mocked):
+        mocked.get(PAGE_URL.format(0), payload=_page([6, 5, 4]))
+        mocked.get(PAGE_URL.format(1), payload=_page([3, 2, 1]))
+        mocked.get(PAGE_URL.format(2), payload=_page([]))
+
+        self.assertEqual(self._sync(), 6)
+        self.assertEqual(
+            [result.id for result in PlayerCOTD.results(PLAYER_ID, chunk_size=4)],
+            [6, 5, 4, 3, 2, 1],
+        )
+
+    @aioresponses()
+    def test_sync_stops_at_the_first_known_competition(self, mocked):
+        mocked.get(PAGE_URL.format(0), payload=_page([3, 2, 1]))
+        mocked.get(PAGE_URL.format(1), payload=_page([]))
+        self._sync()
+
+        # Two new COTDs shift the known ones to later pages.
+        mocked.get(PAGE_URL.format(0), payload=_page([5, 4, 3]))
+        requests = sum(map(len, mocked.requests.values()))
+
+        self.assertEqual(self._sync(), 2)
+        self.assertEqual(sum(map(len, mocked.requests.values())), requests + 1)
+        self.assertEqual(
+            [result.id for result in PlayerCOTD.results(PLAYER_ID)], [5, 4, 3, 2, 1]
+        )
+
+    @aioresponses()
+    def test_concurrent_syncs_store_results_once(self, mocked):
+        for _ in range(2):
+            mocked.get(PAGE_URL.format(0), payload=_page([3, 2, 1]))
+            mocked.get(PAGE_URL.format(1), payload=_page([]))
+
+        added = asyncio.get_event_loop().run_until_complete(
+            asyncio.gather(PlayerCOTD.sync(PLAYER_ID), PlayerCOTD.sync(PLAYER_ID))
+        )
+
+        self.assertEqual(sorted(added), [0, 3])
+        self.assertEqual(
+            [result.id for result in PlayerCOTD.results(PLAYER_ID)], [3, 2, 1]
+        )
+
+    @aioresponses()
+    def test_sync_does_not_need_smismember(self, mocked):
+        mocked.get(PAGE_URL.format(0), payload=_page([3, 2, 1]))
+        mocked.get(PAGE_URL.format(1), payload=_page([]))
+
+        with mock.patch.object(
+            SetCommands, "smismember", side_effect=ResponseError("unknown command")
+        ):
+            self.assertEqual(self._sync(), 3)
+
+    @aioresponses()
+    def test_sync_without_cache_stores_nothing(self, mocked):
+        server = fakeredis.FakeServer()
+        server.connected = False
+        mocked.get(PAGE_URL.format(0), payload=_page([6, 5, 4]))
+
+        with mock.patch.object(
+            Client, "_get_cache_client", return_value=fakeredis.FakeRedis(server=server)
+        ):
+            self.assertEqual(self._sync(), 0)
+
+        self.assertEqual(sum(map(len, mocked.requests.values())), 1)
+
+    @aioresponses()
+    def test_pages_expire(self, mocked):
+        mocked.get(PAGE_URL.format(0), payload=_page([1]))
+
+        asyncio.get_event_loop().run_until_complete(PlayerCOTD.get_page(PLAYER_ID))
+
+        self.assertGreater(self.cache.ttl(f"player_cotd:{PLAYER_ID}:0"), 0)
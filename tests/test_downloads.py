@@ -0,0 +1,88 @@
+import asyncio
+import hashlib
+import tempfile
+import unittest
+
+from aioresponses import aioresponses
+
+from trackmania import Client, DownloadManager
+from trackmania.api import ResponseCodeError
+
+GHOST_URL = "https://trackmania.io/api/download/ghost/one"
+MIRROR_URL = "https://trackmania.io/api/download/ghost/two"
+CONTENT = b"GBX" + bytes(range(256)) * 1024
+
+
+class TestDownloadManager(unittest.TestCase):
+    def setUp(self):
+        Client.USER_AGENT = "NottCurious#4351 | py-trackmania.io Testing Suite"
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.manager = DownloadManager(directory.name, max_concurrent=2)
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    @aioresponses()
+    def test_stores_by_content_hash(self, mocked):
+        mocked.get(GHOST_URL, body=CONTENT)
+
+        path = self._run(self.manager.download(GHOST_URL))
+
+        self.assertEqual(path.name, hashlib.sha256(CONTENT).hexdigest())
+        self.assertEqual(path.read_bytes(), CONTENT)
+        self.assertEqual(self.manager.get_path(GHOST_URL), path)
+
+    @aioresponses()
+    def test_repeat_is_served_from_disk(self, mocked):
+        mocked.get(GHOST_URL, body=CONTENT)
+        first = self._run(self.manager.download(GHOST_URL))
+
+        second = self._run(self.manager.download(GHOST_URL))
+
+        self.assertEqual(first, second)
+        self.assertEqual(sum(map(len, mocked.requests.values())), 1)
+
+    @aioresponses()
+    def test_concurrent_downloads_share_one_request(self, mocked):
+        mocked.get(GHOST_URL, body=CONTENT)
+        mocked.get(MIRROR_URL, body=CONTENT)
+
+        paths = self._run(
+            self.manager.download_many([GHOST_URL, GHOST_URL, MIRROR_URL])
+        )
+
+        self.assertEqual(sum(map(len, mocked.requests.values())), 2)
+        self.assertEqual(len(set(paths)), 1)
+
+    @aioresponses()
+    def test_failed_download_leaves_nothing_behind(self, mocked):
+        mocked.get(GHOST_URL, status=404, body="Not Found")
+
+        with self.assertRaises(ResponseCodeError):
+            self._run(self.manager.download(GHOST_URL))
+
+        self.assertIsNone(self.manager.get_path(GHOST_URL))
+        self.assertEqual(list((self.manager.directory / "tmp").iterdir()), [])
+
+    @aioresponses()
+    def test_failure_after_cancelled_caller_is_retried(self, mocked):
+        mocked.get(GHOST_URL, status=500, body="Internal Server Error")
+        mocked.get(GHOST_URL, body=CONTENT)
+
+        async def cancel_then_retry():
+            creator = asyncio.ensure_future(self.manager.download(GHOST_URL))
+            await asyncio.sleep(0)
+            creator.cancel()
+            # The download keeps running without its caller and fails.
+            await asyncio.sleep(0.05)
+            return await self.manager.download(GHOST_URL)
+
+        path = self._run(cancel_then_retry())
+
+        self.assertEqual(path.read_bytes(), CONTENT)
+        self.assertEqual(sum(map(len, mocked.requests.values())), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import struct
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from trackmania import InvalidGbxFile
+from trackmania.tmmap import MedalTimes
+from trackmania.tmx import GbxFileMetadata
+
+HEADER_XML = (
+    '<header type="map" exever="3.3.0" exebuild="2022-05-19_15_03" title="TMStadium" lightmap="8">'
+    '<ident uid="Fq1AbCdEfGhIjKlMnOpQrStUvW" name="$o$fffTest Map" author="abcDEF123" authorzone="World"/>'
+    '<desc envir="Stadium" mood="Day" type="Race" maptype="TrackMania\\TM_Race" mapstyle="" '
+    'validated="1" nblaps="0" displaycost="1234" mod="" hasghostblocks="1"/>'
+    '<playermodel id="CarSport"/>'
+    '<times bronze="68000" silver="54000" gold="48000" authortime="45123" authorscore="45123"/>'
+    "<deps></deps></header>"
+)
+
+
+def _build_map(
+    xml: str = HEADER_XML,
+    medals: tuple | None = (67000, 53000, 47000, 45000),
+    class_id: int = 0x03043000,
+) -> bytes:
+    chunks = []
+    if medals is not None:
+        chunks.append((0x03043002, struct.pack("<BI4i", 13, 0, *medals)))
+    xml_bytes = xml.encode("utf-8")
+    chunks.append((0x03043005, struct.pack("<I", len(xml_bytes)) + xml_bytes))
+
+    index = b"".join(
+        struct.pack("<II", chunk_id, len(data) | 0x80000000)
+        for chunk_id, data in chunks
+    )
+    user_data = struct.pack("<I", len(chunks)) + index
+    user_data += b"".join(data for _, data in chunks)
+
+    return (
+        b"GBX"
+        + struct.pack("<H", 6)
+        + b"BUCR"
+        + struct.pack("<II", class_id, len(user_data))
+        + user_data
+        + b"\x00" * 64  # Stands in for the compressed body
+    )
+
+
+class TestGbxHeader(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def _write(self, data: bytes) -> Path:
+        path = self.directory / f"{len(list(self.directory.iterdir()))}.Map.Gbx"
+        path.write_bytes(data)
+        return path
+
+    def test_metadata_from_file(self):
+        metadata = GbxFileMetadata.from_file(self._write(_build_map()))
+
+        self.assertEqual(metadata.gbx_map_name, "$o$fffTest Map")
+        self.assertEqual(metadata.author_login, "abcDEF123")
+        self.assertEqual(metadata.map_type, "TM_Race")
+        self.assertEqual(metadata.title_pack, "TMStadium")
+        self.assertEqual(metadata.track_uid, "Fq1AbCdEfGhIjKlMnOpQrStUvW")
+        self.assertEqual(metadata.display_cost, 1234)
+        self.assertIsNone(metadata.mod_name)
+        self.assertEqual(metadata.light_map, 8)
+        self.assertEqual(metadata.exe_build, datetime(2022, 5, 19, 15, 3))
+        self.assertEqual(metadata.author_time, 45123)
+        self.assertEqual(metadata.environment_name, "Stadium")
+        self.assertEqual(metadata.vehicle_name, "CarSport")
+
+    def test_medal_times_prefer_binary_chunk(self):
+        medal_times = MedalTimes.from_file(self._write(_build_map()))
+
+        self.assertEqual(
+            (medal_times.bronze, medal_times.silver, medal_times.gold),
+            (67000, 53000, 47000),
+        )
+        self.assertEqual(medal_times.author_string, "0:45.000")
+
+    def test_medal_times_fall_back_to_xml(self):
+        medal_times = MedalTimes.from_file(self._write(_build_map(medals=None)))
+
+        self.assertEqual(medal_times.author, 45123)
+        self.assertEqual(medal_times.bronze, 68000)
+
+    def test_invalid_files_raise(self):
+        for data in (
+            b"",
+            b"NOTGBX",
+            _build_map()[:40],
+            _build_map(class_id=0x03093000),
+        ):
+            with self.subTest(data=data[:10]):
+                with self.assertRaises(InvalidGbxFile):
+                    GbxFileMetadata.from_file(self._write(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import asyncio
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from aioresponses import aioresponses
+
+from trackmania import Client, DownloadManager, InvalidGbxFile
+from trackmania._lzo import decompress
+from trackmania.tmmap import Ghost, Leaderboard
+
+LZO_END = bytes([0x11, 0x00, 0x00])
+
+
+def _lzo_literals(data: bytes) -> bytes:
+    """Encodes `data` as a single LZO1X literal run, without the end marker."""
+    length = len(data) - 3
+    if 1 <= length <= 15:
+        return bytes([length]) + data
+
+    zeros, remainder = divmod(length - 15, 255)
+    if remainder == 0:
+        zeros, remainder = zeros - 1, 255
+    return b"\x00" + b"\x00" * zeros + bytes([remainder]) + data
+
+
+def _build_ghost(race_time: int, checkpoints: list[int], compressed=True) -> bytes:
+    body = b"\x01\x20\x09\x03" + b"\x00" * 32
+    body += struct.pack("<I", 0x03092005) + b"PIKS" + struct.pack("<Ii", 4, race_time)
+    checkpoint_data = struct.pack("<I", len(checkpoints))
+    for checkpoint in checkpoints:
+        checkpoint_data += struct.pack("<II", checkpoint, 0)
+    body += struct.pack("<I", 0x0309200B) + b"PIKS"
+    body += struct.pack("<I", len(checkpoint_data)) + checkpoint_data
+    body += struct.pack("<I", 0xFACADE01)
+
+    data = b"GBX" + struct.pack("<H", 6) + (b"BUCR" if compressed else b"BUUR")
+    data += struct.pack("<III", 0x03092000, 0, 1) + struct.pack("<I", 0)
+    if compressed:
+        compressed_body = _lzo_literals(body) + LZO_END
+        data += struct.pack("<II", len(body), len(compressed_body)) + compressed_body
+    else:
+        data += body
+
+    return data
+
+
+class TestLZO(unittest.TestCase):
+    def test_short_literals_and_m2_match(self):
+        data = bytes([17 + 4]) + b"abcd" + bytes([0xEC, 0x00]) + LZO_END
+
+        self.assertEqual(decompress(data), b"abcd" * 3)
+
+    def test_m3_match_with_trailing_literals(self):
+        data = bytes([17 + 4]) + b"abcd" + bytes([0x24, 0x0E, 0x00]) + b"xy"
+        data += LZO_END
+
+        self.assertEqual(decompress(data), b"abcdabcdab" + b"xy")
+
+    def test_long_literal_run_and_m4_match(self):
+        literals = bytes(range(256)) * 64 + b"z"
+        data = _lzo_literals(literals) + bytes([0x13, 0x04, 0x00]) + LZO_END
+
+        self.assertEqual(decompress(data, len(literals) + 5), literals + literals[:5])
+
+    def test_truncated_data_raises(self):
+        with self.assertRaises(InvalidGbxFile):
+            decompress(bytes([17 + 4]) + b"abcd")
+
+
+class TestGhost(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def _write(self, data: bytes) -> Path:
+        path = self.directory / "ghost.Ghost.Gbx"
+        path.write_bytes(data)
+        return path
+
+    def test_compressed_and_uncompressed_bodies(self):
+        for compressed in (True, False):
+            with self.subTest(compressed=compressed):
+                path = self._write(
+                    _build_ghost(45123, [10500, 30200, 45123], compressed)
+                )
+
+                ghost = Ghost.from_file(path)
+
+                self.assertEqual(ghost.race_time, 45123)
+                self.assertEqual(ghost.checkpoints, [10500, 30200, 45123])
+                self.assertEqual(ghost.checkpoint_count, 3)
+
+    def test_unfinished_run_has_no_race_time(self):
+        ghost = Ghost.from_file(self._write(_build_ghost(-1, [])))
+
+        self.assertIsNone(ghost.race_time)
+        self.assertEqual(ghost.checkpoints, [])
+
+
+class TestGhostBatch(unittest.TestCase):
+    def setUp(self):
+        Client.USER_AGENT = "NottCurious#4351 | py-trackmania.io Testing Suite"
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.manager = DownloadManager(directory.name)
+
+        self.leaderboards = [
+            Leaderboard(None, f"/api/download/ghost/{i}", None, None, None, i, time)
+            for i, time in enumerate([45000, 45500, 46000], start=1)
+        ]
+
+    def _run_batch(self):
+        batch = Leaderboard.download_ghosts(
+            self.leaderboards, manager=self.manager, max_concurrent=2
+        )
+
+        async def collect():
+            return [download async for download in batch]
+
+        return batch, asyncio.get_event_loop().run_until_complete(collect())
+
+    @aioresponses()
+    def test_streams_results_and_reports_stats(self, mocked):
+        for leaderboard in self.leaderboards[:2]:
+            mocked.get(
+                f"https://trackmania.io{leaderboard.ghost}",
+                body=_build_ghost(leaderboard.time, [leaderboard.time]),
+            )
+        mocked.get("https://trackmania.io/api/download/ghost/3", status=404)
+
+        batch, downloads = self._run_batch()
+
+        by_position = {d.leaderboard.position: d for d in downloads}
+        self.assertEqual(by_position[1].ghost.race_time, 45000)
+        self.assertEqual(by_position[2].ghost.checkpoint_count, 1)
+        self.assertIsNone(by_position[3].ghost)
+        self.assertIsNotNone(by_position[3].error)
+        self.assertFalse(any(d.from_cache for d in downloads))
+        self.assertEqual((batch.completed, batch.failed), (2, 1))
+        self.assertGreater(batch.total_bytes, 0)
+        self.assertGreater(batch.throughput, 0)
+
+    @aioresponses()
+    def test_second_batch_is_served_from_disk(self, mocked):
+        for leaderboard in self.leaderboards:
+            mocked.get(
+                f"https://trackmania.io{leaderboard.ghost}",
+                body=_build_ghost(leaderboard.time, []),
+            )
+        self._run_batch()
+        mocked.requests.clear()
+
+        batch, downloads = self._run_batch()
+
+        self.assertEqual(mocked.requests, {})
+        self.assertTrue(all(d.from_cache for d in downloads))
+        self.assertEqual(batch.completed, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
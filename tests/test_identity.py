@@ -0,0 +1,94 @@
+import asyncio
+import gc
+import json
+import unittest
+import weakref
+from unittest import mock
+
+from aioresponses import aioresponses
+
+from tests.helpers import CacheTestCase
+from trackmania import Client
+from trackmania.club import ClubMember
+from trackmania.player import Player
+from trackmania.tmmap import TMMap
+
+PLAYER_URL = "https://trackmania.io/api/player/{}"
+
+
+def _map(map_uid: str) -> dict:
+    return {
+        "author": "author-id",
+        "authorplayer": {"name": "Author"},
+        "submitter": "author-id",
+        "submitterplayer": {"name": "Author"},
+        "mapUid": map_uid,
+        "name": map_uid,
+        "timestamp": "2022-07-01T10:00:00+00:00",
+        "bronzeScore": 68000,
+        "silverScore": 54000,
+        "goldScore": 48000,
+        "authorScore": 45000,
+    }
+
+
+def _member(player_id: str, name: str) -> dict:
+    # Built at runtime so equal strings are separate objects until interned.
+    return {
+        "player": {"id": "".join(player_id), "name": "".join(name)},
+        "joinTime": 1650000000,
+        "role": "Member",
+        "vip": False,
+    }
+
+
+class TestIdentityMap(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(Client, "IDENTITY_MAP", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_maps_share_data_but_not_pagination(self):
+        first = TMMap._from_dict(_map("uidOne"))
+        first._offset, first._lb_loaded = 100, True
+
+        second = TMMap._from_dict(_map("uidOne"))
+
+        self.assertIsNot(second, first)
+        self.assertIs(second.medal_time, first.medal_time)
+        self.assertIs(second.uploaded, first.uploaded)
+        self.assertEqual((second.offset, second.lb_loaded), (0, False))
+        self.assertIsNot(TMMap._from_dict(_map("uidTwo")).medal_time, first.medal_time)
+
+    def test_identity_map_does_not_keep_instances_alive(self):
+        first = weakref.ref(TMMap._from_dict(_map("uidOne")))
+        gc.collect()
+
+        self.assertIsNone(first())
+        self.assertEqual(TMMap._from_dict(_map("uidOne")).uid, "uidOne")
+
+    def test_disabled_builds_new_instances(self):
+        with mock.patch.object(Client, "IDENTITY_MAP", False):
+            first = TMMap._from_dict(_map("uidOne"))
+            self.assertIsNot(TMMap._from_dict(_map("uidOne")), first)
+
+    def test_repeated_strings_are_interned(self):
+        first = ClubMember._from_dict(_member("member-id", "Member"))
+        second = ClubMember._from_dict(_member("member-id", "Member"))
+
+        self.assertIs(first.player_id, second.player_id)
+        self.assertIs(first.name, second.name)
+
+    @aioresponses()
+    def test_players_are_shared(self, mocked):
+        with open("./tests/data/player_get.json", "r", encoding="UTF-8") as file:
+            player_data = json.load(file)
+        mocked.get(PLAYER_URL.format(player_data["accountid"]), payload=player_data)
+
+        loop = asyncio.get_event_loop()
+        first = loop.run_until_complete(Player.get_player(player_data["accountid"]))
+        second = loop.run_until_complete(Player.get_player(player_data["accountid"]))
+
+        self.assertIs(first, second)
+        self.assertEqual(sum(map(len, mocked.requests.values())), 1)
@@ -0,0 +1,76 @@
+import json
+import unittest
+from unittest import mock
+
+from tests.helpers import CacheTestCase
+from trackmania.campaign import Campaign
+from trackmania.player import Player, PlayerTrophies
+from trackmania.room import Room
+from trackmania.tmmap import TMMap
+
+
+def _totd_maps() -> list[dict]:
+    with open("./tests/data/latest_totd.json", "r", encoding="UTF-8") as file:
+        return [day["map"] for day in json.load(file)["days"]]
+
+
+class TestLazyFields(CacheTestCase):
+    def test_campaign_maps(self):
+        playlist = _totd_maps()
+        campaign = Campaign._from_dict({"id": 1, "name": "March", "playlist": playlist})
+
+        self.assertEqual(campaign.map_count, len(playlist))
+        self.assertTrue(all(isinstance(item, dict) for item in campaign._maps))
+
+        first_map = campaign.get_map(0)
+        self.assertIsInstance(first_map, TMMap)
+        self.assertIs(campaign.get_map(0), first_map)
+        self.assertIsInstance(campaign._maps[1], dict)
+
+        self.assertTrue(all(isinstance(item, TMMap) for item in campaign.maps))
+        self.assertEqual(campaign.maps[0].uid, playlist[0]["mapUid"])
+
+    def test_room_maps(self):
+        playlist = _totd_maps()[:3]
+        room = Room._from_dict({"id": 1, "name": "Room", "maps": playlist})
+
+        self.assertTrue(all(isinstance(item, dict) for item in room._maps))
+        self.assertEqual(
+            [tm_map.uid for tm_map in room.maps], [m["mapUid"] for m in playlist]
+        )
+
+    def test_player_sub_objects(self):
+        with open("./tests/data/player_get.json", "r", encoding="UTF-8") as file:
+            player = Player(**Player._parse_player(json.load(file)))
+
+        self.assertNotIn("trophies", player.__dict__)
+        self.assertNotIn("zone", player.__dict__)
+
+        self.assertIsInstance(player.trophies, PlayerTrophies)
+        self.assertIs(player.trophies, player.trophies)
+        self.assertEqual(
+            [zone.zone for zone in player.zone], ["India", "Asia", "World"]
+        )
+
+    def test_player_matchmaking_is_parsed_once(self):
+        with open("./tests/data/player_get.json", "r", encoding="UTF-8") as file:
+            player = Player(**Player._parse_player(json.load(file)))
+
+        with mock.patch.object(
+            Player, "_parse_matchmaking", wraps=Player._parse_matchmaking
+        ) as parse:
+            self.assertEqual(player.m3v3_data.type_id, 2)
+            self.assertEqual(player.royal_data.type_id, 3)
+
+        self.assertEqual(parse.call_count, 1)
+
+    def test_player_explicit_sub_objects(self):
+        player = Player(None, None, "id", None, None, "name")
+
+        self.assertIsNone(player.trophies)
+        self.assertIsNone(player.zone)
+        self.assertIsNone(player.m3v3_data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from aioresponses import aioresponses
+
+from tests.helpers import CacheTestCase
+from trackmania import InvalidIDError
+from trackmania.matchmaking import PlayerMatchmaking
+
+PAGE_URL = "https://trackmania.io/api/player/player-id/matches/2/{}"
+
+
+def _page(live_ids: list[str]) -> dict:
+    return {
+        "matches": [
+            {
+                "afterscore": 3000,
+                "leave": False,
+                "lid": live_id,
+                "mvp": False,
+                "startime": "2022-07-01T17:00:00Z",
+                "win": True,
+            }
+            for live_id in live_ids
+        ]
+    }
+
+
+class TestHistorySync(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.matchmaking = PlayerMatchmaking(
+            "3v3", 2, 0, 1000, 3000, 8, 2800, 3200, player_id="player-id"
+        )
+
+    def _sync(self) -> int:
+        return asyncio.get_event_loop().run_until_complete(
+            self.matchmaking.sync_history()
+        )
+
+    @aioresponses()
+    def test_sync_stops_at_the_first_known_match(self, mocked):
+        mocked.get(PAGE_URL.format(0), payload=_page(["m3", "m2"]))
+        mocked.get(PAGE_URL.format(1), payload=_page(["m1"]))
+        mocked.get(PAGE_URL.format(2), payload=_page([]))
+        self.assertEqual(self._sync(), 3)
+
+        # The new match pushes `m1` to the next page, which is never requested.
+        mocked.get(PAGE_URL.format(0), payload=_page(["m4", "m3"]))
+        requests = sum(map(len, mocked.requests.values()))
+
+        self.assertEqual(self._sync(), 1)
+        self.assertEqual(sum(map(len, mocked.requests.values())), requests + 1)
+        self.assertEqual(
+            [match.live_id for match in self.matchmaking.stored_history(chunk_size=3)],
+            ["m4", "m3", "m2", "m1"],
+        )
+
+    def test_history_is_read_in_chunks(self):
+        self.cache.rpush(
+            "matchmaking_results:player-id:2",
+            *(f'{{"lid": "m{index}"}}' for index in range(10)),
+        )
+
+        with mock.patch.object(self.cache, "lrange", wraps=self.cache.lrange) as lrange:
+            history = self.matchmaking.stored_history(chunk_size=4)
+            self.assertEqual(next(history).live_id, "m0")
+            self.assertEqual(lrange.call_count, 1)
+
+            self.assertEqual(len(list(history)), 9)
+            self.assertEqual(lrange.call_count, 3)
+
+    def test_player_id_is_required(self):
+        self.matchmaking.player_id = None
+
+        with self.assertRaises(InvalidIDError):
+            next(self.matchmaking.stored_history())
@@ -0,0 +1,129 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from aioresponses import aioresponses
+
+from tests.helpers import CacheTestCase
+from trackmania import Client
+from trackmania._names import _NAME_INDEX
+from trackmania.player import Player
+from trackmania.tmmap import Leaderboard
+
+
+def _position(player_id: str, name: str) -> dict:
+    return {
+        "player": {"id": player_id, "name": name},
+        "position": 1,
+        "time": 45000,
+        "url": f"/api/download/ghost/{player_id}",
+        "timestamp": "2022-07-01T10:00:00+00:00",
+    }
+
+
+class TestNameIndex(CacheTestCase):
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    @aioresponses()
+    def test_parsed_names_need_no_requests(self, mocked):
+        Leaderboard._from_dict(_position("id-one", "$f00Player$zOne"))
+
+        self.assertEqual(self._run(Player.get_id("playerone")), "id-one")
+        self.assertEqual(self._run(Player.get_username("id-one")), "PlayerOne")
+        self.assertEqual(sum(map(len, mocked.requests.values())), 0)
+
+    def test_renames_replace_the_old_name(self):
+        Leaderboard._from_dict(_position("id-one", "OldName"))
+        Leaderboard._from_dict(_position("id-one", "NewName"))
+
+        self.assertIsNone(_NAME_INDEX.get_id("OldName"))
+        self.assertEqual(_NAME_INDEX.get_id("newname"), "id-one")
+
+    def test_least_recently_used_pairs_are_evicted(self):
+        with mock.patch.object(Client, "NAME_INDEX_SIZE", 2):
+            _NAME_INDEX.add("id-one", "One")
+            _NAME_INDEX.add("id-two", "Two")
+            _NAME_INDEX.get_name("id-one")
+            _NAME_INDEX.add("id-three", "Three")
+
+        self.assertEqual(len(_NAME_INDEX), 2)
+        self.assertIsNone(_NAME_INDEX.get_name("id-two"))
+        self.assertIsNone(_NAME_INDEX.get_id("two"))
+        self.assertEqual(_NAME_INDEX.get_name("id-one"), "One")
+
+    def test_pairs_are_only_buffered_when_added(self):
+        _NAME_INDEX.add("id-one", "One")
+
+        self.assertIsNone(self.cache.get("player_username:id-one"))
+
+        _NAME_INDEX.flush()
+
+        self.assertEqual(self.cache.get("player_id:one"), b"id-one")
+        self.assertEqual(self.cache.get("player_username:id-one"), b"One")
+
+    def test_pairs_are_flushed_off_the_loop_once_the_batch_is_full(self):
+        async def add_page():
+            loop = asyncio.get_running_loop()
+            run_in_executor = loop.run_in_executor
+            writes = []
+
+            def record_write(executor, func, *args):
+                writes.append(run_in_executor(executor, func, *args))
+                return writes[-1]
+
+            with mock.patch.object(loop, "run_in_executor", record_write):
+                with mock.patch.object(Client, "NAME_INDEX_FLUSH_SIZE", 2):
+                    _NAME_INDEX.add("id-one", "One")
+                    self.assertEqual(writes, [])
+
+                    _NAME_INDEX.add("id-two", "Two")
+                    self.assertEqual(len(writes), 1)
+                    await writes[0]
+
+        self._run(add_page())
+
+        self.assertEqual(self.cache.get("player_id:one"), b"id-one")
+        self.assertEqual(self.cache.get("player_username:id-two"), b"Two")
+
+    def test_search_ranks_exact_then_prefix_matches(self):
+        for player_id, name in [
+            ("id-one", "Wirtual"),
+            ("id-two", "WirtualFan"),
+            ("id-three", "Scrapie"),
+            ("id-four", "wirt"),
+        ]:
+            _NAME_INDEX.add(player_id, name)
+
+        results = _NAME_INDEX.search("wirt")
+
+        self.assertEqual(
+            [player_id for player_id, _, _ in results], ["id-four", "id-one", "id-two"]
+        )
+        self.assertEqual(results[0][2], 1.0)
+        self.assertEqual(_NAME_INDEX.search("wirtuall")[0][0], "id-one")
+
+    @aioresponses()
+    def test_autocomplete_is_answered_locally(self, mocked):
+        _NAME_INDEX.add("id-one", "Wirtual")
+
+        players = self._run(Player.autocomplete("wirtu"))
+
+        self.assertEqual([player.player_id for player in players], ["id-one"])
+        self.assertEqual(sum(map(len, mocked.requests.values())), 0)
+
+    @aioresponses()
+    def test_autocomplete_falls_back_to_remote_search(self, mocked):
+        _NAME_INDEX.add("id-one", "Scrapie")
+        mocked.get(
+            "https://trackmania.io/api/players/find?search=wirt",
+            payload=[
+                {"player": {"id": "id-two", "name": "Wirtual"}, "matchmaking": []}
+            ],
+        )
+
+        players = self._run(Player.autocomplete("wirt"))
+        self.assertEqual([player.player_id for player in players], ["id-two"])
+
+        self._run(Player.autocomplete("wirt"))
+        self.assertEqual(sum(map(len, mocked.requests.values())), 1)
@@ -5,14 +5,14 @@ import unittest
 
 from aioresponses import aioresponses
 
+from tests.helpers import CacheTestCase
 from trackmania import Client
 from trackmania.player import Player
 
 
-class TestPlayerManager(unittest.TestCase):
+class TestPlayerManager(CacheTestCase):
     @aioresponses()
     def test_get(self, mocked):
-        Client.USER_AGENT = "NottCurious#4351 | py-trackmania.io Testing Suite"
         with open("./tests/data/player_get.json", "r", encoding="UTF-8") as file:
             mocked.get(
                 "https://trackmania.io/api/player/b73fe3d7-a92a-4a6d-ab9d-49005caec499",
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest import mock
+
+from aioresponses import aioresponses
+
+from tests.helpers import CacheTestCase
+from trackmania.errors import TMIOException
+from trackmania.tmmap import TMMap
+
+LEADERBOARD_URL = "https://trackmania.io/api/leaderboard/map/{}?offset={}&length=100"
+
+
+def _page(map_uid: str, offset: int, size: int = 100) -> dict:
+    return {
+        "tops": [
+            {
+                "player": {"id": f"player-{position}", "name": f"Player{position}"},
+                "position": position,
+                "time": 40000 + position * 10,
+                "url": f"/api/download/ghost/{map_uid}-{position}",
+                "timestamp": "2022-07-01T10:00:00+00:00",
+            }
+            for position in range(offset + 1, offset + size + 1)
+        ]
+    }
+
+
+class TestPlayerRecords(CacheTestCase):
+    def _records(self, player_id, map_uids, max_depth=1000, return_exceptions=False):
+        return asyncio.get_event_loop().run_until_complete(
+            TMMap.get_player_records(player_id, map_uids, max_depth, return_exceptions)
+        )
+
+    def _mock_pages(self, mocked):
+        mocked.get(LEADERBOARD_URL.format("deep", 0), payload=_page("deep", 0))
+        mocked.get(LEADERBOARD_URL.format("deep", 100), payload=_page("deep", 100))
+        mocked.get(LEADERBOARD_URL.format("short", 0), payload=_page("short", 0, 20))
+
+    @aioresponses()
+    def test_searches_only_as_deep_as_needed(self, mocked):
+        self._mock_pages(mocked)
+
+        records = self._records("player-150", ["deep", "short"])
+
+        self.assertEqual(list(records), ["deep", "short"])
+        self.assertEqual(records["deep"].position, 150)
+        self.assertEqual(records["deep"].time, 41500)
+        self.assertIsNone(records["short"])
+        self.assertEqual(sum(map(len, mocked.requests.values())), 3)
+
+    @aioresponses()
+    def test_indexed_players_need_no_requests(self, mocked):
+        self._mock_pages(mocked)
+        self._records("player-150", ["deep", "short"])
+        mocked.requests.clear()
+
+        records = self._records("player-7", ["short", "deep"])
+
+        self.assertEqual(mocked.requests, {})
+        self.assertEqual(records["short"].position, 7)
+        self.assertEqual(records["deep"].position, 7)
+
+    @aioresponses()
+    def test_max_depth_limits_the_search(self, mocked):
+        self._mock_pages(mocked)
+
+        records = self._records("player-150", ["deep"], max_depth=100)
+
+        self.assertIsNone(records["deep"])
+        self.assertEqual(sum(map(len, mocked.requests.values())), 1)
+
+    @aioresponses()
+    def test_failed_page_is_reported_and_keeps_progress(self, mocked):
+        mocked.get(LEADERBOARD_URL.format("deep", 0), payload=_page("deep", 0))
+        mocked.get(LEADERBOARD_URL.format("deep", 100), payload={"error": "Timed out"})
+        mocked.get(LEADERBOARD_URL.format("short", 0), payload=_page("short", 0, 20))
+
+        with self.assertRaises(TMIOException):
+            self._records("player-150", ["deep", "short"])
+        mocked.get(LEADERBOARD_URL.format("deep", 100), payload={"error": "Timed out"})
+        records = self._records("player-150", ["deep", "short"], return_exceptions=True)
+
+        self.assertIsInstance(records["deep"], TMIOException)
+        self.assertIsNone(records["short"])
+        # The first page of "deep" was kept and is not requested again.
+        self.assertEqual(sum(map(len, mocked.requests.values())), 4)
+
+    @aioresponses()
+    def test_extended_index_keeps_its_expiry(self, mocked):
+        self._mock_pages(mocked)
+        created_at = time.time()
+        with mock.patch("trackmania.tmmap.time.time", return_value=created_at):
+            self._records("player-50", ["deep"])
+        with mock.patch("trackmania.tmmap.time.time", return_value=created_at + 1800):
+            self._records("player-150", ["deep"])
+            ttl = self.cache.ttl("leaderboard_index:deep")
+
+        self.assertEqual(
+            json.loads(self.cache.get("leaderboard_index:deep"))["depth"], 200
+        )
+        self.assertLessEqual(ttl, 1800)
+
+    @aioresponses()
+    def test_expired_index_is_rebuilt(self, mocked):
+        self._mock_pages(mocked)
+        created_at = time.time()
+        with mock.patch("trackmania.tmmap.time.time", return_value=created_at):
+            self._records("player-50", ["deep"])
+        # Outlives its expiry in cache, as if it had been written without one.
+        self.cache.persist("leaderboard_index:deep")
+        with mock.patch("trackmania.tmmap.time.time", return_value=created_at + 3600):
+            self._records("player-50", ["deep"])
+
+        index = json.loads(self.cache.get("leaderboard_index:deep"))
+        self.assertEqual(index["created_at"], created_at + 3600)
+        self.assertEqual(index["depth"], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,336 @@
+import asyncio
+import json
+import re
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from aioresponses import aioresponses
+
+from tests.helpers import CacheTestCase
+from trackmania import Client
+from trackmania.constants import _TMX
+from trackmania.errors import TMXException
+from trackmania.tmx import _RANDOM_MAP_POOL, TMXCatalogue, TMXMap
+
+MULTI_URL = re.compile(r"^https://trackmania\.exchange/api/maps/get_map_info/multi/")
+SEARCH_URL = re.compile(r"^https://trackmania\.exchange/mapsearch2/search\?")
+RANDOM_URL = "https://trackmania.exchange/mapsearch2/search?api=on&random=1&format=json"
+
+
+class TestGetMaps(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        with open("./tests/data/tmx_maps.json", "r", encoding="UTF-8") as file:
+            self.payload = json.load(file)
+
+    def _get_maps(self, tmx_ids):
+        loop = asyncio.get_event_loop()
+        return loop.run_until_complete(TMXMap.get_maps(tmx_ids))
+
+    @aioresponses()
+    def test_keeps_input_order_and_reports_invalid_ids(self, mocked):
+        mocked.get(MULTI_URL, payload=self.payload)
+
+        maps = self._get_maps([80003, 1, 80001, 80002])
+
+        self.assertEqual(sum(map(len, mocked.requests.values())), 1)
+        self.assertEqual(maps[0].track_id, 80003)
+        self.assertIsNone(maps[1])
+        self.assertEqual([m.track_id for m in maps[2:]], [80001, 80002])
+        self.assertEqual(maps[0].map_name, "Third")
+
+    @aioresponses()
+    def test_only_missing_ids_are_requested(self, mocked):
+        self.cache.set("tmx_map:80001", json.dumps(self.payload[0]))
+        mocked.get(MULTI_URL, payload=self.payload[1:])
+
+        maps = self._get_maps([80001, 80002, 80003])
+
+        ((_, url),) = mocked.requests.keys()
+        self.assertTrue(str(url).endswith("/multi/80002,80003"))
+        self.assertEqual([m.track_id for m in maps], [80001, 80002, 80003])
+        self.assertEqual(json.loads(self.cache.get("tmx_map:80003")), self.payload[2])
+
+    @aioresponses()
+    def test_warm_cache_makes_no_requests(self, mocked):
+        for map_data in self.payload:
+            self.cache.set(f"tmx_map:{map_data['TrackID']}", json.dumps(map_data))
+
+        maps = self._get_maps([80002, 80001])
+
+        self.assertEqual(mocked.requests, {})
+        self.assertEqual([m.track_id for m in maps], [80002, 80001])
+
+    @aioresponses()
+    def test_requests_are_chunked(self, mocked):
+        mocked.get(MULTI_URL, payload=[], repeat=True)
+
+        maps = self._get_maps(range(1, _TMX.MULTI_LIMIT * 2 + 2))
+
+        self.assertEqual(sum(map(len, mocked.requests.values())), 3)
+        self.assertEqual(maps, [None] * (_TMX.MULTI_LIMIT * 2 + 1))
+
+    @aioresponses()
+    def test_failed_chunk_raises_and_keeps_other_chunks(self, mocked):
+        mocked.get(MULTI_URL, status=500, body="Internal Server Error")
+        mocked.get(MULTI_URL, payload=self.payload)
+        tmx_ids = list(range(1, _TMX.MULTI_LIMIT + 1)) + [80001, 80002, 80003]
+
+        with self.assertRaises(TMXException):
+            self._get_maps(tmx_ids)
+
+        self.assertEqual(sum(map(len, mocked.requests.values())), 2)
+        self.assertIsNotNone(self.cache.get("tmx_map:80002"))
+
+
+class TestSearch(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        with open("./tests/data/tmx_maps.json", "r", encoding="UTF-8") as file:
+            self.payload = json.load(file)
+
+    def _search(self, **kwargs):
+        async def collect():
+            return [tmx_map async for tmx_map in TMXMap.search(**kwargs)]
+
+        return asyncio.get_event_loop().run_until_complete(collect())
+
+    @staticmethod
+    def _requested_params(mocked):
+        return [
+            dict(url.query)
+            for (_, url), calls in mocked.requests.items()
+            for _ in calls
+        ]
+
+    @aioresponses()
+    def test_pages_until_total_is_reached(self, mocked):
+        mocked.get(
+            SEARCH_URL,
+            payload={"results": self.payload[:2], "totalItemCount": 3},
+        )
+        mocked.get(
+            SEARCH_URL,
+            payload={"results": self.payload[2:], "totalItemCount": 3},
+        )
+
+        maps = self._search(author="MapperOne", tags=["tech", 7], page_size=2)
+
+        self.assertEqual([m.track_id for m in maps], [80001, 80002, 80003])
+        params = self._requested_params(mocked)
+        self.assertEqual(sorted(p["page"] for p in params), ["1", "2"])
+        self.assertEqual(params[0]["author"], "MapperOne")
+        self.assertEqual(params[0]["tags"], "3,7")
+        self.assertEqual(params[0]["limit"], "2")
+        self.assertIsNotNone(self.cache.get("tmx_map:80003"))
+
+    @aioresponses()
+    def test_limit_stops_without_fetching_more(self, mocked):
+        mocked.get(
+            SEARCH_URL,
+            payload={"results": self.payload[:2], "totalItemCount": 100},
+        )
+
+        maps = self._search(difficulty="Expert", length="1 min", page_size=2, limit=2)
+
+        self.assertEqual(len(maps), 2)
+        params = self._requested_params(mocked)
+        self.assertEqual(len(params), 1)
+        self.assertEqual(params[0]["difficulty"], "3")
+        self.assertEqual(params[0]["length"], "4")
+
+    def test_unknown_tag_raises(self):
+        with self.assertRaises(ValueError):
+            self._search(tags=["Not A Tag"])
+
+
+class TestRandomMapPool(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.multiple(
+            Client,
+            TMX_RANDOM_POOL_LOW=1,
+            TMX_RANDOM_POOL_HIGH=3,
+            TMX_RANDOM_POOL_DELAY=0,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(_RANDOM_MAP_POOL.clear)
+
+        with open("./tests/data/tmx_maps.json", "r", encoding="UTF-8") as file:
+            self.payload = json.load(file)
+
+    def _random_maps(self, count):
+        async def take():
+            maps = [await TMXMap.get_random_map() for _ in range(count)]
+            if _RANDOM_MAP_POOL._refill_task is not None:
+                await _RANDOM_MAP_POOL._refill_task
+            return maps
+
+        return asyncio.get_event_loop().run_until_complete(take())
+
+    @aioresponses()
+    def test_empty_pool_fetches_directly_and_refills(self, mocked):
+        mocked.get(RANDOM_URL, payload={"results": [self.payload[0]]}, repeat=True)
+
+        maps = self._random_maps(1)
+
+        self.assertEqual(maps[0].track_id, 80001)
+        self.assertEqual(len(_RANDOM_MAP_POOL), 3)
+        self.assertEqual(sum(map(len, mocked.requests.values())), 4)
+        self.assertIsNotNone(self.cache.get("tmx_map:80001"))
+
+    @aioresponses()
+    def test_full_pool_serves_without_requests(self, mocked):
+        mocked.get(RANDOM_URL, payload={"results": [self.payload[1]]}, repeat=True)
+        self._random_maps(1)
+        mocked.requests.clear()
+
+        maps = self._random_maps(1)
+
+        self.assertEqual(maps[0].track_id, 80002)
+        self.assertEqual(mocked.requests, {})
+        self.assertEqual(len(_RANDOM_MAP_POOL), 2)
+
+    @aioresponses()
+    def test_failed_refill_keeps_pool_usable(self, mocked):
+        mocked.get(RANDOM_URL, payload={"results": [self.payload[2]]})
+        mocked.get(RANDOM_URL, payload={"results": []})
+
+        maps = self._random_maps(1)
+
+        self.assertEqual(maps[0].track_id, 80003)
+        self.assertEqual(len(_RANDOM_MAP_POOL), 0)
+
+
+class TestCatalogue(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        with open("./tests/data/tmx_maps.json", "r", encoding="UTF-8") as file:
+            payload = json.load(file)
+
+        variations = [
+            ("3,7", 45000, 10, "2022-06-01T10:00:00", "MapperOne"),
+            ("3", 75000, 2, "2022-06-03T10:00:00", "MapperOne"),
+            ("1,3", 30000, 25, "2022-06-02T10:00:00", "MapperTwo"),
+        ]
+        self.maps = []
+        for map_data, (tags, author_time, awards, uploaded, username) in zip(
+            payload, variations
+        ):
+            self.maps.append(
+                {
+                    **map_data,
+                    "Tags": tags,
+                    "AuthorTime": author_time,
+                    "AwardCount": awards,
+                    "UploadedAt": uploaded,
+                    "Username": username,
+                }
+            )
+
+    def _catalogue(self):
+        catalogue = TMXCatalogue()
+        for map_data in self.maps:
+            catalogue.add(map_data)
+        return catalogue
+
+    @staticmethod
+    def _ids(maps):
+        return [tmx_map.track_id for tmx_map in maps]
+
+    def test_tag_author_and_time_filters(self):
+        catalogue = self._catalogue()
+
+        maps = catalogue.query(tags=["Tech"], author="mapperone", max_author_time=60000)
+
+        self.assertEqual(self._ids(maps), [80001])
+        self.assertEqual(
+            self._ids(catalogue.query(tags=[3], exclude_tags=["SpeedTech"])),
+            [80003, 80002],
+        )
+
+    def test_sorting_and_limit(self):
+        catalogue = self._catalogue()
+
+        self.assertEqual(
+            self._ids(catalogue.query(sort_by="award_count", reverse=True)),
+            [80003, 80001, 80002],
+        )
+        self.assertEqual(
+            self._ids(catalogue.query(sort_by="author_time", limit=2)),
+            [80003, 80001],
+        )
+        self.assertEqual(
+            self._ids(
+                catalogue.query(uploaded_after=datetime(2022, 6, 2), sort_by="uploaded")
+            ),
+            [80003, 80002],
+        )
+
+    def test_replacing_a_map_updates_indexes(self):
+        catalogue = self._catalogue()
+
+        self.assertFalse(catalogue.add({**self.maps[0], "AwardCount": 100}))
+
+        self.assertEqual(len(catalogue), 3)
+        self.assertEqual(self._ids(catalogue.query(min_awards=50)), [80001])
+
+    def test_from_cache(self):
+        for map_data in self.maps:
+            self.cache.set(f"tmx_map:{map_data['TrackID']}", json.dumps(map_data))
+        self.cache.set("map:not-tmx", json.dumps({"TrackID": 1}))
+
+        catalogue = TMXCatalogue.from_cache()
+
+        self.assertEqual(len(catalogue), 3)
+        self.assertIn(80002, catalogue)
+
+    @aioresponses()
+    def test_incremental_refresh_stops_at_known_maps(self, mocked):
+        catalogue = TMXCatalogue()
+        catalogue.add(self.maps[2])
+        newer = {**self.maps[0], "TrackID": 90001, "UploadedAt": "2022-07-01T10:00:00"}
+        mocked.get(
+            SEARCH_URL,
+            payload={"results": [newer, self.maps[0]], "totalItemCount": 10},
+        )
+
+        added = asyncio.get_event_loop().run_until_complete(
+            catalogue.refresh(page_size=2)
+        )
+
+        self.assertEqual(added, 2)
+        self.assertEqual(sum(map(len, mocked.requests.values())), 1)
+        self.assertIn(90001, catalogue)
+
+    @aioresponses()
+    def test_filtered_refresh_tracks_its_own_newest_map(self, mocked):
+        catalogue = TMXCatalogue()
+        catalogue.add(self.maps[1])
+        older = {**self.maps[2], "TrackID": 90002, "UploadedAt": "2022-06-02T12:00:00"}
+        newer = {**self.maps[2], "TrackID": 90003, "UploadedAt": "2022-07-01T10:00:00"}
+        mocked.get(
+            SEARCH_URL, payload={"results": [older, self.maps[2]], "totalItemCount": 2}
+        )
+        mocked.get(
+            SEARCH_URL, payload={"results": [newer, self.maps[2]], "totalItemCount": 10}
+        )
+        loop = asyncio.get_event_loop()
+
+        # Both maps are older than the newest map of the catalogue, but new to this author.
+        first = loop.run_until_complete(
+            catalogue.refresh(author="MapperTwo", page_size=2)
+        )
+        second = loop.run_until_complete(
+            catalogue.refresh(author="MapperTwo", page_size=2)
+        )
+
+        self.assertEqual((first, second), (2, 1))
+        self.assertEqual(sum(map(len, mocked.requests.values())), 2)
+        self.assertEqual(len(catalogue), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import unittest
+
+from aioresponses import aioresponses
+
+from tests.helpers import CacheTestCase
+from trackmania.trophy import PlayerTrophies
+
+TOP_TROPHIES_URL = "https://trackmania.io/api/top/trophies/0"
+
+
+class TestTopTrophies(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        with open("./tests/data/top_trophies.json", "r", encoding="UTF-8") as file:
+            self.payload = json.load(file)
+
+    def _top_trophies(self):
+        loop = asyncio.get_event_loop()
+        return loop.run_until_complete(PlayerTrophies.top_trophies(0))
+
+    @aioresponses()
+    def test_cold_cache_fetches_and_caches(self, mocked):
+        mocked.get(TOP_TROPHIES_URL, payload=self.payload)
+
+        players = self._top_trophies()
+
+        self.assertEqual(sum(map(len, mocked.requests.values())), 1)
+        self.assertEqual([player.rank for player in players], [1, 2, 3])
+        self.assertEqual(players[2].club_tag, "W1SP")
+        self.assertEqual(players[2].score, "3,290,258")
+        self.assertEqual(json.loads(self.cache.get("top_trophies:0")), self.payload)
+
+    @aioresponses()
+    def test_warm_cache_makes_no_requests(self, mocked):
+        self.cache.set("top_trophies:0", json.dumps(self.payload))
+
+        players = self._top_trophies()
+
+        self.assertEqual(mocked.requests, {})
+        self.assertEqual(
+            [player.player_name for player in players],
+            ["PlayerOne", "PlayerTwo", "NottCurious"],
+        )
+
+    @aioresponses()
+    def test_second_call_is_served_from_cache(self, mocked):
+        mocked.get(TOP_TROPHIES_URL, payload=self.payload)
+
+        first = self._top_trophies()
+        second = self._top_trophies()
+
+        self.assertEqual(sum(map(len, mocked.requests.values())), 1)
+        self.assertEqual(
+            [player.player_id for player in first],
+            [player.player_id for player in second],
+        )
+
+
+class TestLocateByScore(CacheTestCase):
+    PAGES = 20
+    PAGE_SIZE = 5
+
+    def _page(self, page: int) -> dict:
+        if page >= self.PAGES:
+            return {"ranks": []}
+
+        ranks = []
+        for rank in range(page * self.PAGE_SIZE + 1, (page + 1) * self.PAGE_SIZE + 1):
+            ranks.append(
+                {
+                    "player": {"name": f"Player{rank}", "id": f"player-{rank}"},
+                    "rank": rank,
+                    # Scores drop by 10 per rank, from 1000 at rank 1.
+                    "score": 1010 - rank * 10,
+                }
+            )
+        return {"ranks": ranks}
+
+    def _mock_pages(self, mocked):
+        for page in range(self.PAGES * 2):
+            mocked.get(
+                f"https://trackmania.io/api/top/trophies/{page}",
+                payload=self._page(page),
+                repeat=True,
+            )
+
+    def _locate(self, score: int):
+        loop = asyncio.get_event_loop()
+        return loop.run_until_complete(PlayerTrophies.locate_by_score(score))
+
+    @aioresponses()
+    def test_finds_page_and_rank_in_log_requests(self, mocked):
+        self._mock_pages(mocked)
+
+        # Rank 63 has 380, so 375 lands on rank 64 on page 12.
+        self.assertEqual(self._locate(375), (12, 64))
+        self.assertLessEqual(sum(map(len, mocked.requests.values())), 10)
+
+    @aioresponses()
+    def test_exact_scores_and_ends_of_the_leaderboard(self, mocked):
+        self._mock_pages(mocked)
+
+        self.assertEqual(self._locate(380), (12, 63))
+        self.assertEqual(self._locate(5000), (0, 1))
+        self.assertIsNone(self._locate(-100))
+
+    @aioresponses()
+    def test_cached_bounds_need_no_requests(self, mocked):
+        self._mock_pages(mocked)
+        self._locate(375)
+        requests = sum(map(len, mocked.requests.values()))
+
+        self.assertEqual(self._locate(375), (12, 64))
+        self.assertEqual(sum(map(len, mocked.requests.values())), requests)
+        self.assertEqual(
+            json.loads(self.cache.get("top_trophies_bounds:12")), [400, 360]
+        )
+
+    @aioresponses()
+    def test_page_bounds_expire_on_their_own(self, mocked):
+        self._mock_pages(mocked)
+        self._locate(375)
+        self.cache.expire("top_trophies_bounds:0", 10)
+
+        # Requests pages that were not seen yet, the bounds of page 0 keep their own expiry.
+        self._locate(15)
+
+        self.assertLessEqual(self.cache.ttl("top_trophies_bounds:0"), 10)
+        self.assertGreater(self.cache.ttl("top_trophies_bounds:18"), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import logging
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from trackmania._util import (
+    _DATETIME_SHAPES,
+    _frmt_str_to_datetime,
+    _regex_it,
+    _strip_formatting,
+)
+
+
+class TestRegexIt(unittest.TestCase):
+    def test_strips_formatting(self):
+        self.assertEqual(_regex_it("$F63W$F971$FCBS$FFFP"), "W1SP")
+        self.assertEqual(_regex_it("$o$i$sBold$z Name"), "Bold Name")
+        self.assertEqual(_regex_it("$l[https://trackmania.io]Link$l"), "Link")
+
+    def test_plain_text_skips_regex(self):
+        _strip_formatting.cache_clear()
+        self.assertEqual(_regex_it("NottCurious"), "NottCurious")
+        self.assertEqual(_strip_formatting.cache_info().currsize, 0)
+
+    def test_none(self):
+        self.assertIsNone(_regex_it(None))
+
+    def test_repeated_strings_are_memoized(self):
+        _strip_formatting.cache_clear()
+        for _ in range(3):
+            _regex_it("$F00Red")
+        self.assertEqual(_strip_formatting.cache_info().hits, 2)
+
+
+class TestFrmtStrToDatetime(unittest.TestCase):
+    def test_formats(self):
+        expected = {
+            "2021-02-12T11:04:02Z": datetime(2021, 2, 12, 11, 4, 2),
+            "2021-02-12T11:04:02+00:00": datetime(2021, 2, 12, 11, 4, 2),
+            "2022-03-15T18:18:50.007": datetime(2022, 3, 15, 18, 18, 50, 7000),
+            "2022-03-15T18:18:50": datetime(2022, 3, 15, 18, 18, 50),
+            "2022-03-31_10_56": datetime(2022, 3, 31, 10, 56),
+        }
+        # Twice, so the second round goes through the cached shapes.
+        for _ in range(2):
+            for date_string, date in expected.items():
+                self.assertEqual(_frmt_str_to_datetime(date_string), date)
+
+    def test_shape_is_cached(self):
+        _DATETIME_SHAPES.clear()
+        _frmt_str_to_datetime("2022-03-31_10_56")
+        self.assertEqual(_DATETIME_SHAPES[(16, "_", "")], "%Y-%m-%d_%H_%M")
+
+    def test_rejects_unknown_formats(self):
+        for _ in range(2):
+            self.assertIsNone(_frmt_str_to_datetime("2021-02-12T11:04:02+01:00"))
+            self.assertIsNone(_frmt_str_to_datetime("not a date"))
+        self.assertIsNone(_frmt_str_to_datetime(None))
+
+    def test_no_debug_logging_when_disabled(self):
+        _DATETIME_SHAPES.clear()
+        logger = logging.getLogger("trackmania._util")
+        logger.setLevel(logging.INFO)
+        try:
+            with mock.patch.object(logger, "debug") as debug:
+                _frmt_str_to_datetime("2022-03-31_10_56")
+            debug.assert_not_called()
+        finally:
+            logger.setLevel(logging.NOTSET)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import json
+import unittest
+from unittest import mock
+
+from tests.helpers import CacheTestCase
+from trackmania.player import Player, PlayerZone, ZoneNode
+from trackmania.trophy import TrophyLeaderboardPlayer
+from trackmania.zones import ZoneLeaderboard
+
+
+class TestZoneTree(unittest.TestCase):
+    def setUp(self):
+        with open("./tests/data/top_trophies.json", "r", encoding="UTF-8") as file:
+            self.ranks = json.load(file)["ranks"]
+
+    def test_players_share_zone_nodes(self):
+        first, second = (
+            TrophyLeaderboardPlayer._from_dict(rank) for rank in self.ranks[:2]
+        )
+
+        self.assertIs(first.zones[-1], second.zones[-1])
+        self.assertIs(
+            first.zones[-1].node, ZoneNode._from_dict({"name": "World", "flag": "WOR"})
+        )
+        self.assertEqual([zone.zone for zone in first.zones][-1], "World")
+        self.assertIsNone(first.zones[0].rank)
+
+    def test_warm_pages_create_no_zone_objects(self):
+        for rank in self.ranks:
+            TrophyLeaderboardPlayer._from_dict(rank)
+
+        with mock.patch.object(
+            ZoneNode, "__init__", side_effect=AssertionError
+        ), mock.patch.object(PlayerZone, "__init__", side_effect=AssertionError):
+            for _ in range(100):
+                for rank in self.ranks:
+                    TrophyLeaderboardPlayer._from_dict(rank)
+
+    def test_shared_unranked_zones_cannot_be_changed(self):
+        zone = TrophyLeaderboardPlayer._from_dict(self.ranks[0]).zones[-1]
+
+        with self.assertRaises(AttributeError):
+            zone.rank = 1
+        self.assertIsNone(zone.rank)
+
+    def test_zones_can_still_be_built_by_hand(self):
+        zone = PlayerZone("WOR", "World", 3)
+        zone.rank = 2
+
+        self.assertEqual((zone.flag, zone.zone, zone.rank), ("WOR", "World", 2))
+        self.assertIsNone(zone.node)
+
+    def test_ranked_zones_keep_their_ranks(self):
+        with open("./tests/data/player_get.json", "r", encoding="UTF-8") as file:
+            player_data = json.load(file)
+
+        zones = Player._parse_zone(player_data)
+
+        self.assertEqual(
+            [zone.rank for zone in zones],
+            player_data["trophies"]["zonepositions"][: len(zones)],
+        )
+        self.assertIs(
+            zones[0].node, ZoneNode._from_dict(player_data["trophies"]["zone"])
+        )
+        self.assertEqual(
+            PlayerZone.to_string(zones[-1:], inline=True), f"World - {zones[-1].rank}"
+        )
+        self.assertEqual(
+            PlayerZone.to_string([zones[-1].node._unranked], inline=True), "World"
+        )
+
+
+def _zone(*names: str) -> dict:
+    zone = None
+    for name in names:
+        zone = {
+            "name": name,
+            "flag": name[:3].upper(),
+            **({"parent": zone} if zone else {}),
+        }
+    return zone
+
+
+def _rank(rank: int, player_id: str, *zones: str) -> dict:
+    return {
+        "player": {"name": player_id, "id": player_id, "zone": _zone(*zones)},
+        "rank": rank,
+        "score": 1000 - rank,
+    }
+
+
+class TestZoneLeaderboard(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.pages = [
+            {
+                "ranks": [
+                    _rank(1, "fr-idf", "World", "Europe", "France", "Ile-de-France"),
+                    _rank(2, "nl", "World", "Europe", "Netherlands"),
+                    _rank(3, "fr-bre", "World", "Europe", "France", "Bretagne"),
+                ]
+            },
+            {
+                "ranks": [
+                    _rank(4, "in", "World", "Asia", "India"),
+                    _rank(5, "fr-idf-2", "World", "Europe", "France", "Ile-de-France"),
+                ]
+            },
+        ]
+
+    def _leaderboard(self, pages) -> ZoneLeaderboard:
+        return ZoneLeaderboard(
+            TrophyLeaderboardPlayer._from_dict(rank)
+            for page in pages
+            for rank in page["ranks"]
+        )
+
+    def test_top_and_rank_within_zones(self):
+        leaderboard = self._leaderboard(self.pages)
+
+        self.assertEqual(
+            [row.player_id for row in leaderboard.top("france")],
+            ["fr-idf", "fr-bre", "fr-idf-2"],
+        )
+        self.assertEqual(leaderboard.rank("fr-idf-2"), 2)
+        self.assertEqual(leaderboard.rank("fr-idf-2", "France"), 3)
+        self.assertEqual(leaderboard.rank("fr-idf-2", "Europe"), 4)
+        self.assertIsNone(leaderboard.rank("fr-idf-2", "Asia"))
+        self.assertEqual(leaderboard.top("Atlantis"), [])
+
+    def test_new_pages_update_the_index(self):
+        leaderboard = self._leaderboard(self.pages[:1])
+        self.assertEqual(len(leaderboard), 3)
+
+        leaderboard.add(
+            TrophyLeaderboardPlayer._from_dict(rank)
+            for rank in [
+                *self.pages[1]["ranks"],
+                _rank(6, "fr-idf", "World", "Europe", "France", "Ile-de-France"),
+            ]
+        )
+
+        self.assertEqual(len(leaderboard), 5)
+        self.assertEqual(
+            [row.player_id for row in leaderboard.top("Ile-de-France")],
+            ["fr-idf-2", "fr-idf"],
+        )
+        self.assertEqual(leaderboard.rank("fr-idf", "World"), 5)
+
+    def test_built_from_cached_pages(self):
+        for page, data in enumerate(self.pages):
+            self.cache.set(f"top_trophies:{page}", json.dumps(data))
+
+        leaderboard = ZoneLeaderboard.trophies_from_cache()
+
+        self.assertEqual(len(leaderboard), 5)
+        self.assertEqual(leaderboard.rank("in", "World"), 4)
@@ -16,6 +16,7 @@ from .campaign import *
 from .club import *
 from .config import *
 from .cotd import *
+from .downloads import *
 from .errors import *
 from .matchmaking import *
 from .player import *
@@ -24,6 +25,7 @@ from .tmmap import *
 from .tmx import *
 from .totd import *
 from .trophy import *
+from .zones import *
 
 __title__ = "py-tmio"
 __author__ = "Deepesh Nimma"
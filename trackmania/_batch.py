@@ -0,0 +1,172 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from weakref import WeakKeyDictionary
+
+from .api import _APIClient
+from .config import Client, get_many_from_cache, set_many_in_cache
+
+_log = logging.getLogger(__name__)
+
+
+async def _get_many(
+    ids: list[Hashable],
+    cache_key: Callable[[Hashable], str],
+    fetch: Callable[[Hashable, _APIClient], Awaitable[dict]],
+    ex: int | None = None,
+    max_concurrent: int | None = None,
+    return_exceptions: bool = False,
+) -> list[dict | BaseException]:
+    """
+    .. versionadded :: 0.5
+
+    Gets the raw data of many objects. Every id is looked up in cache with one round trip, the
+    misses are fetched concurrently over one session, at most `max_concurrent` at a time, and
+    written back to cache with one round trip.
+
+    Parameters
+    ----------
+    ids : list[Hashable]
+        The ids of the objects, duplicates are only fetched once.
+    cache_key : Callable[[Hashable], str]
+        Builds the cache key of an id.
+    fetch : Callable[[Hashable, :class:`_APIClient`], Awaitable[dict]]
+        Fetches the raw data of an id with the given client, raising if it does not exist.
+    ex : int | None, optional
+        The expiration time of the cached data, by default None
+    max_concurrent : int | None, optional
+        The maximum number of concurrent fetches, by default :attr:`Client.MAX_CONCURRENT_REQUESTS`
+    return_exceptions : bool, optional
+        Whether a failed fetch returns its error in place instead of raising it, by default False
+
+    Returns
+    -------
+    list[dict | :class:`BaseException`]
+        The raw data in the same order as `ids`.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    cached = get_many_from_cache([cache_key(object_id) for object_id in unique_ids])
+    results = {
+        object_id: data
+        for object_id, data in zip(unique_ids, cached)
+        if isinstance(data, (dict, list))
+    }
+
+    missing = [object_id for object_id in unique_ids if object_id not in results]
+    if len(missing) != 0:
+        _log.debug(f"Fetching {len(missing)} of {len(unique_ids)} objects")
+        semaphore = asyncio.Semaphore(max_concurrent or Client.MAX_CONCURRENT_REQUESTS)
+
+        async def fetch_one(object_id: Hashable) -> dict:
+            async with semaphore:
+                return await fetch(object_id, api_client)
+
+        async with _APIClient() as api_client:
+            fetched = await asyncio.gather(
+                *(fetch_one(object_id) for object_id in missing),
+                return_exceptions=True,
+            )
+
+        set_many_in_cache(
+            {
+                cache_key(object_id): data
+                for object_id, data in zip(missing, fetched)
+                if not isinstance(data, BaseException)
+            },
+            ex=ex,
+        )
+        results.update(zip(missing, fetched))
+
+    ordered = [results[object_id] for object_id in ids]
+    if not return_exceptions:
+        for result in ordered:
+            if isinstance(result, BaseException):
+                raise result
+
+    return ordered
+
+
+class _DataLoader:
+    """
+    .. versionadded :: 0.5
+
+    Batches the loads of one kind of object.
+    Every load issued during the same event loop iteration is collected, de-duplicated and
+    resolved together by one :func:`_get_many` call, so gathering the related objects of a page
+    of results costs one cache round trip plus concurrent fetches of the misses.
+
+    Parameters
+    ----------
+    cache_key : Callable[[Hashable], str]
+        Builds the cache key of an id.
+    fetch : Callable[[Hashable, :class:`_APIClient`], Awaitable[dict]]
+        Fetches the raw data of an id with the given client, raising if it does not exist.
+    ex : int | None, optional
+        The expiration time of the cached data, by default None
+    """
+
+    def __init__(
+        self,
+        cache_key: Callable[[Hashable], str],
+        fetch: Callable[[Hashable, _APIClient], Awaitable[dict]],
+        ex: int | None = None,
+    ):
+        self._cache_key = cache_key
+        self._fetch = fetch
+        self._ex = ex
+        self._queues: WeakKeyDictionary = WeakKeyDictionary()
+
+    async def load(self, object_id: Hashable) -> dict:
+        """
+        Loads the raw data of an object, batched with the other loads of this iteration.
+
+        Parameters
+        ----------
+        object_id : Hashable
+            The id of the object.
+
+        Returns
+        -------
+        dict
+            The raw data.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._queues.get(loop)
+        if queue is None:
+            queue = self._queues[loop] = {}
+            loop.call_soon(self._dispatch, loop)
+
+        future = queue.get(object_id)
+        if future is None:
+            future = queue[object_id] = loop.create_future()
+
+        # Shielded so one cancelled caller does not cancel the load for the others.
+        return await asyncio.shield(future)
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        queue = self._queues.pop(loop)
+        loop.create_task(self._resolve(queue))
+
+    async def _resolve(self, queue: dict[Hashable, asyncio.Future]) -> None:
+        object_ids = list(queue)
+        _log.debug(f"Loading {len(object_ids)} batched objects")
+
+        try:
+            results = await _get_many(
+                object_ids,
+                self._cache_key,
+                self._fetch,
+                ex=self._ex,
+                return_exceptions=True,
+            )
+        except Exception as e:
+            results = [e] * len(object_ids)
+
+        for object_id, result in zip(object_ids, results):
+            future = queue[object_id]
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,257 @@
+import logging
+import mmap
+import os
+import struct
+from xml.etree import ElementTree
+
+from ._lzo import decompress
+from .errors import InvalidGbxFile
+
+_log = logging.getLogger(__name__)
+
+MAP_CLASS_IDS = (0x03043000, 0x24003000)
+
+MAP_INFO_CHUNK = 0x03043002
+MAP_XML_CHUNK = 0x03043005
+
+GHOST_CLASS_IDS = (0x03092000, 0x03093000)  # Ghosts and replays
+GHOST_RACE_TIME_CHUNK = 0x03092005
+GHOST_CHECKPOINTS_CHUNK = 0x0309200B
+
+_SKIPPABLE_CHUNK_MARKER = b"PIKS"
+
+_HEAVY_CHUNK_FLAG = 0x80000000
+
+
+class _GbxHeader:
+    """
+    .. versionadded :: 0.5
+
+    The header of a GBX file, with the raw data of every header chunk.
+
+    Parameters
+    ----------
+    version : int
+        The GBX format version.
+    class_id : int
+        The id of the class stored in the file.
+    chunks : dict[int, bytes]
+        The raw data of the header chunks by their chunk id.
+    body_compressed : bool
+        Whether the body of the file is compressed.
+    end : int
+        The offset of the first byte after the header.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        class_id: int,
+        chunks: dict[int, bytes],
+        body_compressed: bool = False,
+        end: int = 0,
+    ):
+        self.version = version
+        self.class_id = class_id
+        self.chunks = chunks
+        self.body_compressed = body_compressed
+        self.end = end
+
+    @property
+    def is_map(self) -> bool:
+        return self.class_id in MAP_CLASS_IDS
+
+
+def _parse_header(buffer: bytes | mmap.mmap) -> _GbxHeader:
+    try:
+        if buffer[:3] != b"GBX":
+            raise InvalidGbxFile("File does not start with the GBX magic")
+
+        (version,) = struct.unpack_from("<H", buffer, 3)
+        offset = 5
+        body_compressed = False
+        if version >= 3:
+            # Binary/text, reference table and body compression
+            body_compressed = buffer[offset + 2 : offset + 3] == b"C"
+            offset += 3
+        if version >= 4:
+            offset += 1
+
+        (class_id,) = struct.unpack_from("<I", buffer, offset)
+        offset += 4
+
+        chunks = {}
+        if version < 6:
+            return _GbxHeader(version, class_id, chunks, body_compressed, offset)
+
+        (user_data_size,) = struct.unpack_from("<I", buffer, offset)
+        offset += 4
+        end = offset + user_data_size
+        if user_data_size == 0:
+            return _GbxHeader(version, class_id, chunks, body_compressed, end)
+
+        (chunk_count,) = struct.unpack_from("<I", buffer, offset)
+        offset += 4
+
+        entries = struct.unpack_from(f"<{chunk_count * 2}I", buffer, offset)
+        offset += chunk_count * 8
+
+        for chunk_id, chunk_size in zip(entries[::2], entries[1::2]):
+            chunk_size &= ~_HEAVY_CHUNK_FLAG
+            if offset + chunk_size > len(buffer):
+                raise InvalidGbxFile(f"Header chunk {chunk_id:#010x} is truncated")
+            chunks[chunk_id] = bytes(buffer[offset : offset + chunk_size])
+            offset += chunk_size
+    except struct.error as e:
+        raise InvalidGbxFile("GBX header is truncated") from e
+
+    return _GbxHeader(version, class_id, chunks, body_compressed, end)
+
+
+def _read_header(path: str | os.PathLike) -> _GbxHeader:
+    """
+    .. versionadded :: 0.5
+
+    Reads the header of a GBX file. The file is memory mapped, so only the pages holding the
+    header are read from disk, never the (compressed) body.
+
+    Parameters
+    ----------
+    path : str | :class:`os.PathLike`
+        The path of the file.
+
+    Returns
+    -------
+    :class:`_GbxHeader`
+        The header.
+
+    Raises
+    ------
+    :class:`InvalidGbxFile`
+        If the file is not a GBX file.
+    """
+    _log.debug(f"Reading GBX header of {path}")
+
+    with open(path, "rb") as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            raise InvalidGbxFile(f"{path} is empty") from e
+
+        with buffer:
+            return _parse_header(buffer)
+
+
+def _read_map_header(path: str | os.PathLike) -> _GbxHeader:
+    header = _read_header(path)
+    if not header.is_map:
+        raise InvalidGbxFile(f"{path} is not a map, class id {header.class_id:#010x}")
+
+    return header
+
+
+def _parse_xml_chunk(data: bytes) -> ElementTree.Element:
+    try:
+        (length,) = struct.unpack_from("<I", data, 0)
+        return ElementTree.fromstring(data[4 : 4 + length].decode("utf-8"))
+    except (struct.error, UnicodeDecodeError, ElementTree.ParseError) as e:
+        raise InvalidGbxFile("Map XML header chunk is invalid") from e
+
+
+def _xml_attributes(xml: ElementTree.Element, tag: str) -> dict:
+    element = xml if xml.tag == tag else xml.find(tag)
+    return dict(element.attrib) if element is not None else {}
+
+
+def _int_or_none(value: str | None) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_medal_chunk(data: bytes) -> tuple[int, int, int, int] | None:
+    # Versions before 3 start with a map identifier that needs the lookback string table.
+    if len(data) < 21 or data[0] < 3:
+        return None
+
+    return struct.unpack_from("<4i", data, 5)
+
+
+def _read_body(path: str | os.PathLike) -> tuple[_GbxHeader, bytes]:
+    """
+    .. versionadded :: 0.5
+
+    Reads and decompresses the body of a GBX file without an external reference table.
+
+    Parameters
+    ----------
+    path : str | :class:`os.PathLike`
+        The path of the file.
+
+    Returns
+    -------
+    tuple[:class:`_GbxHeader`, bytes]
+        The header and the decompressed body.
+
+    Raises
+    ------
+    :class:`InvalidGbxFile`
+        If the file is not a GBX file or references external files.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+
+    header = _parse_header(data)
+    try:
+        # Node count, then the number of external references
+        (external_count,) = struct.unpack_from("<I", data, header.end + 4)
+        if external_count != 0:
+            raise InvalidGbxFile(f"{path} references external files")
+
+        offset = header.end + 8
+        if not header.body_compressed:
+            return header, data[offset:]
+
+        uncompressed_size, compressed_size = struct.unpack_from("<II", data, offset)
+        offset += 8
+    except struct.error as e:
+        raise InvalidGbxFile("GBX body is truncated") from e
+
+    return header, decompress(
+        data[offset : offset + compressed_size], uncompressed_size
+    )
+
+
+def _find_skippable_chunk(body: bytes, chunk_id: int) -> bytes | None:
+    marker = struct.pack("<I", chunk_id) + _SKIPPABLE_CHUNK_MARKER
+    offset = body.find(marker)
+    if offset == -1:
+        return None
+
+    offset += len(marker)
+    try:
+        (size,) = struct.unpack_from("<I", body, offset)
+    except struct.error:
+        return None
+    return body[offset + 4 : offset + 4 + size]
+
+
+def _parse_ghost(body: bytes) -> tuple[int | None, list[int]]:
+    race_time = None
+    race_time_chunk = _find_skippable_chunk(body, GHOST_RACE_TIME_CHUNK)
+    if race_time_chunk is not None and len(race_time_chunk) >= 4:
+        (race_time,) = struct.unpack_from("<i", race_time_chunk)
+        if race_time < 0:
+            race_time = None
+
+    checkpoints = []
+    checkpoints_chunk = _find_skippable_chunk(body, GHOST_CHECKPOINTS_CHUNK)
+    if checkpoints_chunk is not None and len(checkpoints_chunk) >= 4:
+        (count,) = struct.unpack_from("<I", checkpoints_chunk)
+        if len(checkpoints_chunk) >= 4 + count * 8:
+            checkpoints = list(
+                struct.unpack_from(f"<{count * 2}I", checkpoints_chunk, 4)[::2]
+            )
+
+    return race_time, checkpoints
@@ -0,0 +1,77 @@
+import sys
+from collections.abc import Hashable
+from typing import TypeVar
+from weakref import WeakValueDictionary
+
+from .config import Client
+
+_T = TypeVar("_T")
+
+# One identity map per class, an entry lives as long as something else references the instance.
+_INSTANCES: dict[type, WeakValueDictionary] = {}
+
+
+def _get_shared(cls: type[_T], key: Hashable | None) -> _T | None:
+    """
+    .. versionadded :: 0.5
+
+    Gets the live instance of `cls` with the given key if :attr:`Client.IDENTITY_MAP` is enabled.
+
+    Parameters
+    ----------
+    cls : type
+        The class of the instance, e.g. :class:`Player`.
+    key : Hashable | None
+        The id of the instance, e.g. the player id.
+
+    Returns
+    -------
+    object | None
+        The live instance, None if there is none or the identity map is disabled.
+    """
+    if not Client.IDENTITY_MAP or key is None:
+        return None
+
+    instances = _INSTANCES.get(cls)
+    if instances is None:
+        return None
+    return instances.get(key)
+
+
+def _share(cls: type[_T], key: Hashable | None, instance: _T) -> _T:
+    """
+    .. versionadded :: 0.5
+
+    Registers an instance in the identity map of `cls` if :attr:`Client.IDENTITY_MAP` is enabled.
+    If another instance with the same key is still alive, that one is returned instead.
+
+    Parameters
+    ----------
+    cls : type
+        The class of the instance.
+    key : Hashable | None
+        The id of the instance, the instance is not shared if None.
+    instance : object
+        The newly built instance.
+
+    Returns
+    -------
+    object
+        The shared instance.
+    """
+    if not Client.IDENTITY_MAP or key is None:
+        return instance
+
+    return _INSTANCES.setdefault(cls, WeakValueDictionary()).setdefault(key, instance)
+
+
+def _intern(text: str | None) -> str | None:
+    """
+    .. versionadded :: 0.5
+
+    Interns a string that repeats across payloads (ids, names, tags) if
+    :attr:`Client.IDENTITY_MAP` is enabled, so every parsed copy shares one object.
+    """
+    if not Client.IDENTITY_MAP or not isinstance(text, str):
+        return text
+    return sys.intern(text)
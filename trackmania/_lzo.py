@@ -0,0 +1,151 @@
+"""
+A pure-Python LZO1X decompressor, following `lzo1x_decompress_safe` from the LZO reference
+implementation. GBX files compress their body with LZO1X, and this keeps the library free of
+compiled dependencies.
+"""
+from .errors import InvalidGbxFile
+
+_M2_MAX_OFFSET = 0x0800
+
+# Decoder states, named after the labels in the reference implementation
+_LOOP = 0
+_FIRST_LITERAL_RUN = 1
+_MATCH = 2
+_MATCH_DONE = 3
+_MATCH_NEXT = 4
+
+
+def _copy_match(out: bytearray, position: int, length: int) -> None:
+    if position < 0:
+        raise InvalidGbxFile("LZO match points before the start of the output")
+
+    distance = len(out) - position
+    if distance >= length:
+        out += out[position : position + length]
+    else:
+        # Overlapping match, the last `distance` bytes repeat.
+        pattern = out[position:]
+        out += (pattern * (length // distance + 1))[:length]
+
+
+def _read_length(src: bytes, ip: int, base: int) -> tuple[int, int]:
+    length = 0
+    while src[ip] == 0:
+        length += 255
+        ip += 1
+    return length + base + src[ip], ip + 1
+
+
+def decompress(src: bytes, out_size: int | None = None) -> bytes:
+    """
+    .. versionadded :: 0.5
+
+    Decompresses LZO1X data.
+
+    Parameters
+    ----------
+    src : bytes
+        The compressed data.
+    out_size : int | None, optional
+        The expected size of the decompressed data, checked once done, by default None
+
+    Returns
+    -------
+    bytes
+        The decompressed data.
+
+    Raises
+    ------
+    :class:`InvalidGbxFile`
+        If the data is not valid LZO1X.
+    """
+    out = bytearray()
+    ip = 0
+    t = 0
+    state = _LOOP
+
+    try:
+        if src[0] > 17:
+            t = src[0] - 17
+            ip = 1
+            if t < 4:
+                state = _MATCH_NEXT
+            else:
+                out += src[ip : ip + t]
+                ip += t
+                state = _FIRST_LITERAL_RUN
+
+        while True:
+            if state == _LOOP:
+                t = src[ip]
+                ip += 1
+                if t >= 16:
+                    state = _MATCH
+                    continue
+                if t == 0:
+                    t, ip = _read_length(src, ip, 15)
+                out += src[ip : ip + t + 3]
+                ip += t + 3
+                state = _FIRST_LITERAL_RUN
+
+            if state == _FIRST_LITERAL_RUN:
+                t = src[ip]
+                ip += 1
+                if t >= 16:
+                    state = _MATCH
+                    continue
+                position = len(out) - (1 + _M2_MAX_OFFSET) - (t >> 2) - (src[ip] << 2)
+                ip += 1
+                _copy_match(out, position, 3)
+                state = _MATCH_DONE
+
+            if state == _MATCH:
+                if t >= 64:
+                    position = len(out) - 1 - ((t >> 2) & 7) - (src[ip] << 3)
+                    ip += 1
+                    _copy_match(out, position, (t >> 5) + 1)
+                elif t >= 32:
+                    t &= 31
+                    if t == 0:
+                        t, ip = _read_length(src, ip, 31)
+                    position = len(out) - 1 - ((src[ip] | src[ip + 1] << 8) >> 2)
+                    ip += 2
+                    _copy_match(out, position, t + 2)
+                elif t >= 16:
+                    position = len(out) - ((t & 8) << 11)
+                    t &= 7
+                    if t == 0:
+                        t, ip = _read_length(src, ip, 7)
+                    position -= (src[ip] | src[ip + 1] << 8) >> 2
+                    ip += 2
+                    if position == len(out):
+                        break
+                    _copy_match(out, position - 0x4000, t + 2)
+                else:
+                    position = len(out) - 1 - (t >> 2) - (src[ip] << 2)
+                    ip += 1
+                    _copy_match(out, position, 2)
+                state = _MATCH_DONE
+
+            if state == _MATCH_DONE:
+                t = src[ip - 2] & 3
+                if t == 0:
+                    state = _LOOP
+                    continue
+                state = _MATCH_NEXT
+
+            if state == _MATCH_NEXT:
+                out += src[ip : ip + t]
+                ip += t
+                t = src[ip]
+                ip += 1
+                state = _MATCH
+    except IndexError as e:
+        raise InvalidGbxFile("LZO data is truncated") from e
+
+    if out_size is not None and len(out) != out_size:
+        raise InvalidGbxFile(
+            f"LZO data decompressed to {len(out)} bytes instead of {out_size}"
+        )
+
+    return bytes(out)
@@ -0,0 +1,220 @@
+import asyncio
+import atexit
+import heapq
+import logging
+from collections import Counter, OrderedDict
+
+from ._util import _regex_it
+from .config import Client, _cache_key, set_many_in_cache
+
+_log = logging.getLogger(__name__)
+
+
+def _trigrams(text: str) -> set[str]:
+    # Padded like pg_trgm so short queries and name prefixes still share trigrams.
+    text = f"  {text.lower()} "
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class _NameIndex:
+    """
+    .. versionadded :: 0.5
+
+    A bounded, least recently used index of player ids and names.
+    Every parser that sees a player's id next to their name adds the pair, so most id <-> name
+    lookups are answered without a request. Names are also indexed by their trigrams for
+    :meth:`search`. Parsers only buffer new pairs, they are written to the `player_id` and
+    `player_username` cache keys once :attr:`Client.NAME_INDEX_FLUSH_SIZE` pairs are pending,
+    on :meth:`flush` and at exit. Until then, other processes do not see them in cache.
+    """
+
+    def __init__(self):
+        self._names: OrderedDict[str, str] = OrderedDict()
+        self._ids: dict[str, str] = {}
+        self._pending: dict[str, str] = {}
+        self._trigram_ids: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, player_id: str | None, name: str | None) -> None:
+        """
+        Adds a player id and name pair, replacing the player's previous name.
+
+        Parameters
+        ----------
+        player_id : str | None
+            The player's id, the pair is ignored if None.
+        name : str | None
+            The player's name, formatting is stripped. The pair is ignored if None.
+        """
+        if not player_id or not name:
+            return
+        name = _regex_it(name)
+
+        old_name = self._names.get(player_id)
+        if old_name == name:
+            self._names.move_to_end(player_id)
+            return
+        if old_name is not None:
+            self._forget(player_id, old_name)
+
+        self._names[player_id] = name
+        self._names.move_to_end(player_id)
+        self._ids[name.lower()] = player_id
+        for trigram in _trigrams(name):
+            self._trigram_ids.setdefault(trigram, set()).add(player_id)
+        self._pending[player_id] = name
+
+        while len(self._names) > Client.NAME_INDEX_SIZE:
+            self._evict()
+        if len(self._pending) >= Client.NAME_INDEX_FLUSH_SIZE:
+            self.flush()
+
+    def _evict(self) -> None:
+        player_id, name = self._names.popitem(last=False)
+        self._forget(player_id, name)
+
+    def _forget(self, player_id: str, name: str) -> None:
+        if self._ids.get(name.lower()) == player_id:
+            del self._ids[name.lower()]
+        for trigram in _trigrams(name):
+            player_ids = self._trigram_ids.get(trigram)
+            if player_ids is None:
+                continue
+            player_ids.discard(player_id)
+            if len(player_ids) == 0:
+                del self._trigram_ids[trigram]
+
+    def get_id(self, name: str) -> str | None:
+        """
+        Gets a player's id from their name, case insensitive.
+
+        Parameters
+        ----------
+        name : str
+            The player's name.
+
+        Returns
+        -------
+        str | None
+            The player's id, None if the name is not in the index.
+        """
+        player_id = self._ids.get(name.lower())
+        if player_id is not None:
+            self._names.move_to_end(player_id)
+        return player_id
+
+    def get_name(self, player_id: str) -> str | None:
+        """
+        Gets a player's name from their id.
+
+        Parameters
+        ----------
+        player_id : str
+            The player's id.
+
+        Returns
+        -------
+        str | None
+            The player's name, None if the id is not in the index.
+        """
+        name = self._names.get(player_id)
+        if name is not None:
+            self._names.move_to_end(player_id)
+        return name
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[str, str, float]]:
+        """
+        Searches the indexed names by trigram similarity, names starting with the query rank
+        above other matches of the same similarity. Only names sharing at least half of the
+        query's trigrams are guaranteed to be found.
+
+        Parameters
+        ----------
+        query : str
+            The (partial) name to search for, case insensitive.
+        limit : int, optional
+            The maximum number of results, by default 10
+
+        Returns
+        -------
+        list[tuple[str, str, float]]
+            The `(player_id, name, score)` of the best matches, best first. The score is 1 for an
+            exact match and between 0 and 1 otherwise.
+        """
+        query = _regex_it(query).lower()
+        if len(query) == 0:
+            return []
+        query_trigrams = _trigrams(query)
+
+        postings = sorted(
+            (self._trigram_ids.get(trigram, frozenset()) for trigram in query_trigrams),
+            key=len,
+        )
+        # A name sharing at least half of the query's trigrams has one of the rarest ones,
+        # so common trigrams like the padded first letter never have to be walked.
+        required = len(postings) - (len(postings) + 1) // 2 + 1
+        candidates = set().union(*postings[:required])
+
+        # Only the candidates are counted, intersecting two sets walks the smaller one.
+        shared = Counter()
+        for player_ids in postings:
+            shared.update(candidates.intersection(player_ids))
+
+        results = []
+        for player_id in candidates:
+            count = shared[player_id]
+            name = self._names[player_id]
+            lowered = name.lower()
+            if lowered == query:
+                score = 1.0
+            else:
+                # Jaccard similarity of the trigram sets, |name trigrams| == len(name) + 1.
+                score = count / (len(query_trigrams) + len(lowered) + 1 - count)
+                if lowered.startswith(query):
+                    score = max(score, 0.5 + 0.5 * len(query) / len(lowered))
+            results.append((player_id, name, score))
+
+        return heapq.nsmallest(
+            limit, results, key=lambda result: (-result[2], result[1].lower())
+        )
+
+    def flush(self) -> asyncio.Future | None:
+        """
+        Writes the pairs added since the last flush to cache with one round trip.
+        From a running event loop the write runs in the default executor, so it never blocks
+        the loop.
+
+        Returns
+        -------
+        :class:`asyncio.Future` | None
+            The write running in the executor, None if there was nothing to write or it is done.
+        """
+        if len(self._pending) == 0:
+            return None
+
+        _log.debug(f"Flushing {len(self._pending)} player names to cache")
+        values = {}
+        for player_id, name in self._pending.items():
+            values[_cache_key("player_id", name.lower())] = player_id
+            values[_cache_key("player_username", player_id)] = name
+        self._pending.clear()
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            set_many_in_cache(values)
+            return None
+        return loop.run_in_executor(None, set_many_in_cache, values)
+
+    def clear(self) -> None:
+        """Empties the index without writing the pending pairs."""
+        self._names.clear()
+        self._ids.clear()
+        self._pending.clear()
+        self._trigram_ids.clear()
+
+
+_NAME_INDEX = _NameIndex()
+atexit.register(_NAME_INDEX.flush)
@@ -0,0 +1,91 @@
+import logging
+from collections.abc import Awaitable, Callable
+
+from .config import _cache_key, get_from_cache, get_many_from_cache, set_many_in_cache
+
+_log = logging.getLogger(__name__)
+
+# Enough doublings to reach any page of the trackmania.io leaderboards.
+_MAX_DOUBLINGS = 20
+
+
+async def _locate_by_score(
+    score: int,
+    get_page: Callable[[int], Awaitable[list[tuple[int, int]]]],
+    bounds_key: str,
+    ex: int | None = None,
+) -> tuple[int, int] | None:
+    """
+    .. versionadded :: 0.5
+
+    Finds where a score lands on a leaderboard sorted by descending score, requesting only
+    O(log pages) pages. The page count is not known, so the last page reached is found by
+    doubling the page number, then the landing page is binary searched. The first and last score
+    of every page requested are cached under `{bounds_key}:{page}`, each with the expiration time
+    of the page itself, so later searches only request pages whose bounds are not cached.
+
+    Parameters
+    ----------
+    score : int
+        The score to locate.
+    get_page : Callable[[int], Awaitable[list[tuple[int, int]]]]
+        Gets the `(score, rank)` rows of a page, an empty list past the last page.
+    bounds_key : str
+        The cache key prefix of the page bounds.
+    ex : int | None, optional
+        The expiration time of the cached bounds, it should match the one of the pages, by default None
+
+    Returns
+    -------
+    tuple[int, int] | None
+        The page and the rank of the first row with a score lower than or equal to `score`.
+        None if every row has a higher score.
+    """
+    # The pages reached by doubling are known up front, so their bounds are read in one round trip.
+    probes = [2**i - 1 for i in range(_MAX_DOUBLINGS)]
+    bounds: dict[int, list[int] | None] = {
+        page: page_bounds
+        for page, page_bounds in zip(
+            probes,
+            get_many_from_cache([_cache_key(bounds_key, page) for page in probes]),
+        )
+        if page_bounds is not None
+    }
+    pages: dict[int, list[tuple[int, int]]] = {}
+
+    async def landed(page: int) -> bool:
+        if page not in bounds:
+            bounds[page] = get_from_cache(_cache_key(bounds_key, page))
+        if bounds[page] is None:
+            rows = pages[page] = await get_page(page)
+            # An empty list marks the pages past the last one.
+            bounds[page] = [rows[0][0], rows[-1][0]] if rows else []
+
+        # Past the last page, or the page ends at or below the score.
+        page_bounds = bounds[page]
+        return len(page_bounds) == 0 or page_bounds[1] <= score
+
+    # `low` never lands and `high` always lands, page -1 is a virtual page above the first one.
+    low, high = -1, 0
+    while not await landed(high):
+        low, high = high, high * 2 + 1
+    while high - low > 1:
+        middle = (low + high) // 2
+        if await landed(middle):
+            high = middle
+        else:
+            low = middle
+
+    _log.debug(f"Located {score} on page {high} with {len(pages)} page requests")
+    set_many_in_cache(
+        {_cache_key(bounds_key, page): bounds[page] for page in pages}, ex=ex
+    )
+
+    if len(bounds[high]) == 0:
+        return None
+
+    rows = pages[high] if high in pages else await get_page(high)
+    for row_score, rank in rows:
+        if row_score <= score:
+            return high, rank
+    return None
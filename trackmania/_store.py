@@ -0,0 +1,252 @@
+import json
+import logging
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from contextlib import suppress
+
+from .config import Client, _cache_key, _decode_cached
+
+_log = logging.getLogger(__name__)
+
+
+class _ResultStore:
+    """
+    .. versionadded :: 0.5
+
+    Stores a player's history (COTD results, matches...) in cache, newest first.
+    Every owner has a list of the raw results, `{namespace}:{owner ids}`, and a set of their ids,
+    `{namespace}_ids:{owner ids}`, so syncing can stop at the first result that is already known.
+    An owner is the tuple of ids identifying a history, e.g. `(player_id,)`, the keys are built
+    from it with :func:`_cache_key`.
+
+    Parameters
+    ----------
+    namespace : str
+        The cache namespace of the store.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+
+    def _keys(self, owner: tuple[str | int, ...]) -> tuple[str, str]:
+        return (
+            _cache_key(self.namespace, *owner),
+            _cache_key(f"{self.namespace}_ids", *owner),
+        )
+
+    def known(
+        self, owner: tuple[str | int, ...], ids: list[Hashable]
+    ) -> list[bool] | None:
+        """
+        Checks which ids are stored with a single round trip.
+
+        Parameters
+        ----------
+        owner : tuple[str | int, ...]
+            The ids of the owner of the history, e.g. `(player_id,)`.
+        ids : list[Hashable]
+            The ids to check.
+
+        Returns
+        -------
+        list[bool] | None
+            Whether each id is stored, None if the cache is unavailable.
+        """
+        if len(ids) == 0:
+            return []
+
+        _, ids_key = self._keys(owner)
+        cache_client = Client._get_cache_client()
+
+        with suppress(*Client.redis_exceptions):
+            pipeline = cache_client.pipeline(transaction=False)
+            for result_id in ids:
+                pipeline.sismember(ids_key, str(result_id))
+            return [bool(known) for known in pipeline.execute()]
+        return None
+
+    def add_newest(
+        self, owner: tuple[str | int, ...], results: list[dict], ids: list[Hashable]
+    ) -> int | None:
+        """
+        Adds results newer than every stored one.
+        The ids are checked and the new results pushed in one transaction watching the id set,
+        so results added by a concurrent sync of the same owner are not stored twice.
+
+        Parameters
+        ----------
+        owner : tuple[str | int, ...]
+            The ids of the owner of the history.
+        results : list[dict]
+            The raw results, newest first.
+        ids : list[Hashable]
+            The ids of the results.
+
+        Returns
+        -------
+        int | None
+            The number of results that were not stored yet, None if the cache is unavailable.
+        """
+        if len(results) == 0:
+            return 0
+
+        list_key, ids_key = self._keys(owner)
+        cache_client = Client._get_cache_client()
+        str_ids = [str(result_id) for result_id in ids]
+
+        def add(pipeline) -> int:
+            # The id set is already watched, so the ids are read in one round trip on another
+            # connection. SMISMEMBER would need redis 6.2.
+            reads = cache_client.pipeline(transaction=False)
+            for result_id in str_ids:
+                reads.sismember(ids_key, result_id)
+            new_results = [
+                (result, result_id)
+                for result, result_id, known in zip(results, str_ids, reads.execute())
+                if not known
+            ]
+
+            pipeline.multi()
+            if len(new_results) != 0:
+                # LPUSH pushes its values one by one, the oldest goes first so the newest ends up first.
+                pipeline.lpush(
+                    list_key,
+                    *(json.dumps(result) for result, _ in reversed(new_results)),
+                )
+                pipeline.sadd(ids_key, *(result_id for _, result_id in new_results))
+            return len(new_results)
+
+        with suppress(*Client.redis_exceptions):
+            added = cache_client.transaction(add, ids_key, value_from_callable=True)
+            _log.debug(f"Stored {added} new results in {list_key}")
+            return added
+        return None
+
+    def count(self, owner: tuple[str | int, ...]) -> int:
+        """
+        Counts the stored results of an owner.
+
+        Parameters
+        ----------
+        owner : tuple[str | int, ...]
+            The ids of the owner of the history.
+
+        Returns
+        -------
+        int
+            The number of results, 0 if the cache is unavailable.
+        """
+        list_key, _ = self._keys(owner)
+        cache_client = Client._get_cache_client()
+
+        with suppress(*Client.redis_exceptions):
+            return cache_client.llen(list_key)
+        return 0
+
+    def iterate(
+        self, owner: tuple[str | int, ...], chunk_size: int = 100
+    ) -> Iterator[dict]:
+        """
+        Iterates over the stored results, newest first, reading `chunk_size` results at a time
+        so the whole history is never held in memory.
+
+        Parameters
+        ----------
+        owner : tuple[str | int, ...]
+            The ids of the owner of the history.
+        chunk_size : int, optional
+            The number of results read per round trip, by default 100
+
+        Yields
+        ------
+        dict
+            The raw results.
+        """
+        list_key, _ = self._keys(owner)
+        cache_client = Client._get_cache_client()
+
+        start = 0
+        while True:
+            chunk = []
+            with suppress(*Client.redis_exceptions):
+                chunk = cache_client.lrange(list_key, start, start + chunk_size - 1)
+
+            yield from (_decode_cached(result) for result in chunk)
+
+            if len(chunk) < chunk_size:
+                return
+            start += chunk_size
+
+    def clear(self, owner: tuple[str | int, ...]) -> None:
+        """Removes every stored result of an owner."""
+        cache_client = Client._get_cache_client()
+
+        with suppress(*Client.redis_exceptions):
+            cache_client.delete(*self._keys(owner))
+
+
+async def _sync(
+    store: _ResultStore,
+    owner: tuple[str | int, ...],
+    get_page: Callable[[int], Awaitable[list[dict]]],
+    get_id: Callable[[dict], Hashable],
+) -> int:
+    """
+    .. versionadded :: 0.5
+
+    Fetches an owner's history from the newest page on, until a page is empty or a result is
+    already stored, and stores the new results.
+
+    Parameters
+    ----------
+    store : :class:`_ResultStore`
+        The store of the history.
+    owner : tuple[str | int, ...]
+        The ids of the owner of the history.
+    get_page : Callable[[int], Awaitable[list[dict]]]
+        Fetches the raw results of a page, newest first. Pages must not come from cache.
+    get_id : Callable[[dict], Hashable]
+        Gets the id of a raw result.
+
+    Returns
+    -------
+    int
+        The number of results stored, 0 if the cache is unavailable.
+    """
+    new_results: list[dict] = []
+    new_ids: list[Hashable] = []
+    seen: set[Hashable] = set()
+
+    page = 0
+    while True:
+        results = await get_page(page)
+        ids = [get_id(result) for result in results]
+
+        known_ids = store.known(owner, ids)
+        if known_ids is None:
+            # Nothing could be stored, so there is no point in fetching the other pages.
+            _log.warning(f"Cannot sync {owner}, the cache is unavailable")
+            return 0
+
+        reached_known = False
+        for result, result_id, known in zip(results, ids, known_ids):
+            if known:
+                reached_known = True
+                break
+            # Results move to the next page while syncing if a new one is added meanwhile.
+            if result_id in seen:
+                continue
+            seen.add(result_id)
+            new_results.append(result)
+            new_ids.append(result_id)
+
+        if reached_known or len(results) == 0:
+            break
+        page += 1
+
+    _log.debug(f"Synced {len(new_results)} new results for {owner} in {page + 1} pages")
+    added = store.add_newest(owner, new_results, new_ids)
+    if added is None:
+        _log.warning(f"Could not store the {len(new_results)} new results of {owner}")
+        return 0
+
+    return added
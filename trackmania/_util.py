@@ -1,42 +1,128 @@
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from types import NoneType
 
 _log = logging.getLogger(__name__)
 
+_FORMATTING_REGEX = re.compile(
+    r"(?i)(?<!\$)((?P<d>\$+)(?P=d))?((?<=\$)(?!\$)|(\$([a-f\d]{1,3}|[ionmwsztg<>]|[lhp](\[[^\]]+\])?)))"
+)
+
+
+def _check_include(include: list[str] | None, allowed: tuple[str, ...]) -> set[str]:
+    include = set(include or ())
+    unknown = include.difference(allowed)
+    if unknown:
+        raise ValueError(
+            f"Cannot include {', '.join(sorted(unknown))}, expected any of {', '.join(allowed)}"
+        )
+    return include
+
 
 def _add_commas(num: int) -> str:
     return "{:,}".format(num)
 
 
-def _regex_it(text: str | None) -> str | None:
-    REGEX = r"(?i)(?<!\$)((?P<d>\$+)(?P=d))?((?<=\$)(?!\$)|(\$([a-f\d]{1,3}|[ionmwsztg<>]|[lhp](\[[^\]]+\])?)))"
-    SUBST = ""
+@lru_cache(maxsize=8192)
+def _strip_formatting(text: str) -> str:
+    return _FORMATTING_REGEX.sub("", text)
+
 
+def _regex_it(text: str | None) -> str | None:
     if isinstance(text, NoneType):
         return None
 
-    return re.sub(REGEX, SUBST, text)
+    # Every formatting code starts with a `$`, plain names skip the regex entirely.
+    if "$" not in text:
+        return text
+
+    return _strip_formatting(text)
+
+
+def _parse_iso_prefix(date_string: str) -> datetime:
+    # `fromisoformat` accepts more than `strptime` would, so check the exact shape first.
+    if (
+        date_string[4:5] != "-"
+        or date_string[7:8] != "-"
+        or date_string[13:14] != ":"
+        or date_string[16:17] != ":"
+        or not (date_string[:4] + date_string[5:7] + date_string[8:10]).isdigit()
+        or not (date_string[11:13] + date_string[14:16] + date_string[17:19]).isdigit()
+    ):
+        raise ValueError(f"{date_string} is not an ISO 8601 timestamp")
+    return datetime.fromisoformat(date_string[:19])
+
+
+def _parse_iso_seconds(date_string: str, suffix: str) -> datetime:
+    if date_string[19:] != suffix:
+        raise ValueError(f"{date_string} does not end with {suffix!r}")
+    return _parse_iso_prefix(date_string)
+
+
+def _parse_iso_fraction(date_string: str) -> datetime:
+    fraction = date_string[20:]
+    if (
+        date_string[19:20] != "."
+        or not 0 < len(fraction) <= 6
+        or not fraction.isdigit()
+    ):
+        raise ValueError(f"{date_string} does not have a valid fraction")
+    return _parse_iso_prefix(date_string).replace(
+        microsecond=int(fraction.ljust(6, "0"))
+    )
+
+
+def _parse_underscored(date_string: str) -> datetime:
+    if (
+        len(date_string) != 16
+        or date_string[13] != "_"
+        or not (date_string[11:13] + date_string[14:16]).isdigit()
+    ):
+        raise ValueError(f"{date_string} is not in %Y-%m-%d_%H_%M format")
+    return _parse_iso_prefix(
+        f"{date_string[:10]}T{date_string[11:13]}:{date_string[14:16]}:00"
+    )
+
+
+_DATETIME_PARSERS = {
+    "%Y-%m-%dT%H:%M:%SZ": lambda date_string: _parse_iso_seconds(date_string, "Z"),
+    "%Y-%m-%dT%H:%M:%S+00:00": lambda date_string: _parse_iso_seconds(
+        date_string, "+00:00"
+    ),
+    "%Y-%m-%dT%H:%M:%S.%f": _parse_iso_fraction,
+    "%Y-%m-%dT%H:%M:%S": lambda date_string: _parse_iso_seconds(date_string, ""),
+    "%Y-%m-%d_%H_%M": _parse_underscored,
+}
+
+# Maps the shape of a timestamp (length, date/time separator, character after the seconds)
+# to the format it was last parsed with, so each field only goes through the format list once.
+_DATETIME_SHAPES: dict[tuple[int, str, str], str] = {}
 
 
 def _frmt_str_to_datetime(date_string: str | None) -> datetime | None:
     if date_string is None:
         return None
 
-    formats = [
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%dT%H:%M:%S+00:00",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d_%H_%M",
-    ]
+    shape = (len(date_string), date_string[10:11], date_string[19:20])
+    fmt = _DATETIME_SHAPES.get(shape)
+    if fmt is not None:
+        try:
+            return _DATETIME_PARSERS[fmt](date_string)
+        except ValueError:
+            pass
 
-    for fmt in formats:
-        _log.debug("Trying %s with format %s", date_string, fmt)
+    debug = _log.isEnabledFor(logging.DEBUG)
+    for fmt in _DATETIME_PARSERS:
+        if debug:
+            _log.debug("Trying %s with format %s", date_string, fmt)
         try:
-            return datetime.strptime(date_string, fmt)
+            parsed = datetime.strptime(date_string, fmt)
         except ValueError:
             continue
 
+        _DATETIME_SHAPES[shape] = fmt
+        return parsed
+
     return None
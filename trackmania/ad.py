@@ -8,7 +8,7 @@ from trackmania.errors import TMIOException
 from ._util import _regex_it
 from .api import _APIClient
 from .base import AdObject
-from .config import get_from_cache, set_in_cache
+from .config import _cache_key, get_from_cache, set_in_cache
 from .constants import _TMIO
 
 _log = logging.getLogger(__name__)
@@ -20,7 +20,7 @@ async def _get_ad_list() -> list[dict]:
     ad_list = []
 
     _log.debug("Getting all ads")
-    ads = get_from_cache("ads")
+    ads = get_from_cache(_cache_key("ads"))
     if ads is not None:
         for ad_dict in ads.get("ads"):
             ad_list.append(ad_dict)
@@ -33,7 +33,7 @@ async def _get_ad_list() -> list[dict]:
     with suppress(KeyError, TypeError):
         raise TMIOException(all_ads["error"])
 
-    set_in_cache("ads", all_ads, ex=43200)
+    set_in_cache(_cache_key("ads"), all_ads, ex=43200)
 
     for ad_dict in all_ads.get("ads"):
         ad_list.append(ad_dict)
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 from datetime import datetime
+from weakref import WeakKeyDictionary
 
 import aiohttp
 
@@ -44,10 +46,42 @@ class ResponseCodeError(ValueError):
         return f"Status: {self.status} Response: {response}"
 
 
+_request_semaphores: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _request_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    if loop not in _request_semaphores:
+        _request_semaphores[loop] = asyncio.Semaphore(Client.MAX_CONCURRENT_REQUESTS)
+    return _request_semaphores[loop]
+
+
+async def _wait_for_ratelimit() -> None:
+    """
+    .. versionadded :: 0.5
+
+    Waits until the `trackmania.io` ratelimit resets if no requests are remaining, then takes
+    one request from the remaining budget so concurrent requests do not overshoot it.
+    """
+    if Client.RATELIMIT_REMAINING is None:
+        return
+
+    if Client.RATELIMIT_REMAINING <= 0 and Client.RATELIMIT_RESET is not None:
+        delay = (Client.RATELIMIT_RESET - datetime.utcnow()).total_seconds()
+        if delay > 0:
+            _log.warning(f"Ratelimit reached, waiting {delay:.1f}s for it to reset")
+            await asyncio.sleep(delay)
+        Client.RATELIMIT_REMAINING = Client.RATELIMIT_LIMIT
+
+    Client.RATELIMIT_REMAINING -= 1
+
+
 # pylint: disable=W0612
 class _APIClient:
     """
     .. versionadded:: 0.3.0
+    .. versionchanged :: 0.5
+        Can be used as an async context manager to share one session between many requests.
 
     API Wrappers
     """
@@ -56,6 +90,8 @@ class _APIClient:
         if Client.USER_AGENT is None:
             raise NoUserAgentSetError()
 
+        self._managed = False
+
         self.session = aiohttp.ClientSession(
             headers={
                 "Accept": "application/json",
@@ -65,6 +101,13 @@ class _APIClient:
             **session_kwargs,
         )
 
+    async def __aenter__(self) -> "_APIClient":
+        self._managed = True
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     async def close(self) -> None:
         """
         Close the AIOHTTP Session
@@ -72,6 +115,11 @@ class _APIClient:
 
         await self.session.close()
 
+    async def _close_on_error(self) -> None:
+        # A shared session is closed by its context manager, not by the request that failed.
+        if not self._managed:
+            await self.session.close()
+
     # pylint: disable=R0201
     async def maybe_raise_for_status(
         self, response: aiohttp.ClientResponse, should_raise: bool
@@ -82,13 +130,13 @@ class _APIClient:
                 response_json = await response.json()
                 if "error" in response_json:
                     return
-                await self.session.close()
+                await self._close_on_error()
                 raise ResponseCodeError(response=response, response_json=response_json)
             except aiohttp.ContentTypeError as content_type_error:
                 response_text = await response.text()
                 if "error" in response_text:
                     return
-                await self.session.close()
+                await self._close_on_error()
                 raise ResponseCodeError(
                     response=response, response_text=response_text
                 ) from content_type_error
@@ -102,6 +150,25 @@ class _APIClient:
         **kwargs,
     ) -> dict:
         """Send an HTTP request to the site API and return the JSON response."""
+        if "trackmania.io" in endpoint:
+            async with _request_semaphore():
+                await _wait_for_ratelimit()
+                return await self._request(
+                    method, endpoint, raise_for_status=raise_for_status, **kwargs
+                )
+
+        return await self._request(
+            method, endpoint, raise_for_status=raise_for_status, **kwargs
+        )
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        raise_for_status: bool = True,
+        **kwargs,
+    ) -> dict:
         async with self.session.request(method.upper(), endpoint, **kwargs) as resp:
             await self.maybe_raise_for_status(resp, raise_for_status)
             _log.info(f"Sending {method.upper()} to {endpoint}")
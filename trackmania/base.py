@@ -46,6 +46,14 @@ class COTDObject(TrackmaniaObject):
     pass
 
 
+class DownloadObject(TrackmaniaObject):
+    """
+    Base class for `downloads` module.
+    """
+
+    pass
+
+
 class MatchmakingObject(TrackmaniaObject):
     """
     Base class for `matchmaking` module.
@@ -100,3 +108,11 @@ class TrophyObject(TrackmaniaObject):
     """
 
     pass
+
+
+class ZoneObject(TrackmaniaObject):
+    """
+    Base class for `zones` module.
+    """
+
+    pass
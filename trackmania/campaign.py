@@ -1,18 +1,20 @@
+import asyncio
 import logging
 from contextlib import suppress
 from datetime import datetime
 
 from typing_extensions import Self
 
-from ._util import _regex_it
+from ._batch import _get_many
+from ._util import _check_include, _regex_it
 from .api import _APIClient
 from .base import CampaignObject
 from .club import Club
-from .config import get_from_cache, set_in_cache
+from .config import _cache_key, get_from_cache, set_in_cache
 from .constants import _TMIO
 from .errors import TMIOException
 from .player import Player
-from .tmmap import TMMap
+from .tmmap import Leaderboard, TMMap, _get_leaderboard
 
 _log = logging.getLogger(__name__)
 
@@ -24,6 +26,42 @@ __all__ = (
 )
 
 
+async def _get_campaigns_page(page: int) -> dict:
+    _log.debug(f"Getting Campaigns Page {page}")
+
+    all_campaigns = get_from_cache(_cache_key("campaigns", page))
+    if all_campaigns is not None:
+        return all_campaigns
+
+    api_client = _APIClient()
+    all_campaigns = await api_client.get(_TMIO.build([_TMIO.TABS.CAMPAIGNS, page]))
+    await api_client.close()
+
+    with suppress(KeyError, TypeError):
+        raise TMIOException(all_campaigns["error"])
+
+    set_in_cache(_cache_key("campaigns", page), all_campaigns, ex=43200)
+
+    return all_campaigns
+
+
+async def _fetch_campaign(ids: tuple[int, int], api_client: _APIClient) -> dict:
+    campaign_id, club_id = ids
+    if club_id != 0:
+        campaign_data = await api_client.get(
+            _TMIO.build([_TMIO.TABS.CAMPAIGN, club_id, campaign_id])
+        )
+    else:
+        campaign_data = await api_client.get(
+            _TMIO.build([_TMIO.TABS.OFFICIAL_CAMPAIGN, campaign_id])
+        )
+
+    with suppress(KeyError, TypeError):
+        raise TMIOException(campaign_data["error"])
+
+    return campaign_data
+
+
 class OfficialCampaignMedia(CampaignObject):
     """
     .. versionadded :: 0.5
@@ -247,8 +285,9 @@ class Campaign(CampaignObject):
         Whether the camapaign is official (made by Nadeo).
     leaderboard_uid : str
         The campaign's leaderboard id.
-    maps : :class:`list[TMMap]`
-        The maps in the campaign.
+    maps : :class:`list[TMMap]` | :class:`list[dict]`
+        The maps in the campaign. Raw map dictionaries are only parsed into
+        :class:`TMMap` objects when they are first accessed.
     map_count : int
         The number of maps in the campaign.
     media : :class:`OfficialCampaignMedia` | None
@@ -264,7 +303,7 @@ class Campaign(CampaignObject):
         image: str,
         is_official: bool,
         leaderboard_uid: str,
-        maps: list[TMMap],
+        maps: list[TMMap] | list[dict],
         map_count: int,
         media: OfficialCampaignMedia | None,
         name: str,
@@ -274,10 +313,11 @@ class Campaign(CampaignObject):
         self.image = image
         self.is_official = is_official
         self.leaderboard_uid = leaderboard_uid
-        self.maps = maps
+        self._maps = maps
         self.map_count = map_count
         self.media = media
         self.name = name
+        self._club: Club | None = None
 
     @classmethod
     def _from_dict(cls: Self, raw_data: dict, official: bool = False) -> Self:
@@ -287,8 +327,8 @@ class Campaign(CampaignObject):
         image = raw_data.get("media") if raw_data.get("media") != "" else None
         is_official = official
         leaderboard_uid = raw_data.get("leaderboarduid")
-        maps = [TMMap._from_dict(map_data) for map_data in raw_data.get("playlist", [])]
-        map_count = len(raw_data.get("playlist", []))
+        maps = list(raw_data.get("playlist", []))
+        map_count = len(maps)
         if raw_data.get("mediae") is not None:
             media = OfficialCampaignMedia._from_dict(raw_data.get("mediae"))
         else:
@@ -309,8 +349,49 @@ class Campaign(CampaignObject):
 
         return cls(*args)
 
+    @property
+    def maps(self) -> list[TMMap]:
+        """
+        .. versionadded :: 0.5
+
+        The maps in the campaign, parsed on first access.
+
+        Returns
+        -------
+        :class:`list[TMMap]`
+            The maps in the campaign.
+        """
+        for index in range(len(self._maps)):
+            self.get_map(index)
+        return self._maps
+
+    async def _prefetch(self, includes: set[str]) -> None:
+        maps = self.maps if "map_authors" in includes else []
+
+        lookups = []
+        if "club" in includes and self.club_id != 0:
+            lookups.append(Club.get_club(self.club_id))
+        # Player lookups of one iteration are batched, so repeated authors are fetched once.
+        lookups.extend(Player.get_player(tmmap.author_id) for tmmap in maps)
+
+        # Prefetching is best effort, a failed lookup is left for the accessor to retry and raise.
+        results = await asyncio.gather(*lookups, return_exceptions=True)
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                _log.warning(
+                    f"Could not prefetch for campaign {self.campaign_id}: {result}"
+                )
+                results[index] = None
+
+        if "club" in includes and self.club_id != 0:
+            self._club, *results = results
+        for tmmap, author in zip(maps, results):
+            tmmap._author = author
+
     @classmethod
-    async def get_campaign(cls: Self, campaign_id: int, club_id: int) -> Self | None:
+    async def get_campaign(
+        cls: Self, campaign_id: int, club_id: int, include: list[str] | None = None
+    ) -> Self | None:
         """
         .. versionadded :: 0.5
 
@@ -325,31 +406,89 @@ class Campaign(CampaignObject):
         club_id : int
             The club the campaign belongs to.
             = 0 if the campaign is an official nadeo campaign.
+        include : list[str] | None, optional
+            Related objects to fetch concurrently and attach to the campaign, by default None.
+            `"club"` makes :meth:`Campaign.club` and `"map_authors"` makes :meth:`TMMap.author`
+            of every map return without a request. A lookup that fails does not fail the
+            campaign, its accessor requests it again when called.
 
         Returns
         -------
         :class:`Campaign` | None
             The campaign object, None if it does not exist
+
+        Raises
+        ------
+        :class:`ValueError`
+            If something unknown is included.
         """
+        includes = _check_include(include, ("club", "map_authors"))
         official = True if club_id == 0 else False
-        campaign_data = get_from_cache(f"campaign:{campaign_id}:{club_id}")
-        if campaign_data is not None:
-            return cls._from_dict(campaign_data, official=official)
-
-        api_client = _APIClient()
-        if club_id != 0:
-            campaign_data = await api_client.get(
-                _TMIO.build([_TMIO.TABS.CAMPAIGN, club_id, campaign_id])
-            )
-        else:
-            campaign_data = await api_client.get(
-                _TMIO.build([_TMIO.TABS.OFFICIAL_CAMPAIGN, campaign_id])
+        campaign_data = get_from_cache(_cache_key("campaign", club_id, campaign_id))
+        if campaign_data is None:
+            async with _APIClient() as api_client:
+                campaign_data = await _fetch_campaign(
+                    (campaign_id, club_id), api_client
+                )
+
+            set_in_cache(
+                _cache_key("campaign", club_id, campaign_id), campaign_data, ex=432000
             )
-        await api_client.close()
 
-        set_in_cache(f"campaign:{campaign_id}:{club_id}", campaign_data, ex=432000)
+        campaign = cls._from_dict(campaign_data, official=official)
+        if includes:
+            await campaign._prefetch(includes)
 
-        return cls._from_dict(campaign_data, official=official)
+        return campaign
+
+    @classmethod
+    async def get_many(
+        cls: Self,
+        campaigns: list[tuple[int, int]],
+        max_concurrent: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Self | Exception]:
+        """
+        .. versionadded :: 0.5
+
+        Gets many campaigns based on their campaign and club ids.
+        Cached campaigns are read in one batch and the rest are fetched concurrently over one session.
+
+        Parameters
+        ----------
+        campaigns : list[tuple[int, int]]
+            The `(campaign_id, club_id)` pairs of the campaigns, the club id is 0 for official campaigns.
+        max_concurrent : int | None, optional
+            The maximum number of campaigns fetched at the same time, by default :attr:`Client.MAX_CONCURRENT_REQUESTS`
+        return_exceptions : bool, optional
+            Whether a campaign that could not be fetched gets its error in place instead of it being raised, by default False
+
+        Returns
+        -------
+        :class:`list[Campaign | Exception]`
+            The campaigns in the same order as `campaigns`.
+
+        Raises
+        ------
+        :class:`TMIOException`
+            If a campaign doesn't exist and `return_exceptions` is False.
+        """
+        campaigns = [tuple(ids) for ids in campaigns]
+        campaigns_data = await _get_many(
+            campaigns,
+            lambda ids: _cache_key("campaign", ids[1], ids[0]),
+            _fetch_campaign,
+            ex=432000,
+            max_concurrent=max_concurrent,
+            return_exceptions=return_exceptions,
+        )
+
+        return [
+            campaign_data
+            if isinstance(campaign_data, BaseException)
+            else cls._from_dict(campaign_data, official=club_id == 0)
+            for (_, club_id), campaign_data in zip(campaigns, campaigns_data)
+        ]
 
     @classmethod
     async def current_season(cls: Self) -> Self:
@@ -363,12 +502,7 @@ class Campaign(CampaignObject):
         :class:`Campaign`
             The campaign.
         """
-        api_client = _APIClient()
-        campaign_data = await api_client.get(_TMIO.build([_TMIO.TABS.CAMPAIGNS, 0]))
-        await api_client.close()
-
-        with suppress(KeyError, TypeError):
-            raise TMIOException(campaign_data["error"])
+        campaign_data = await _get_campaigns_page(0)
 
         campaign_id = campaign_data.get("campaigns", [])[0].get("id")
 
@@ -387,25 +521,10 @@ class Campaign(CampaignObject):
             The list of campaigns.
         """
         official_campaigns = []
-        all_campaigns = get_from_cache("campaigns:all:0")
-
-        if all_campaigns is not None:
-            for campaign in all_campaigns.get("campaigns", []):
-                if campaign.get("clubid", -1) == 0:
-                    official_campaigns.append(CampaignSearchResult._from_dict(campaign))
-            return official_campaigns
-
-        api_client = _APIClient()
-        all_campaigns = await api_client.get(_TMIO.build([_TMIO.TABS.CAMPAIGNS, 0]))
-        await api_client.close()
-
-        with suppress(KeyError, TypeError):
-            raise TMIOException(all_campaigns["error"])
-
-        set_in_cache("campaigns:all:0", all_campaigns, ex=432000)
+        all_campaigns = await _get_campaigns_page(0)
 
         for campaign in all_campaigns.get("campaigns", []):
-            if campaign.get("id", -1) == 0:
+            if campaign.get("clubid", -1) == 0:
                 official_campaigns.append(CampaignSearchResult._from_dict(campaign))
 
         return official_campaigns
@@ -429,19 +548,7 @@ class Campaign(CampaignObject):
             The list of campaigns.
         """
         campaigns_list = []
-        all_campaigns = get_from_cache(f"campaigns:all:{page}")
-
-        if all_campaigns is not None:
-            for campaign in all_campaigns.get("campaigns", []):
-                if campaign.get("clubid", -1) != 0:
-                    campaigns_list.append(CampaignSearchResult._from_dict(campaign))
-
-        api_client = _APIClient()
-        all_campaigns = await api_client.get(_TMIO.build([_TMIO.TABS.CAMPAIGNS, page]))
-        await api_client.close()
-
-        with suppress(KeyError, TypeError):
-            raise TMIOException(all_campaigns["error"])
+        all_campaigns = await _get_campaigns_page(page)
 
         for campaign in all_campaigns.get("campaigns", []):
             if campaign.get("clubid", -1) != 0:
@@ -462,8 +569,10 @@ class Campaign(CampaignObject):
         """
         if self.club_id == 0:
             return None
-        else:
-            return await Club.get_club(self.club_id)
+        if self._club is not None:
+            return self._club
+
+        return await Club.get_club(self.club_id)
 
     async def leaderboards(
         self, offset: int = 0, length: int = 100
@@ -487,7 +596,7 @@ class Campaign(CampaignObject):
         """
         leaderboards = []
         leaderboard_data = get_from_cache(
-            f"campaign:{self.campaign_id}:{offset}:{length}"
+            _cache_key("campaign_leaderboard", self.leaderboard_uid, offset, length)
         )
 
         if leaderboard_data is not None:
@@ -507,7 +616,7 @@ class Campaign(CampaignObject):
             raise TMIOException(leaderboard_data["error"])
 
         set_in_cache(
-            f"campaign:{self.campaign_id}:{offset}:{length}",
+            _cache_key("campaign_leaderboard", self.leaderboard_uid, offset, length),
             leaderboard_data,
             ex=432000,
         )
@@ -517,6 +626,84 @@ class Campaign(CampaignObject):
 
         return leaderboards
 
+    @property
+    def map_uids(self) -> list[str]:
+        """
+        .. versionadded :: 0.5
+
+        The uids of the maps in the campaign, without parsing the maps.
+
+        Returns
+        -------
+        list[str]
+            The map uids.
+        """
+        return [
+            map_data.uid if isinstance(map_data, TMMap) else map_data.get("mapUid")
+            for map_data in self._maps
+        ]
+
+    async def map_leaderboards(
+        self,
+        length: int = 100,
+        offset: int = 0,
+        return_exceptions: bool = True,
+    ) -> dict[str, list[Leaderboard] | Exception]:
+        """
+        .. versionadded :: 0.5
+
+        Gets the leaderboard of every map in the campaign concurrently over one session.
+        Requests still go through the ratelimit handling, at most
+        :attr:`Client.MAX_CONCURRENT_REQUESTS` at a time.
+
+        Parameters
+        ----------
+        length : int, optional
+            How many leaderboard positions to get per map. Should be between 1 and 100 both inclusive, by default 100
+        offset : int, optional
+            The offset of the leaderboards, by default 0
+        return_exceptions : bool, optional
+            Whether a map whose leaderboard could not be fetched gets the error as its value
+            instead of the error being raised, by default True
+
+        Returns
+        -------
+        dict[str, :class:`list[Leaderboard]` | :class:`Exception`]
+            The leaderboard positions by map uid, in the order of the campaign's maps.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If the length is not between 1 and 100.
+        """
+        if length < 1:
+            raise ValueError("Length must be greater than 0")
+        length = min(length, 100)
+
+        map_uids = self.map_uids
+        _log.debug(f"Getting leaderboards of {len(map_uids)} maps of {self.name}")
+
+        async with _APIClient() as api_client:
+            results = await asyncio.gather(
+                *(
+                    _get_leaderboard(map_uid, offset, length, api_client)
+                    for map_uid in map_uids
+                ),
+                return_exceptions=return_exceptions,
+            )
+
+        leaderboards = {}
+        for map_uid, result in zip(map_uids, results):
+            if isinstance(result, BaseException):
+                _log.warning(f"Could not get the leaderboard of {map_uid}: {result}")
+                leaderboards[map_uid] = result
+            else:
+                leaderboards[map_uid] = [
+                    Leaderboard._from_dict(lb) for lb in result.get("tops", [])
+                ]
+
+        return leaderboards
+
     def get_map(self: Self, index: int = 0) -> TMMap:
         """
         .. versionadded :: 0.5
@@ -533,4 +720,8 @@ class Campaign(CampaignObject):
         :class:`TMMap`
             The map at the index.
         """
-        return self.maps[index]
+        map_data = self._maps[index]
+        if not isinstance(map_data, TMMap):
+            map_data = self._maps[index] = TMMap._from_dict(map_data)
+
+        return map_data
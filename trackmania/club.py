@@ -4,10 +4,13 @@ from datetime import datetime
 
 from typing_extensions import Self
 
+from ._batch import _get_many
+from ._identity import _get_shared, _intern, _share
+from ._names import _NAME_INDEX
 from ._util import _regex_it
 from .api import _APIClient
 from .base import ClubObject
-from .config import get_from_cache, set_in_cache
+from .config import _cache_key, get_from_cache, set_in_cache
 from .constants import _TMIO
 from .errors import TMIOException
 from .player import Player
@@ -21,6 +24,15 @@ __all__ = (
 )
 
 
+async def _fetch_club(club_id: int, api_client: _APIClient) -> dict:
+    club_data = await api_client.get(_TMIO.build([_TMIO.TABS.CLUB, club_id]))
+
+    with suppress(KeyError, TypeError):
+        raise TMIOException(club_data["error"])
+
+    return club_data
+
+
 class ClubMember(ClubObject):
     """
     .. versionadded :: 0.5
@@ -62,9 +74,10 @@ class ClubMember(ClubObject):
     @classmethod
     def _from_dict(cls: Self, raw_data: dict) -> Self:
         _log.debug("Creating a ClubMember class from the given dictionary")
-        name = _regex_it(raw_data["player"].get("name"))
-        tag = _regex_it(raw_data["player"].get("tag", None))
-        player_id = raw_data["player"].get("id")
+        name = _intern(_regex_it(raw_data["player"].get("name")))
+        tag = _intern(_regex_it(raw_data["player"].get("tag", None)))
+        player_id = _intern(raw_data["player"].get("id"))
+        _NAME_INDEX.add(player_id, name)
         join_time = datetime.utcfromtimestamp(raw_data.get("joinTime"))
         role = raw_data.get("role")
         vip = raw_data.get("vip")
@@ -237,6 +250,10 @@ class Club(ClubObject):
 
     @classmethod
     def _from_dict(cls: Self, raw_data: dict) -> Self:
+        club = _get_shared(cls, raw_data.get("id"))
+        if club is not None:
+            return club
+
         _log.debug("Creating a Club class from the given dictionary.")
         background = raw_data.get("backgroundUrl", "")
         created_at = datetime.utcfromtimestamp(raw_data.get("creationTimestamp", 0))
@@ -268,7 +285,7 @@ class Club(ClubObject):
             creator_id,
         ]
 
-        return cls(*args)
+        return _share(cls, club_id, cls(*args))
 
     @classmethod
     async def get_club(cls: Self, club_id: int) -> Self | None:
@@ -296,19 +313,67 @@ class Club(ClubObject):
         if club_id == 0:
             return None
 
-        club_data = get_from_cache(f"club:{club_id}")
+        club_data = get_from_cache(_cache_key("club", club_id))
         if club_data is not None:
             return cls._from_dict(club_data)
 
-        api_client = _APIClient()
-        club_data = await api_client.get(_TMIO.build([_TMIO.TABS.CLUB, club_id]))
-        await api_client.close()
+        async with _APIClient() as api_client:
+            club_data = await _fetch_club(club_id, api_client)
 
-        with suppress(KeyError, TypeError):
-            raise TMIOException(club_data["error"])
+        set_in_cache(_cache_key("club", club_id), club_data, ex=43200)
 
         return cls._from_dict(club_data)
 
+    @classmethod
+    async def get_many(
+        cls: Self,
+        club_ids: list[int],
+        max_concurrent: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Self | None | Exception]:
+        """
+        .. versionadded :: 0.5
+
+        Gets many clubs based on their club ids.
+        Cached clubs are read in one batch and the rest are fetched concurrently over one session.
+
+        Parameters
+        ----------
+        club_ids : list[int]
+            The clubs' ids.
+        max_concurrent : int | None, optional
+            The maximum number of clubs fetched at the same time, by default :attr:`Client.MAX_CONCURRENT_REQUESTS`
+        return_exceptions : bool, optional
+            Whether a club that could not be fetched gets its error in place instead of it being raised, by default False
+
+        Returns
+        -------
+        :class:`list[Club | None | Exception]`
+            The clubs in the same order as `club_ids`. None for club ids that are 0.
+
+        Raises
+        ------
+        :class:`TMIOException`
+            If a club doesn't exist and `return_exceptions` is False.
+        """
+        fetch_ids = [club_id for club_id in club_ids if club_id != 0]
+        clubs_data = await _get_many(
+            fetch_ids,
+            lambda club_id: _cache_key("club", club_id),
+            _fetch_club,
+            ex=43200,
+            max_concurrent=max_concurrent,
+            return_exceptions=return_exceptions,
+        )
+
+        clubs = {
+            club_id: club_data
+            if isinstance(club_data, BaseException)
+            else cls._from_dict(club_data)
+            for club_id, club_data in zip(fetch_ids, clubs_data)
+        }
+        return [clubs.get(club_id) for club_id in club_ids]
+
     @classmethod
     async def list_clubs(cls: Self, page: int = 0) -> list[Self]:
         """
@@ -327,7 +392,7 @@ class Club(ClubObject):
             The list of clubs on that specific page.
         """
         clubs = []
-        club_data = get_from_cache(f"clubs:{page}")
+        club_data = get_from_cache(_cache_key("clubs", page))
         if club_data is not None:
             for club in club_data.get("clubs", []):
                 clubs.append(cls._from_dict(club))
@@ -340,7 +405,7 @@ class Club(ClubObject):
         )
         await api_client.close()
 
-        set_in_cache(f"clubs:{page}", club_data, ex=43200)
+        set_in_cache(_cache_key("clubs", page), club_data, ex=43200)
 
         for club in club_data.get("clubs", []):
             clubs.append(cls._from_dict(club))
@@ -364,10 +429,12 @@ class Club(ClubObject):
             The list of activities of the club.
         """
         club_activities = []
-        all_activities = get_from_cache(f"club_activities:{self.club_id}:{page}")
+        all_activities = get_from_cache(
+            _cache_key("club_activities", self.club_id, page)
+        )
 
         if all_activities is not None:
-            for activity in all_activities:
+            for activity in all_activities.get("activities", []):
                 club_activities.append(ClubActivity._from_dict(activity))
 
             return club_activities
@@ -381,6 +448,10 @@ class Club(ClubObject):
         with suppress(KeyError, TypeError):
             raise TMIOException(all_activities["error"])
 
+        set_in_cache(
+            _cache_key("club_activities", self.club_id, page), all_activities, ex=3600
+        )
+
         for activity in all_activities.get("activities", []):
             club_activities.append(ClubActivity._from_dict(activity))
 
@@ -403,7 +474,7 @@ class Club(ClubObject):
             The list of members of the club.
         """
         player_list = []
-        club_members = get_from_cache(f"club_members:{self.club_id}:{page}")
+        club_members = get_from_cache(_cache_key("club_members", self.club_id, page))
 
         if club_members is not None:
             for member in club_members.get("members", []):
@@ -417,6 +488,13 @@ class Club(ClubObject):
         )
         await api_client.close()
 
+        with suppress(KeyError, TypeError):
+            raise TMIOException(club_members["error"])
+
+        set_in_cache(
+            _cache_key("club_members", self.club_id, page), club_members, ex=3600
+        )
+
         for member in club_members.get("members", []):
             player_list.append(ClubMember._from_dict(member))
 
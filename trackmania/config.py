@@ -39,6 +39,37 @@ class Client:
     RATELIMIT_RESET : datetime
         When the `trackmania.io` ratelimit will be reset. Date and Time in UTC
         .. versionadded :: 0.4.0
+    TMX_RANDOM_POOL_LOW : int
+        When this many or fewer prefetched random maps are left, the pool is refilled in the background.
+        .. versionadded :: 0.5
+    TMX_RANDOM_POOL_HIGH : int
+        The number of random maps the pool is refilled up to.
+        .. versionadded :: 0.5
+    TMX_RANDOM_POOL_DELAY : float
+        Seconds to wait between the requests of a refill, to stay within the `trackmania.exchange` rate limits.
+        .. versionadded :: 0.5
+    MAX_CONCURRENT_REQUESTS : int
+        The maximum number of `trackmania.io` requests sent at the same time.
+        .. versionadded :: 0.5
+    DOWNLOAD_DIRECTORY : str
+        The directory downloaded files are stored in.
+        .. versionadded :: 0.5
+    DOWNLOAD_LIMIT : int
+        The maximum number of files downloaded at the same time.
+        .. versionadded :: 0.5
+    NAME_INDEX_SIZE : int
+        The maximum number of player id and name pairs remembered from parsed data.
+        .. versionadded :: 0.5
+    NAME_INDEX_FLUSH_SIZE : int
+        The number of new player id and name pairs buffered before they are written to cache
+        together, the rest is written at exit.
+        .. versionadded :: 0.5
+    IDENTITY_MAP : bool
+        Whether players and clubs with the same id share one instance while it is alive, maps
+        share their parsed data but keep their own leaderboard pagination, and repeated ids, names
+        and tags are interned. Shared data is kept as it was first built until every reference to
+        it is dropped.
+        .. versionadded :: 0.5
     """
 
     USER_AGENT: str = None
@@ -50,6 +81,19 @@ class Client:
     RATELIMIT_LIMIT: int = 40
     RATELIMIT_REMAINING: int = None
     RATELIMIT_RESET: datetime = None
+    MAX_CONCURRENT_REQUESTS: int = 10
+
+    TMX_RANDOM_POOL_LOW: int = 2
+    TMX_RANDOM_POOL_HIGH: int = 10
+    TMX_RANDOM_POOL_DELAY: float = 0.5
+
+    DOWNLOAD_DIRECTORY: str = ".tmio_downloads"
+    DOWNLOAD_LIMIT: int = 4
+
+    NAME_INDEX_SIZE: int = 10000
+    NAME_INDEX_FLUSH_SIZE: int = 100
+
+    IDENTITY_MAP: bool = False
 
     redis_exceptions: tuple = (ConnectionRefusedError, redis.exceptions.ConnectionError)
 
@@ -71,6 +115,29 @@ class Client:
         )
 
 
+def _cache_key(namespace: str, *identifiers: str | int) -> str:
+    """
+    .. versionadded :: 0.5
+
+    Builds a cache key in the `namespace:identifier:identifier` format used by every module.
+    The namespace is the kind of data stored and the identifiers narrow it down from the
+    owning object to the page, e.g. `trophy_history:{player_id}:{page}`.
+
+    Parameters
+    ----------
+    namespace : str
+        The kind of data stored under the key.
+    *identifiers : str | int
+        The ids, pages, offsets etc. that identify the data.
+
+    Returns
+    -------
+    str
+        The cache key.
+    """
+    return ":".join([namespace, *(str(identifier) for identifier in identifiers)])
+
+
 def get_from_cache(key: str) -> dict | None:
     """
     Gets a specific key from cache if it exists.
@@ -98,7 +165,7 @@ def get_from_cache(key: str) -> dict | None:
     return None
 
 
-def set_in_cache(key: str, value: dict | str, ex: int = None) -> bool:
+def set_in_cache(key: str, value: dict | list | str, ex: int = None) -> bool:
     """
     Set a key-value pair in cache with an expiration time of `ex`.
 
@@ -106,7 +173,7 @@ def set_in_cache(key: str, value: dict | str, ex: int = None) -> bool:
     ----------
     key : str
         The key for the cache.
-    value : dict | str
+    value : dict | list | str
         The value for the specific key.
     ex : int, optional
         The expiration time for the key-value pair. If None there is no expiration time, by default None
@@ -122,12 +189,109 @@ def set_in_cache(key: str, value: dict | str, ex: int = None) -> bool:
         _log.debug(f"Setting {key} in cache with expiration time {ex}")
         if isinstance(value, str):
             return cache_client.set(name=key, value=value, ex=ex)
-        elif isinstance(value, dict):
+        elif isinstance(value, (dict, list)):
             return cache_client.set(name=key, value=json.dumps(value), ex=ex)
 
     return False
 
 
+def _decode_cached(value: bytes) -> dict | list | str:
+    try:
+        return json.loads(value.decode("utf-8"))
+    except json.decoder.JSONDecodeError:
+        return value.decode("utf-8")
+
+
+def get_many_from_cache(keys: list[str]) -> list[dict | None]:
+    """
+    .. versionadded :: 0.5
+
+    Gets many keys from cache with a single round trip.
+
+    Parameters
+    ----------
+    keys : list[str]
+        The keys to get.
+
+    Returns
+    -------
+    list[dict | None]
+        The parsed data for every key, in the same order as `keys`. None for keys that do not exist
+        or for every key if the cache is unavailable.
+    """
+    if len(keys) == 0:
+        return []
+
+    cache_client = Client._get_cache_client()
+
+    with suppress(*Client.redis_exceptions):
+        _log.debug(f"Getting {len(keys)} keys from cache")
+        return [
+            None if value is None else _decode_cached(value)
+            for value in cache_client.mget(keys)
+        ]
+    return [None] * len(keys)
+
+
+def set_many_in_cache(values: dict[str, dict | list | str], ex: int = None) -> bool:
+    """
+    .. versionadded :: 0.5
+
+    Sets many key-value pairs in cache with a single round trip, all with an expiration time of `ex`.
+
+    Parameters
+    ----------
+    values : dict[str, dict | list | str]
+        The values by their cache key.
+    ex : int, optional
+        The expiration time for the key-value pairs. If None there is no expiration time, by default None
+
+    Returns
+    -------
+    bool
+        True if successful, False if an error.
+    """
+    if len(values) == 0:
+        return True
+
+    cache_client = Client._get_cache_client()
+
+    with suppress(*Client.redis_exceptions):
+        _log.debug(f"Setting {len(values)} keys in cache with expiration time {ex}")
+        pipeline = cache_client.pipeline(transaction=False)
+        for key, value in values.items():
+            if not isinstance(value, str):
+                value = json.dumps(value)
+            pipeline.set(name=key, value=value, ex=ex)
+        return all(pipeline.execute())
+
+    return False
+
+
+def get_keys_from_cache(pattern: str) -> list[str]:
+    """
+    .. versionadded :: 0.5
+
+    Gets every key in cache matching a glob-style pattern, e.g. `tmx_map:*`.
+    Keys are scanned incrementally so the redis server is not blocked.
+
+    Parameters
+    ----------
+    pattern : str
+        The pattern to match.
+
+    Returns
+    -------
+    list[str]
+        The matching keys, empty if the cache is unavailable.
+    """
+    cache_client = Client._get_cache_client()
+
+    with suppress(*Client.redis_exceptions):
+        return [key.decode("utf-8") for key in cache_client.scan_iter(match=pattern)]
+    return []
+
+
 def cache_flushdb() -> None:
     """
     Flushes the entire db.
@@ -130,6 +130,18 @@ class _TMX(ConstantsObject):
     TABS: :class:`_TMXTabs`
         .. versionadded :: 0.3.3
         The TABS for TMX API
+    MULTI_LIMIT : int
+        .. versionadded :: 0.5
+        The maximum number of map ids the `multi` endpoint accepts per request.
+    SEARCH_LIMIT : int
+        .. versionadded :: 0.5
+        The maximum number of results a `mapsearch2` page can have.
+    DIFFICULTY_ENUMS : dict
+        .. versionadded :: 0.5
+        The map difficulties by their `mapsearch2` value.
+    LENGTH_ENUMS : dict
+        .. versionadded :: 0.5
+        The map lengths by their `mapsearch2` value.
     """
 
     PROTOCOL: str = "https"
@@ -137,6 +149,9 @@ class _TMX(ConstantsObject):
     API: str = "api"
     TABS: _TMXTabs = _TMXTabs()
 
+    MULTI_LIMIT: int = 50
+    SEARCH_LIMIT: int = 100
+
     MAP_TYPE_ENUMS: dict = {
         1: "Race",
         2: "FullSpeed",
@@ -180,6 +195,34 @@ class _TMX(ConstantsObject):
         40: "Arena",
     }
 
+    DIFFICULTY_ENUMS: dict = {
+        0: "Beginner",
+        1: "Intermediate",
+        2: "Advanced",
+        3: "Expert",
+        4: "Lunatic",
+        5: "Impossible",
+    }
+
+    LENGTH_ENUMS: dict = {
+        0: "Anything",
+        1: "15 secs",
+        2: "30 secs",
+        3: "45 secs",
+        4: "1 min",
+        5: "1 m 15 s",
+        6: "1 m 30 s",
+        7: "1 m 45 s",
+        8: "2 min",
+        9: "2 m 30 s",
+        10: "3 min",
+        11: "3 m 30 s",
+        12: "4 min",
+        13: "4 m 30 s",
+        14: "5 min",
+        15: "Long",
+    }
+
     @classmethod
     def build(cls: Self, endpoints: list[str]) -> str:
         """URL Builder for _TMX API
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterator
 from contextlib import suppress
 from datetime import datetime
 from types import NoneType
@@ -7,10 +8,11 @@ from typing_extensions import Self
 
 from trackmania.errors import TMIOException
 
+from ._store import _ResultStore, _sync
 from ._util import _frmt_str_to_datetime
 from .api import _APIClient
 from .base import COTDObject
-from .config import get_from_cache, set_in_cache
+from .config import _cache_key, get_from_cache, set_in_cache
 from .constants import _TMIO
 from .errors import InvalidIDError, TMIOException
 
@@ -25,13 +27,7 @@ __all__ = (
 )
 
 
-async def _get_trophy_page(player_id: str, page: int) -> dict:
-    _log.debug(f"Getting COTD Stats for Player {player_id} and page {page}")
-
-    player_cotd = get_from_cache(f"playercotd:{player_id}:{page}")
-    if player_cotd is not None:
-        return player_cotd
-
+async def _fetch_trophy_page(player_id: str, page: int) -> dict:
     api_client = _APIClient()
     page_data = await api_client.get(
         _TMIO.build([_TMIO.TABS.PLAYER, player_id, _TMIO.TABS.COTD, str(page)])
@@ -43,15 +39,31 @@ async def _get_trophy_page(player_id: str, page: int) -> dict:
     if isinstance(page_data, NoneType):
         raise InvalidIDError("Invalid PlayerID Given")
 
-    set_in_cache(f"playercotd:{player_id}:{page}", page_data)
+    return page_data
+
+
+async def _get_trophy_page(player_id: str, page: int) -> dict:
+    _log.debug(f"Getting COTD Stats for Player {player_id} and page {page}")
+
+    player_cotd = get_from_cache(_cache_key("player_cotd", player_id, page))
+    if player_cotd is not None:
+        return player_cotd
+
+    page_data = await _fetch_trophy_page(player_id, page)
+
+    # Pages shift whenever the player plays a new COTD, use `PlayerCOTD.sync` to keep a history.
+    set_in_cache(_cache_key("player_cotd", player_id, page), page_data, ex=3600)
 
     return page_data
 
 
+_COTD_STORE = _ResultStore("player_cotd_results")
+
+
 async def _get_cotd_page(page: int) -> dict:
     _log.debug(f"Getting COTD Page {page}")
 
-    cotd_page = get_from_cache(f"cotd:{page}")
+    cotd_page = get_from_cache(_cache_key("cotd", page))
     if cotd_page is not None:
         return cotd_page.get("competitions", [])
 
@@ -62,7 +74,7 @@ async def _get_cotd_page(page: int) -> dict:
     with suppress(KeyError, TypeError):
         raise TMIOException(all_cotds["error"])
 
-    set_in_cache(f"cotd:{page}", all_cotds, ex=7200)
+    set_in_cache(_cache_key("cotd", page), all_cotds, ex=7200)
 
     return all_cotds["competitions"]
 
@@ -331,6 +343,8 @@ class PlayerCOTD(COTDObject):
     async def get_page(cls: Self, player_id: str, page: int = 0) -> Self:
         """
         .. versionadded :: 0.3.0
+        .. versionchanged :: 0.5
+            Pages are cached for an hour instead of forever.
 
         Gets the Player's COTD Stats of a particular page.
 
@@ -343,6 +357,55 @@ class PlayerCOTD(COTDObject):
         """
         return cls._from_dict(await _get_trophy_page(player_id, page), player_id)
 
+    @staticmethod
+    async def sync(player_id: str) -> int:
+        """
+        .. versionadded :: 0.5
+
+        Adds the player's new COTD results to their stored history.
+        Pages are fetched from the newest on and syncing stops at the first competition that is
+        already stored, so keeping a history current usually costs one request.
+
+        Parameters
+        ----------
+        player_id : str
+            The player's ID
+
+        Returns
+        -------
+        int
+            The number of new results stored, 0 if the cache is unavailable.
+        """
+
+        async def get_page(page: int) -> list[dict]:
+            page_data = await _fetch_trophy_page(player_id, page)
+            return page_data.get("cotds") or []
+
+        return await _sync(_COTD_STORE, (player_id,), get_page, lambda cotd: cotd["id"])
+
+    @staticmethod
+    def results(player_id: str, chunk_size: int = 100) -> Iterator[PlayerCOTDResults]:
+        """
+        .. versionadded :: 0.5
+
+        Iterates over the player's stored COTD history, see :meth:`PlayerCOTD.sync`.
+        Results are read from cache `chunk_size` at a time.
+
+        Parameters
+        ----------
+        player_id : str
+            The player's ID
+        chunk_size : int, optional
+            The number of results read at a time, by default 100
+
+        Yields
+        ------
+        :class:`PlayerCOTDResults`
+            The results, newest first.
+        """
+        for cotd in _COTD_STORE.iterate((player_id,), chunk_size):
+            yield PlayerCOTDResults._from_dict(cotd)
+
 
 class COTD(COTDObject):
     """
@@ -0,0 +1,215 @@
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from weakref import WeakKeyDictionary
+
+from .api import ResponseCodeError, _APIClient
+from .base import DownloadObject
+from .config import Client
+
+_log = logging.getLogger(__name__)
+
+__all__ = ("DownloadManager",)
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class DownloadManager(DownloadObject):
+    """
+    .. versionadded :: 0.5
+
+    Downloads map files, ghosts and thumbnails to a content addressed disk cache.
+
+    Files are streamed to disk in chunks and stored under the sha256 hash of their content, with
+    an index from every url to the hash of its file. A url that has been downloaded before is
+    served from disk without any network request, the same file found under two urls is stored
+    once, concurrent downloads of one url share a single request and at most `max_concurrent`
+    downloads run at the same time.
+
+    Parameters
+    ----------
+    directory : str | :class:`os.PathLike` | None, optional
+        The directory the files are stored in. Defaults to :attr:`Client.DOWNLOAD_DIRECTORY`.
+    max_concurrent : int | None, optional
+        The maximum number of parallel downloads. Defaults to :attr:`Client.DOWNLOAD_LIMIT`.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike | None = None,
+        max_concurrent: int | None = None,
+    ):
+        self.directory = Path(
+            directory if directory is not None else Client.DOWNLOAD_DIRECTORY
+        )
+        self.max_concurrent = (
+            max_concurrent if max_concurrent is not None else Client.DOWNLOAD_LIMIT
+        )
+        self._pending: dict[str, asyncio.Future] = {}
+        self._semaphores: WeakKeyDictionary = WeakKeyDictionary()
+
+    @staticmethod
+    def _url_hash(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _object_path(self, content_hash: str) -> Path:
+        return self.directory / "objects" / content_hash[:2] / content_hash
+
+    def _index_path(self, url: str) -> Path:
+        return self.directory / "urls" / self._url_hash(url)
+
+    def get_path(self, url: str) -> Path | None:
+        """
+        .. versionadded :: 0.5
+
+        Gets the path of a file that has already been downloaded, without any network request.
+
+        Parameters
+        ----------
+        url : str
+            The url of the file.
+
+        Returns
+        -------
+        :class:`Path` | None
+            The path of the file, None if it has not been downloaded.
+        """
+        try:
+            content_hash = self._index_path(url).read_text().strip()
+        except FileNotFoundError:
+            return None
+
+        path = self._object_path(content_hash)
+        return path if path.exists() else None
+
+    async def download(self, url: str) -> Path:
+        """
+        .. versionadded :: 0.5
+
+        Downloads a file, returning the path it is stored at.
+
+        Parameters
+        ----------
+        url : str
+            The url of the file.
+
+        Returns
+        -------
+        :class:`Path`
+            The path of the file.
+
+        Raises
+        ------
+        :class:`ResponseCodeError`
+            If the file could not be downloaded.
+        """
+        path = self.get_path(url)
+        if path is not None:
+            _log.debug(f"Serving {url} from {path}")
+            return path
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(url)
+        if pending is not None and pending.get_loop() is loop:
+            _log.debug(f"Waiting on the running download of {url}")
+            return await asyncio.shield(pending)
+
+        task = loop.create_task(self._download(url))
+        self._pending[url] = task
+        # Removed by the task itself, it keeps running if the caller that started it is cancelled.
+        task.add_done_callback(lambda _: self._forget_pending(url, task))
+        return await asyncio.shield(task)
+
+    def _forget_pending(self, url: str, task: asyncio.Task) -> None:
+        if self._pending.get(url) is task:
+            del self._pending[url]
+
+    async def download_many(
+        self, urls: list[str], return_exceptions: bool = False
+    ) -> list[Path | BaseException]:
+        """
+        .. versionadded :: 0.5
+
+        Downloads many files concurrently, at most `max_concurrent` at a time.
+
+        Parameters
+        ----------
+        urls : list[str]
+            The urls of the files.
+        return_exceptions : bool, optional
+            Whether failed downloads are returned as exceptions instead of raised, by default False
+
+        Returns
+        -------
+        list[:class:`Path` | :class:`BaseException`]
+            The paths of the files in the same order as `urls`.
+        """
+        return await asyncio.gather(
+            *(self.download(url) for url in urls),
+            return_exceptions=return_exceptions,
+        )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphores[loop]
+
+    async def _download(self, url: str) -> Path:
+        async with self._semaphore():
+            _log.info(f"Downloading {url}")
+
+            temp_directory = self.directory / "tmp"
+            temp_directory.mkdir(parents=True, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=temp_directory)
+
+            sha256 = hashlib.sha256()
+            api_client = _APIClient()
+            try:
+                with os.fdopen(file_descriptor, "wb") as file:
+                    async with api_client.session.get(url) as resp:
+                        if resp.status >= 400:
+                            raise ResponseCodeError(
+                                response=resp, response_text=await resp.text()
+                            )
+                        async for chunk in resp.content.iter_chunked(_CHUNK_SIZE):
+                            sha256.update(chunk)
+                            file.write(chunk)
+
+                path = self._object_path(sha256.hexdigest())
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(temp_path, path)
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+            finally:
+                await api_client.close()
+
+            self._write_index(url, sha256.hexdigest())
+
+        return path
+
+    def _write_index(self, url: str, content_hash: str) -> None:
+        index_path = self._index_path(url)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = index_path.with_suffix(".tmp")
+        temp_path.write_text(content_hash)
+        os.replace(temp_path, index_path)
+
+
+_default_manager: DownloadManager | None = None
+
+
+def _get_default_manager() -> DownloadManager:
+    global _default_manager
+
+    if _default_manager is None or _default_manager.directory != Path(
+        Client.DOWNLOAD_DIRECTORY
+    ):
+        _default_manager = DownloadManager()
+
+    return _default_manager
@@ -7,6 +7,7 @@ __all__ = (
     "InvalidIDError",
     "InvalidTrophyNumber",
     "InvalidTOTDDate",
+    "InvalidGbxFile",
 )
 
 
@@ -93,3 +94,15 @@ class InvalidTMXCode(TMXException):
             message = None
 
         super().__init__(message)
+
+
+class InvalidGbxFile(TrackmaniaException):
+    """Raised when a file is not a valid GBX file or is missing the needed header chunks."""
+
+    def __init__(self, *args):
+        if args:
+            message = args[0]
+        else:
+            message = None
+
+        super().__init__(message)
@@ -1,13 +1,18 @@
 import logging
+from collections.abc import Iterator
 from contextlib import suppress
 from datetime import datetime
 
 from typing_extensions import Self
 
+from ._identity import _intern
+from ._names import _NAME_INDEX
+from ._pages import _locate_by_score
+from ._store import _ResultStore, _sync
 from ._util import _frmt_str_to_datetime, _regex_it
 from .api import _APIClient
 from .base import MatchmakingObject
-from .config import get_from_cache, set_in_cache
+from .config import _cache_key, get_from_cache, set_in_cache
 from .constants import _TMIO
 from .errors import InvalidIDError, TMIOException
 
@@ -20,18 +25,10 @@ __all__ = (
 )
 
 
-async def _get_history(player_id: str, type_id: int, page: int) -> list[dict]:
+async def _fetch_history(player_id: str, type_id: int, page: int) -> dict:
     if player_id is None:
         raise InvalidIDError("Player ID is not set.")
 
-    _log.debug("Getting matchmaking history for player %s and page %d", player_id, page)
-
-    matchmaking_history = get_from_cache(
-        f"matchmaking_history:{page}:{type_id}:{player_id}"
-    )
-    if matchmaking_history is not None:
-        return matchmaking_history.get("matches")
-
     api_client = _APIClient()
     match_history = await api_client.get(
         _TMIO.build(
@@ -49,13 +46,32 @@ async def _get_history(player_id: str, type_id: int, page: int) -> list[dict]:
     with suppress(KeyError, TypeError):
         raise TMIOException(match_history["error"])
 
+    return match_history
+
+
+async def _get_history(player_id: str, type_id: int, page: int) -> list[dict]:
+    _log.debug("Getting matchmaking history for player %s and page %d", player_id, page)
+
+    matchmaking_history = get_from_cache(
+        _cache_key("matchmaking_history", player_id, type_id, page)
+    )
+    if matchmaking_history is not None:
+        return matchmaking_history.get("matches")
+
+    match_history = await _fetch_history(player_id, type_id, page)
+
     set_in_cache(
-        f"matchmaking_history:{page}:{type_id}:{player_id}", match_history, ex=3600
+        _cache_key("matchmaking_history", player_id, type_id, page),
+        match_history,
+        ex=3600,
     )
 
     return match_history.get("matches", [])
 
 
+_HISTORY_STORE = _ResultStore("matchmaking_results")
+
+
 class MatchmakingLeaderboardPlayer(MatchmakingObject):
     """
     Represents a player on the Matchmaking leaderboards.
@@ -74,6 +90,9 @@ class MatchmakingLeaderboardPlayer(MatchmakingObject):
         The score of the player.
     progression : int
         The progression of the player.
+    zones : :class:`list[PlayerZone]` | None
+        .. versionadded :: 0.5
+        The zones of the player, None if the data has no zone.
     """
 
     def __init__(
@@ -85,6 +104,7 @@ class MatchmakingLeaderboardPlayer(MatchmakingObject):
         score: int,
         progression: int,
         division: int,
+        zones: list | None = None,
     ):
         self.player_name = player_name
         self.player_tag = player_tag
@@ -93,16 +113,25 @@ class MatchmakingLeaderboardPlayer(MatchmakingObject):
         self.score = score
         self.progression = progression
         self.division = division
+        self.zones = zones
 
     @classmethod
     def _from_dict(cls: Self, raw_data: dict) -> Self:
-        player_name = raw_data["player"].get("name")
-        player_tag = _regex_it(raw_data["player"].get("tag", None))
-        player_id = raw_data["player"].get("id")
+        from .player import PlayerZone
+
+        player_name = _intern(raw_data["player"].get("name"))
+        player_tag = _intern(_regex_it(raw_data["player"].get("tag", None)))
+        player_id = _intern(raw_data["player"].get("id"))
+        _NAME_INDEX.add(player_id, player_name)
         rank = raw_data.get("rank")
         score = raw_data.get("score")
         progression = raw_data.get("progression")
         division = raw_data.get("division")
+        zones = (
+            PlayerZone._parse_zones(raw_data["player"]["zone"])
+            if "zone" in raw_data["player"]
+            else None
+        )
 
         args = [
             player_name,
@@ -112,6 +141,7 @@ class MatchmakingLeaderboardPlayer(MatchmakingObject):
             score,
             progression,
             division,
+            zones,
         ]
 
         return cls(*args)
@@ -130,18 +160,13 @@ class MatchmakingLeaderboardPlayer(MatchmakingObject):
         return await Player.get_player(self.player_id)
 
 
-async def _get_top_matchmaking(
-    page: int = 0, royal: bool = False
-) -> list[MatchmakingLeaderboardPlayer]:
+async def _get_top_matchmaking_page(page: int, royal: bool) -> dict:
     _log.debug(f"Getting top matchmaking players page {page}. Royal? {royal}")
-    tops = []
+    type_id = _TMIO.TABS.ROYAL_ID if royal else _TMIO.TABS.MATCHMAKING_ID
 
-    top_matchmaking_data = get_from_cache(f"top_matchmaking:{page}:{royal}")
+    top_matchmaking_data = get_from_cache(_cache_key("top_matchmaking", type_id, page))
     if top_matchmaking_data is not None:
-        for pos in top_matchmaking_data.get("ranks", []):
-            tops.append(MatchmakingLeaderboardPlayer._from_dict(pos))
-
-        return tops
+        return top_matchmaking_data
 
     api_client = _APIClient()
 
@@ -159,9 +184,18 @@ async def _get_top_matchmaking(
     with suppress(KeyError, TypeError):
         raise TMIOException(match_history["error"])
 
-    set_in_cache(f"top_matchmaking:{page}:{royal}", match_history, ex=3600)
+    set_in_cache(_cache_key("top_matchmaking", type_id, page), match_history, ex=3600)
+
+    return match_history
+
+
+async def _get_top_matchmaking(
+    page: int = 0, royal: bool = False
+) -> list[MatchmakingLeaderboardPlayer]:
+    top_matchmaking_data = await _get_top_matchmaking_page(page, royal)
 
-    for pos in match_history.get("ranks", []):
+    tops = []
+    for pos in top_matchmaking_data.get("ranks", []):
         tops.append(MatchmakingLeaderboardPlayer._from_dict(pos))
 
     return tops
@@ -438,6 +472,67 @@ class PlayerMatchmaking(MatchmakingObject):
 
         return match_results
 
+    async def sync_history(self) -> int:
+        """
+        .. versionadded :: 0.5
+
+        Adds the player's new matches in this matchmaking to their stored history.
+        Pages are fetched from the newest on and syncing stops at the first match that is
+        already stored, so keeping a history current usually costs one request.
+
+        Returns
+        -------
+        int
+            The number of new matches stored, 0 if the cache is unavailable.
+
+        Raises
+        ------
+        :class:`InvalidIDError`
+            If the player_id is not set.
+        """
+
+        async def get_page(page: int) -> list[dict]:
+            match_history = await _fetch_history(self.player_id, self.type_id, page)
+            return match_history.get("matches") or []
+
+        return await _sync(
+            _HISTORY_STORE,
+            (self.player_id, self.type_id),
+            get_page,
+            lambda match: match["lid"],
+        )
+
+    def stored_history(
+        self, chunk_size: int = 100
+    ) -> Iterator[PlayerMatchmakingResult]:
+        """
+        .. versionadded :: 0.5
+
+        Iterates over the player's stored history in this matchmaking, see
+        :meth:`PlayerMatchmaking.sync_history`. Matches are read from cache `chunk_size` at a
+        time, so memory use does not grow with the length of the history.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The number of matches read at a time, by default 100
+
+        Yields
+        ------
+        :class:`PlayerMatchmakingResult`
+            The matches, newest first.
+
+        Raises
+        ------
+        :class:`InvalidIDError`
+            If the player_id is not set.
+        """
+        if self.player_id is None:
+            raise InvalidIDError("Player ID is not set.")
+
+        for match in _HISTORY_STORE.iterate((self.player_id, self.type_id), chunk_size):
+            yield PlayerMatchmakingResult._from_dict(match, self.player_id)
+
     @staticmethod
     async def top_matchmaking(
         page: int = 0, royal: bool = False
@@ -460,3 +555,39 @@ class PlayerMatchmaking(MatchmakingObject):
             The top matchmaking players by score. Each page contains 50 players.
         """
         return await _get_top_matchmaking(page, royal)
+
+    @staticmethod
+    async def locate_by_score(
+        score: int, royal: bool = False
+    ) -> tuple[int, int] | None:
+        """
+        .. versionadded :: 0.5
+
+        Finds the page of :meth:`PlayerMatchmaking.top_matchmaking` a matchmaking score lands on
+        and the rank it would have, requesting O(log pages) pages instead of walking them from 0.
+
+        Parameters
+        ----------
+        score : int
+            The matchmaking score.
+        royal : bool, optional
+            Whether to search the royal leaderboard instead of 3v3, by default False
+
+        Returns
+        -------
+        tuple[int, int] | None
+            The page and the rank of the first player with a score lower than or equal to `score`.
+            None if every player on the leaderboard has a higher score.
+        """
+
+        async def get_page(page: int) -> list[tuple[int, int]]:
+            top_matchmaking_data = await _get_top_matchmaking_page(page, royal)
+            return [
+                (rank.get("score"), rank.get("rank"))
+                for rank in top_matchmaking_data.get("ranks", [])
+            ]
+
+        type_id = _TMIO.TABS.ROYAL_ID if royal else _TMIO.TABS.MATCHMAKING_ID
+        return await _locate_by_score(
+            score, get_page, _cache_key("top_matchmaking_bounds", type_id), ex=3600
+        )
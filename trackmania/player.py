@@ -1,13 +1,18 @@
 import logging
+import sys
 from contextlib import suppress
 from datetime import datetime
+from functools import cached_property
 
 from typing_extensions import Self
 
+from ._batch import _DataLoader
+from ._identity import _get_shared, _intern, _share
+from ._names import _NAME_INDEX
 from ._util import _frmt_str_to_datetime, _regex_it
 from .api import _APIClient
 from .base import PlayerObject
-from .config import get_from_cache, set_in_cache
+from .config import _cache_key, get_from_cache, set_in_cache
 from .constants import _TMIO
 from .errors import TMIOException
 from .matchmaking import PlayerMatchmaking
@@ -17,6 +22,7 @@ _log = logging.getLogger(__name__)
 
 __all__ = (
     "PlayerMetaInfo",
+    "ZoneNode",
     "PlayerZone",
     "PlayerSearchResult",
     "PlayerMatchmaking",
@@ -24,6 +30,22 @@ __all__ = (
 )
 
 
+async def _fetch_player(player_id: str, api_client: _APIClient) -> dict:
+    player_data = await api_client.get(_TMIO.build([_TMIO.TABS.PLAYER, player_id]))
+
+    with suppress(KeyError, TypeError):
+        raise TMIOException(player_data["error"])
+
+    _NAME_INDEX.add(player_id, player_data["displayname"])
+
+    return player_data
+
+
+_PLAYER_LOADER = _DataLoader(
+    lambda player_id: _cache_key("player", player_id), _fetch_player, ex=21600
+)
+
+
 class PlayerMetaInfo(PlayerObject):
     """
     .. versionadded :: 0.1.0
@@ -113,9 +135,77 @@ class PlayerMetaInfo(PlayerObject):
         )
 
 
+class ZoneNode(PlayerObject):
+    """
+    .. versionadded :: 0.5
+
+    A zone in the zone hierarchy, e.g. a region, country or continent.
+    There is one canonical node per zone, every player in the zone shares it.
+
+    Parameters
+    ----------
+    flag : str
+        The flag of the zone
+    name : str
+        The zone name
+    parent : :class:`ZoneNode` | None
+        The zone this zone is part of, None for `World`.
+    """
+
+    def __init__(self, flag: str, name: str, parent: Self | None):
+        self.flag = flag
+        self.name = name
+        self.parent = parent
+        self._unranked = _UnrankedZone(self)
+
+    def __repr__(self) -> str:
+        return f"<ZoneNode name={self.name!r} flag={self.flag!r}>"
+
+    @property
+    def path(self) -> list[Self]:
+        """
+        The zone followed by every zone it is part of, up to `World`.
+
+        Returns
+        -------
+        :class:`list[ZoneNode]`
+            The zones, smallest first.
+        """
+        path = []
+        node = self
+        while node is not None:
+            path.append(node)
+            node = node.parent
+        return path
+
+    @classmethod
+    def _from_dict(cls: Self, zone: dict | None) -> Self | None:
+        chain = []
+        while zone is not None and "name" in zone:
+            chain.append((zone.get("flag") or "", zone["name"]))
+            zone = zone.get("parent")
+
+        node = None
+        for flag, name in reversed(chain):
+            key = (flag, name, node)
+            child = _ZONE_NODES.get(key)
+            if child is None:
+                child = _ZONE_NODES[key] = cls(sys.intern(flag), sys.intern(name), node)
+            node = child
+
+        return node
+
+
+# Canonical zone nodes by (flag, name, parent), there are only a few thousand zones.
+_ZONE_NODES: dict[tuple[str, str, ZoneNode | None], ZoneNode] = {}
+
+
 class PlayerZone(PlayerObject):
     """
     .. versionadded :: 0.1.0
+    .. versionchanged :: 0.5
+        Parsed zones point to their shared :class:`ZoneNode`.
+        `rank` is None when the data has no rank instead of 0.
 
     Class that represents the player zone
 
@@ -125,20 +215,35 @@ class PlayerZone(PlayerObject):
         The flag of the zone
     zone : str
         The zone name
-    rank : int
-        The rank of the player in the zone
+    rank : int | None
+        The rank of the player in the zone, None if unknown
+    node : :class:`ZoneNode` | None
+        The zone in the zone hierarchy, None if the zone was not parsed from the API.
     """
 
-    def __init__(self, flag: str, zone: str, rank: int):
+    def __init__(self, flag: str, zone: str, rank: int | None = None):
         """Constructor method."""
         self.flag = flag
         self.zone = zone
         self.rank = rank
+        self.node: ZoneNode | None = None
+
+    @classmethod
+    def _from_node(cls: Self, node: ZoneNode, rank: int | None = None) -> Self:
+        player_zone = cls(node.flag, node.name, rank)
+        player_zone.node = node
+        return player_zone
 
     @classmethod
-    def _parse_zones(cls: Self, zones: dict, zone_positions: list[int]) -> list[Self]:
+    def _parse_zones(
+        cls: Self, zones: dict, zone_positions: list[int] | None = None
+    ) -> list[Self]:
         """
           .. versionadded :: 0.1.0
+          .. versionchanged :: 0.5
+            Zones are looked up in the shared zone tree. Without positions the shared unranked
+            :class:`PlayerZone` of every node is returned, so no zone objects are created. These
+            cannot be changed.
 
         Parses the Data from the API into a list of PlayerZone objects.
 
@@ -146,30 +251,22 @@ class PlayerZone(PlayerObject):
          ----------
          zones : :class:`dict`
              the zones data from the API.
-         zone_positions : :class:`list[int]`
-             The zone positions data from the API.
+         zone_positions : :class:`list[int]` | None
+             The zone positions data from the API, None if there are none.
          Returns
          -------
          class:`list[PlayerZone]`
              The list of :class:`PlayerZone` objects.
         """
-        _log.debug("Parsing Zones")
-        player_zone_list: list = []
-        i: int = 0
-
-        while "name" in zones:
-            _log.debug(f"Gone {i} Levels Deep")
-            player_zone_list.append(
-                cls(zones["flag"], zones["name"], zone_positions[i])
-            )
-            i += 1
-
-            if "parent" in zones:
-                zones = zones["parent"]
-            else:
-                break
+        node = ZoneNode._from_dict(zones)
+        if node is None:
+            return []
 
-        return player_zone_list
+        if zone_positions is None:
+            return [zone._unranked for zone in node.path]
+        return [
+            cls._from_node(zone, rank) for zone, rank in zip(node.path, zone_positions)
+        ]
 
     @staticmethod
     def to_string(
@@ -204,20 +301,49 @@ class PlayerZone(PlayerObject):
         if not inline:
             if add_pos:
                 for zone in player_zones:
-                    zone_str = zone_str + zone.zone + " - " + str(zone.rank) + "\n"
+                    zone_str = zone_str + PlayerZone._zone_str(zone) + "\n"
             else:
                 for zone in player_zones:
                     zone_str = zone_str + zone.zone + "\n"
         else:
             if add_pos:
                 zone_str = ", ".join(
-                    f"{zone.zone} - {zone.rank}" for zone in player_zones
+                    PlayerZone._zone_str(zone) for zone in player_zones
                 )
             else:
                 zone_str = ", ".join(zone.zone for zone in player_zones)
 
         return zone_str
 
+    @staticmethod
+    def _zone_str(zone: Self) -> str:
+        if zone.rank is None:
+            return zone.zone
+        return f"{zone.zone} - {zone.rank}"
+
+
+class _UnrankedZone(PlayerZone):
+    """The unranked zone of a :class:`ZoneNode`, every unranked player in the zone shares it."""
+
+    def __init__(self, node: ZoneNode):
+        for name, value in (
+            ("flag", node.flag),
+            ("zone", node.name),
+            ("rank", None),
+            ("node", node),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(
+            f"The unranked zone of {self.zone} is shared and cannot be changed"
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"The unranked zone of {self.zone} is shared and cannot be changed"
+        )
+
 
 class PlayerSearchResult(PlayerObject):
     """
@@ -262,13 +388,14 @@ class PlayerSearchResult(PlayerObject):
         _log.debug("Creating a PlayerSearchResult class from given dictionary")
 
         zone = (
-            PlayerZone._parse_zones(player_data["player"]["zone"], [0, 0, 0, 0, 0])
+            PlayerZone._parse_zones(player_data["player"]["zone"])
             if "zone" in player_data["player"]
             else None
         )
-        club_tag = _regex_it(player_data.get("player").get("club_tag", None))
-        name = _regex_it(player_data.get("player").get("name"))
-        player_id = player_data.get("player").get("id")
+        club_tag = _intern(_regex_it(player_data.get("player").get("club_tag", None)))
+        name = _intern(_regex_it(player_data.get("player").get("name")))
+        player_id = _intern(player_data.get("player").get("id"))
+        _NAME_INDEX.add(player_id, name)
         matchmaking = PlayerMatchmaking._from_dict(
             player_data.get("matchmaking"), player_id
         )
@@ -304,6 +431,10 @@ class Player(PlayerObject):
         The 3v3 data of the player.
     royal_data : :class:`PlayerMatchmaking`, optional
         The royal data of the player.
+    raw_data : :class:`dict`, optional
+        .. versionadded :: 0.5
+        The raw player data from the API. `trophies`, `zone`, `m3v3_data` and `royal_data` that are
+        not given are parsed from it the first time they are accessed.
     """
 
     def __init__(
@@ -318,6 +449,7 @@ class Player(PlayerObject):
         zone: list[PlayerZone] | None = None,
         m3v3_data: PlayerMatchmaking | None = None,
         royal_data: PlayerMatchmaking | None = None,
+        raw_data: dict | None = None,
     ):
         """Constructor of the class."""
         self.club_tag = club_tag
@@ -326,10 +458,17 @@ class Player(PlayerObject):
         self.last_club_tag_change = last_club_tag_change
         self.meta = meta
         self.name = name
-        self.trophies = trophies
-        self.zone = zone
-        self.m3v3_data = m3v3_data
-        self.royal_data = royal_data
+        self._raw_data = raw_data if raw_data is not None else {}
+
+        # Anything not given explicitly is left to the lazy properties below.
+        if trophies is not None or raw_data is None:
+            self.trophies = trophies
+        if zone is not None or raw_data is None:
+            self.zone = zone
+        if m3v3_data is not None or raw_data is None:
+            self.m3v3_data = m3v3_data
+        if royal_data is not None or raw_data is None:
+            self.royal_data = royal_data
 
     def __str__(self) -> str:
         """String representation of the class."""
@@ -345,10 +484,73 @@ class Player(PlayerObject):
         """player id property."""
         return self._id
 
+    @cached_property
+    def trophies(self) -> PlayerTrophies | None:
+        """
+        .. versionadded :: 0.5
+
+        The trophies of the player, parsed on first access.
+
+        Returns
+        -------
+        :class:`PlayerTrophies` | None
+            The trophies of the player.
+        """
+        return Player._parse_trophies(self._raw_data)
+
+    @cached_property
+    def zone(self) -> list[PlayerZone] | bool:
+        """
+        .. versionadded :: 0.5
+
+        The zone of the player as a list, parsed on first access.
+
+        Returns
+        -------
+        :class:`list[PlayerZone]` | bool
+            The zones of the player, False if the player data has no zones.
+        """
+        return Player._parse_zone(self._raw_data)
+
+    @cached_property
+    def _matchmaking(self) -> list[PlayerMatchmaking | None]:
+        return Player._parse_matchmaking(self._raw_data)
+
+    @cached_property
+    def m3v3_data(self) -> PlayerMatchmaking | None:
+        """
+        .. versionadded :: 0.5
+
+        The 3v3 data of the player, parsed on first access.
+
+        Returns
+        -------
+        :class:`PlayerMatchmaking` | None
+            The 3v3 data of the player.
+        """
+        return self._matchmaking[0]
+
+    @cached_property
+    def royal_data(self) -> PlayerMatchmaking | None:
+        """
+        .. versionadded :: 0.5
+
+        The royal data of the player, parsed on first access.
+
+        Returns
+        -------
+        :class:`PlayerMatchmaking` | None
+            The royal data of the player.
+        """
+        return self._matchmaking[1]
+
     @classmethod
     async def get_player(cls: Self, player_id: str) -> Self:
         """
         .. versionadded :: 0.1.0
+        .. versionchanged :: 0.5
+            Players requested during the same event loop iteration are loaded in one batch.
+            Returns the live instance of the player if :attr:`Client.IDENTITY_MAP` is enabled.
 
         Gets a player's data from their player_id
 
@@ -359,21 +561,12 @@ class Player(PlayerObject):
         """
         _log.debug(f"Getting {player_id}'s data")
 
-        player_data = get_from_cache(f"player:{player_id}")
-        if player_data is not None:
-            return cls(**Player._parse_player(player_data))
+        player = _get_shared(cls, player_id)
+        if player is not None:
+            return player
 
-        api_client = _APIClient()
-        player_data = await api_client.get(_TMIO.build([_TMIO.TABS.PLAYER, player_id]))
-        await api_client.close()
-
-        with suppress(KeyError, TypeError):
-            raise TMIOException(player_data["error"])
-
-        set_in_cache(f"player:{player_id}", player_data, ex=21600)
-        set_in_cache(f"{player_data['displayname'].lower()}:id", player_id)
-
-        return cls(**Player._parse_player(player_data))
+        player_data = await _PLAYER_LOADER.load(player_id)
+        return _share(cls, player_id, cls(**Player._parse_player(player_data)))
 
     @staticmethod
     async def search(
@@ -419,12 +612,89 @@ class Player(PlayerObject):
 
         return players
 
+    async def records(
+        self,
+        map_uids: list[str],
+        max_depth: int = 1000,
+        return_exceptions: bool = False,
+    ) -> dict:
+        """
+        .. versionadded :: 0.5
+
+        Gets the player's record on many maps. See :meth:`TMMap.get_player_records`.
+
+        Parameters
+        ----------
+        map_uids : list[str]
+            The uids of the maps.
+        max_depth : int, optional
+            How deep into a leaderboard to look for the player, by default 1000
+        return_exceptions : bool, optional
+            Whether the maps whose leaderboard could not be searched hold the exception instead
+            of it being raised, by default False
+
+        Returns
+        -------
+        dict[str, :class:`PlayerRecord` | :class:`BaseException` | None]
+            The records by map uid.
+        """
+        from .tmmap import TMMap
+
+        return await TMMap.get_player_records(
+            self.player_id, map_uids, max_depth, return_exceptions
+        )
+
+    @staticmethod
+    async def autocomplete(
+        query: str, limit: int = 10, min_score: float = 0.6
+    ) -> list[PlayerSearchResult]:
+        """
+        .. versionadded :: 0.5
+
+        Suggests players whose names match a partial name.
+        Names the library has already seen are searched locally first, :meth:`Player.search` is
+        only used when no local name scores at least `min_score`, and its results are indexed for
+        the next queries.
+
+        Parameters
+        ----------
+        query : str
+            The partial name to search for.
+        limit : int, optional
+            The maximum number of suggestions, by default 10
+        min_score : float, optional
+            The similarity between 0 and 1 the best local match needs to skip the remote search.
+            1 is an exact match, names starting with the query score at least 0.5. By default 0.6
+
+        Returns
+        -------
+        :class:`list[PlayerSearchResult]`
+            The suggestions, best match first. Players only known locally have just their name and id.
+        """
+        _log.debug(f"Autocompleting {query}")
+
+        matches = _NAME_INDEX.search(query, limit)
+        remote_results = {}
+        if len(query) > 0 and (len(matches) == 0 or matches[0][2] < min_score):
+            remote_results = {
+                player.player_id: player for player in await Player.search(query)
+            }
+            matches = _NAME_INDEX.search(query, limit)
+
+        return [
+            remote_results.get(player_id)
+            or PlayerSearchResult(None, name, player_id, None, None, None)
+            for player_id, name, _ in matches
+        ]
+
     @staticmethod
     async def get_id(username: str) -> str:
         """
         .. versionadded :: 0.1.0
         .. versionadded :: 0.3.4
             Updated to work with the change in `search` function
+        .. versionchanged :: 0.5
+            Names seen in any parsed data are answered without a request.
 
         Gets a player's id from the given username
 
@@ -440,13 +710,22 @@ class Player(PlayerObject):
         """
         _log.debug(f"Getting {username}'s id")
 
-        player_id = get_from_cache(f"{username.lower()}:id")
+        player_id = _NAME_INDEX.get_id(username)
+        if player_id is not None:
+            return player_id
+
+        player_id = get_from_cache(_cache_key("player_id", username.lower()))
         if player_id is not None:
             return player_id
 
         players = await Player.search(username)
 
-        set_in_cache(f"{username.lower()}:id", players[0].player_id)
+        # Every search result is indexed, prefer an exact match over the first result.
+        player_id = _NAME_INDEX.get_id(username)
+        if player_id is not None:
+            return player_id
+
+        set_in_cache(_cache_key("player_id", username.lower()), players[0].player_id)
 
         return players[0].player_id
 
@@ -454,6 +733,8 @@ class Player(PlayerObject):
     async def get_username(player_id: str) -> str:
         """
         .. versionadded :: 0.1.0
+        .. versionchanged :: 0.5
+            Ids seen in any parsed data are answered without a request.
 
         Gets a player's username from their player id
 
@@ -469,13 +750,15 @@ class Player(PlayerObject):
         """
         _log.debug(f"Getting the username for {player_id}")
 
-        player_username = get_from_cache(f"{player_id}:username")
+        player_username = _NAME_INDEX.get_name(player_id)
         if player_username is not None:
             return player_username
 
-        player: Player = await Player.get_player(player_id)
+        player_username = get_from_cache(_cache_key("player_username", player_id))
+        if player_username is not None:
+            return player_username
 
-        set_in_cache(f"{player_id}:username", player.name)
+        player: Player = await Player.get_player(player_id)
 
         return player.name
 
@@ -485,6 +768,9 @@ class Player(PlayerObject):
         .. versionadded :: 0.1.0
         .. versionchanged :: 0.4.0
             Optimized everything!
+        .. versionchanged :: 0.5
+            Trophies, zones and matchmaking data are no longer parsed here, they are parsed lazily
+            from `raw_data` by the :class:`Player` properties.
 
         Parses the player data
 
@@ -513,38 +799,6 @@ class Player(PlayerObject):
         else:
             player_meta = PlayerMetaInfo._from_dict(dict())
 
-        # Parsing Trophies
-        player_trophies = player_data.get("trophies")
-        if player_trophies is not None:
-            player_trophies = PlayerTrophies._from_dict(
-                player_trophies,
-                player_data.get("accountid", player_data.get("player_id")),
-            )
-
-        # Parsing Zones
-        if (
-            player_trophies is not None
-            and player_data.get("trophies").get("zone") is not None
-        ):
-            player_zone = PlayerZone._parse_zones(
-                player_data.get("trophies").get("zone"),
-                player_data.get("trophies").get("zonepositions"),
-            )
-        else:
-            player_zone = False
-
-        # Parsing player id
-        player_id = player_data.get(
-            "accountid", player_data.get("id", player_data.get("playerid", None))
-        )
-
-        # Parsing Matchmaking
-        matchmaking = (
-            PlayerMatchmaking._from_dict(player_data["matchmaking"], player_id)
-            if "matchmaking" in player_data
-            else [None, None]
-        )
-
         # Parsing Club Tag
         club_tag = player_data.get("clubtag", player_data.get("tag", None))
         club_tag = _regex_it(club_tag)
@@ -552,6 +806,8 @@ class Player(PlayerObject):
         # Parsing Name
         name = player_data.get("displayname", player_data.get("name", None))
         name = _regex_it(name)
+        player_id = Player._parse_id(player_data)
+        _NAME_INDEX.add(player_id, name)
 
         return {
             "club_tag": club_tag,
@@ -560,8 +816,41 @@ class Player(PlayerObject):
             "player_id": player_id,
             "last_club_tag_change": last_club_tag_change,
             "meta": player_meta,
-            "trophies": player_trophies,
-            "zone": player_zone,
-            "m3v3_data": matchmaking[0],
-            "royal_data": matchmaking[1],
+            "raw_data": player_data,
         }
+
+    @staticmethod
+    def _parse_id(player_data: dict) -> str | None:
+        return player_data.get(
+            "accountid", player_data.get("id", player_data.get("playerid", None))
+        )
+
+    @staticmethod
+    def _parse_trophies(player_data: dict) -> PlayerTrophies | None:
+        player_trophies = player_data.get("trophies")
+        if player_trophies is None:
+            return None
+
+        return PlayerTrophies._from_dict(
+            player_trophies,
+            player_data.get("accountid", player_data.get("player_id")),
+        )
+
+    @staticmethod
+    def _parse_zone(player_data: dict) -> list[PlayerZone] | bool:
+        player_trophies = player_data.get("trophies")
+        if player_trophies is None or player_trophies.get("zone") is None:
+            return False
+
+        return PlayerZone._parse_zones(
+            player_trophies.get("zone"), player_trophies.get("zonepositions")
+        )
+
+    @staticmethod
+    def _parse_matchmaking(player_data: dict) -> list[PlayerMatchmaking | None]:
+        if "matchmaking" not in player_data:
+            return [None, None]
+
+        return PlayerMatchmaking._from_dict(
+            player_data["matchmaking"], Player._parse_id(player_data)
+        )
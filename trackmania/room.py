@@ -5,11 +5,12 @@ from typing_extensions import Self
 
 from trackmania.errors import TMIOException
 
+from ._batch import _get_many
 from ._util import _regex_it
 from .api import _APIClient
 from .base import RoomObject
 from .club import Club
-from .config import get_from_cache, set_in_cache
+from .config import _cache_key, get_from_cache, set_in_cache
 from .constants import _TMIO
 from .tmmap import TMMap
 
@@ -21,6 +22,16 @@ __all__ = (
 )
 
 
+async def _fetch_room(ids: tuple[int, int], api_client: _APIClient) -> dict:
+    club_id, room_id = ids
+    room_data = await api_client.get(_TMIO.build([_TMIO.TABS.ROOM, club_id, room_id]))
+
+    with suppress(KeyError, TypeError):
+        raise TMIOException(room_data["error"])
+
+    return room_data
+
+
 class RoomSearchResult(RoomObject):
     """
     .. versionadded :: 0.5
@@ -142,7 +153,7 @@ class Room(RoomObject):
         region: str,
         script: str,
         image_url: str,
-        maps: list[TMMap],
+        maps: list[TMMap] | list[dict],
     ):
         self.room_id = room_id
         self.club_id = club_id
@@ -161,13 +172,17 @@ class Room(RoomObject):
         """
         .. versionadded :: 0.5
 
-        The maps of the room.
+        The maps of the room, parsed on first access.
 
         Returns
         -------
         :class:`list[TMMap]`
             The maps of the room.
         """
+        for index, map_data in enumerate(self._maps):
+            if not isinstance(map_data, TMMap):
+                self._maps[index] = TMMap._from_dict(map_data)
+
         return self._maps
 
     @classmethod
@@ -182,10 +197,7 @@ class Room(RoomObject):
         region = raw_data.get("region", "")
         script = raw_data.get("script")
         image_url = raw_data.get("mediaurl")
-        maps = []
-
-        for map in raw_data.get("maps", []):
-            maps.append(TMMap._from_dict(map))
+        maps = list(raw_data.get("maps", []))
 
         args = [
             room_id,
@@ -222,23 +234,65 @@ class Room(RoomObject):
         :class:`Room`
             The room.
         """
-        club_data = get_from_cache(f"room:{club_id}:{room_id}")
+        club_data = get_from_cache(_cache_key("room", club_id, room_id))
         if club_data is not None:
             return cls._from_dict(club_data)
 
-        api_client = _APIClient()
-        club_data = await api_client.get(
-            _TMIO.build([_TMIO.TABS.ROOM, club_id, room_id])
-        )
-        await api_client.close()
-
-        with suppress(KeyError, TypeError):
-            raise TMIOException(club_data["error"])
+        async with _APIClient() as api_client:
+            club_data = await _fetch_room((club_id, room_id), api_client)
 
-        set_in_cache(f"room:{club_id}:{room_id}", club_data)
+        set_in_cache(_cache_key("room", club_id, room_id), club_data, ex=3600)
 
         return cls._from_dict(club_data)
 
+    @classmethod
+    async def get_many(
+        cls: Self,
+        rooms: list[tuple[int, int]],
+        max_concurrent: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Self | Exception]:
+        """
+        .. versionadded :: 0.5
+
+        Gets many rooms using their club and room ids.
+        Cached rooms are read in one batch and the rest are fetched concurrently over one session.
+
+        Parameters
+        ----------
+        rooms : list[tuple[int, int]]
+            The `(club_id, room_id)` pairs of the rooms.
+        max_concurrent : int | None, optional
+            The maximum number of rooms fetched at the same time, by default :attr:`Client.MAX_CONCURRENT_REQUESTS`
+        return_exceptions : bool, optional
+            Whether a room that could not be fetched gets its error in place instead of it being raised, by default False
+
+        Returns
+        -------
+        :class:`list[Room | Exception]`
+            The rooms in the same order as `rooms`.
+
+        Raises
+        ------
+        :class:`TMIOException`
+            If a room doesn't exist and `return_exceptions` is False.
+        """
+        rooms_data = await _get_many(
+            [tuple(ids) for ids in rooms],
+            lambda ids: _cache_key("room", *ids),
+            _fetch_room,
+            ex=3600,
+            max_concurrent=max_concurrent,
+            return_exceptions=return_exceptions,
+        )
+
+        return [
+            room_data
+            if isinstance(room_data, BaseException)
+            else cls._from_dict(room_data)
+            for room_data in rooms_data
+        ]
+
     @staticmethod
     async def popular_rooms(page: int = 0) -> list[RoomSearchResult]:
         """
@@ -258,7 +312,7 @@ class Room(RoomObject):
             The popular rooms.
         """
         popular_rooms = []
-        popular_rooms_data = get_from_cache(f"popular_rooms:{page}")
+        popular_rooms_data = get_from_cache(_cache_key("rooms", page))
 
         if popular_rooms_data is not None:
             for room in popular_rooms_data.get("rooms", []):
@@ -273,7 +327,7 @@ class Room(RoomObject):
         with suppress(KeyError, TypeError):
             raise TMIOException(popular_rooms_data["error"])
 
-        set_in_cache(f"popular_rooms:{page}", popular_rooms_data)
+        set_in_cache(_cache_key("rooms", page), popular_rooms_data, ex=3600)
 
         for room in popular_rooms_data.get("rooms", []):
             popular_rooms.append(RoomSearchResult._from_dict(room))
@@ -1,29 +1,129 @@
-import json
+import asyncio
+import copy
 import logging
+import math
+import os
+import time
+from collections.abc import AsyncIterator, Iterable
 from contextlib import suppress
 from datetime import datetime
+from pathlib import Path
 
+import aiohttp
 from typing_extensions import Self
 
 from trackmania.api import _APIClient
 
-from ._util import _frmt_str_to_datetime, _regex_it
-from .api import _APIClient
+from ._batch import _get_many
+from ._gbx import (
+    GHOST_CLASS_IDS,
+    MAP_INFO_CHUNK,
+    MAP_XML_CHUNK,
+    _int_or_none,
+    _parse_ghost,
+    _parse_medal_chunk,
+    _parse_xml_chunk,
+    _read_body,
+    _read_map_header,
+    _xml_attributes,
+)
+from ._identity import _get_shared, _intern, _share
+from ._names import _NAME_INDEX
+from ._util import _check_include, _frmt_str_to_datetime, _regex_it
+from .api import ResponseCodeError, _APIClient
 from .base import TMMapObject
-from .config import get_from_cache, set_in_cache
+from .config import (
+    _cache_key,
+    get_from_cache,
+    get_many_from_cache,
+    set_in_cache,
+    set_many_in_cache,
+)
 from .constants import _TMIO
-from .errors import TMIOException
-from .player import Player
+from .downloads import DownloadManager, _get_default_manager
+from .errors import InvalidGbxFile, TMIOException
+from .player import Player, PlayerZone
 
 _log = logging.getLogger(__name__)
 
 __all__ = (
     "MedalTimes",
     "Leaderboard",
+    "Ghost",
+    "GhostDownload",
+    "GhostBatch",
+    "PlayerRecord",
     "TMMap",
 )
 
 
+async def _get_leaderboard(
+    map_uid: str, offset: int, length: int, api_client: _APIClient | None = None
+) -> dict:
+    _log.debug(
+        f"Getting Leaderboard of the Map {map_uid} with Length {length} and offset {offset}"
+    )
+
+    leaderboard_data = get_from_cache(
+        _cache_key("map_leaderboard", map_uid, offset, length)
+    )
+    if leaderboard_data is not None:
+        return leaderboard_data
+
+    close_client = api_client is None
+    if close_client:
+        api_client = _APIClient()
+    leaderboard_data = await api_client.get(
+        _TMIO.build([_TMIO.TABS.LEADERBOARD, _TMIO.TABS.MAP, map_uid])
+        + f"?offset={offset}&length={length}"
+    )
+    if close_client:
+        await api_client.close()
+
+    with suppress(KeyError, TypeError):
+        raise TMIOException(leaderboard_data["error"])
+
+    set_in_cache(
+        _cache_key("map_leaderboard", map_uid, offset, length),
+        leaderboard_data,
+        ex=3600,
+    )
+
+    return leaderboard_data
+
+
+async def _find_in_leaderboard(
+    map_uid: str,
+    player_id: str,
+    index: dict,
+    max_depth: int,
+    api_client: _APIClient,
+) -> None:
+    """Extends `index` in place one page at a time until `player_id` is found."""
+    while (
+        player_id not in index["players"]
+        and not index["complete"]
+        and index["depth"] < max_depth
+    ):
+        page = await _get_leaderboard(map_uid, index["depth"], 100, api_client)
+        tops = page.get("tops", [])
+        for lb in tops:
+            with suppress(KeyError, TypeError):
+                index["players"][lb["player"]["id"]] = [lb["position"], lb["time"]]
+
+        index["depth"] += 100
+        index["complete"] = len(tops) < 100
+
+
+async def _fetch_map(map_uid: str, api_client: _APIClient) -> dict:
+    map_data = await api_client.get(_TMIO.build([_TMIO.TABS.MAP, map_uid]))
+
+    with suppress(KeyError, TypeError):
+        raise TMIOException(map_data["error"])
+
+    return map_data
+
+
 class MedalTimes(TMMapObject):
     """
     .. versionadded :: 0.3.0
@@ -60,6 +160,47 @@ class MedalTimes(TMMapObject):
         self.gold_string = self._parse_to_string(self.gold)
         self.author_string = self._parse_to_string(self.author)
 
+    @classmethod
+    def from_file(cls: Self, path: str | os.PathLike) -> Self:
+        """
+        .. versionadded :: 0.5
+
+        Reads the medal times straight from a local `.Map.Gbx` file.
+        Only the header of the file is read, not the map itself.
+
+        Parameters
+        ----------
+        path : str | :class:`os.PathLike`
+            The path of the map file.
+
+        Returns
+        -------
+        :class:`MedalTimes`
+            The medal times of the map.
+
+        Raises
+        ------
+        :class:`InvalidGbxFile`
+            If the file is not a map or its header has no medal times.
+        """
+        header = _read_map_header(path)
+
+        medal_times = None
+        if MAP_INFO_CHUNK in header.chunks:
+            medal_times = _parse_medal_chunk(header.chunks[MAP_INFO_CHUNK])
+        if medal_times is None and MAP_XML_CHUNK in header.chunks:
+            times = _xml_attributes(
+                _parse_xml_chunk(header.chunks[MAP_XML_CHUNK]), "times"
+            )
+            medal_times = tuple(
+                _int_or_none(times.get(medal))
+                for medal in ("bronze", "silver", "gold", "authortime")
+            )
+        if medal_times is None or None in medal_times:
+            raise InvalidGbxFile(f"{path} has no medal times in its header")
+
+        return cls(*medal_times)
+
     def _parse_to_string(self, time: int) -> str:
         """
         Parses a medal time to a string in format `mm:ss:msms`
@@ -105,6 +246,9 @@ class Leaderboard(TMMapObject):
         The position of the player in the leaderboard
     time : int
         The time of the player in the leaderboard
+    zones : :class:`list[PlayerZone]` | None
+        .. versionadded :: 0.5
+        The player's zones, None if the data has no zone
     """
 
     def __init__(
@@ -116,6 +260,7 @@ class Leaderboard(TMMapObject):
         player_id: str | None,
         position: int,
         time: int,
+        zones: list[PlayerZone] | None = None,
     ):
         self.timestamp = timestamp
         self.ghost = ghost
@@ -124,19 +269,28 @@ class Leaderboard(TMMapObject):
         self.position = position
         self.time = time
         self.player_id = player_id
+        self.zones = zones
+        self._player: Player | None = None
 
     @classmethod
     def _from_dict(cls: Self, raw: dict) -> Self:
         _log.debug("Creating a Leaderboards class from given dictionary")
 
         if "player" in raw:
-            player_id = raw.get("player").get("id")
-            player_name = raw.get("player").get("name")
-            player_club_tag = _regex_it(raw.get("player").get("tag", None))
+            player_id = _intern(raw.get("player").get("id"))
+            player_name = _intern(raw.get("player").get("name"))
+            player_club_tag = _intern(_regex_it(raw.get("player").get("tag", None)))
+            _NAME_INDEX.add(player_id, player_name)
+            zones = (
+                PlayerZone._parse_zones(raw["player"]["zone"])
+                if "zone" in raw["player"]
+                else None
+            )
         else:
             player_id = None
             player_name = None
             player_club_tag = None
+            zones = None
 
         position = raw.get("position")
         time = raw.get("time")
@@ -151,11 +305,14 @@ class Leaderboard(TMMapObject):
             position=position,
             time=time,
             player_id=player_id,
+            zones=zones,
         )
 
     async def get_player(self) -> Player:
         """
         .. versionadded :: 0.3.4
+        .. versionchanged :: 0.5
+            Returns the prefetched player if the leaderboard was loaded with `include=["players"]`.
 
         Gets the player who achieved the leaderboard.
 
@@ -166,9 +323,315 @@ class Leaderboard(TMMapObject):
         """
         if self.player_id is None:
             return None
+        if self._player is not None:
+            return self._player
 
         return await Player.get_player(self.player_id)
 
+    @staticmethod
+    async def _prefetch_players(leaderboards: list["Leaderboard"]) -> None:
+        leaderboards = [lb for lb in leaderboards if lb.player_id is not None]
+        players = await asyncio.gather(
+            *(Player.get_player(lb.player_id) for lb in leaderboards),
+            return_exceptions=True,
+        )
+        for lb, player in zip(leaderboards, players):
+            # A failed lookup is left for Leaderboard.get_player to retry and raise.
+            if isinstance(player, Exception):
+                _log.warning(f"Could not prefetch player {lb.player_id}: {player}")
+                continue
+            lb._player = player
+
+    async def download_ghost(self, manager: DownloadManager | None = None) -> Path:
+        """
+        .. versionadded :: 0.5
+
+        Downloads the ghost of the leaderboard position.
+
+        Parameters
+        ----------
+        manager : :class:`DownloadManager` | None, optional
+            The manager to download with, by default the shared one.
+
+        Returns
+        -------
+        :class:`Path`
+            The path of the ghost file.
+        """
+        return await (manager or _get_default_manager()).download(self._ghost_url())
+
+    def _ghost_url(self) -> str:
+        if self.ghost.startswith("/"):
+            return f"{_TMIO.PROTOCOL}://{_TMIO.BASE}{self.ghost}"
+        return self.ghost
+
+    @staticmethod
+    def download_ghosts(
+        leaderboards: Iterable["Leaderboard"],
+        manager: DownloadManager | None = None,
+        max_concurrent: int | None = None,
+    ) -> "GhostBatch":
+        """
+        .. versionadded :: 0.5
+
+        Downloads and reads the ghosts of many leaderboard positions concurrently.
+        Iterate over the returned :class:`GhostBatch` with `async for` to get every ghost as soon
+        as it is ready.
+
+        Parameters
+        ----------
+        leaderboards : Iterable[:class:`Leaderboard`]
+            The leaderboard positions, e.g. a page from :meth:`TMMap.get_leaderboard`.
+        manager : :class:`DownloadManager` | None, optional
+            The manager to download with, by default the shared one.
+        max_concurrent : int | None, optional
+            The maximum number of ghosts downloaded and read at the same time,
+            by default the manager's `max_concurrent`.
+
+        Returns
+        -------
+        :class:`GhostBatch`
+            The batch of ghosts.
+        """
+        return GhostBatch(leaderboards, manager, max_concurrent)
+
+
+class Ghost(TMMapObject):
+    """
+    .. versionadded :: 0.5
+
+    Represents the basic data of a ghost file.
+
+    Parameters
+    ----------
+    race_time : int | None
+        The race time of the ghost in ms, None if the run was not finished.
+    checkpoints : :class:`list[int]`
+        The time at every checkpoint in ms, the finish included.
+    """
+
+    def __init__(self, race_time: int | None, checkpoints: list[int]):
+        self.race_time = race_time
+        self.checkpoints = checkpoints
+
+    @property
+    def checkpoint_count(self) -> int:
+        return len(self.checkpoints)
+
+    @classmethod
+    def from_file(cls: Self, path: str | os.PathLike) -> Self:
+        """
+        .. versionadded :: 0.5
+
+        Reads a `.Ghost.Gbx` or `.Replay.Gbx` file.
+
+        Parameters
+        ----------
+        path : str | :class:`os.PathLike`
+            The path of the file.
+
+        Returns
+        -------
+        :class:`Ghost`
+            The ghost.
+
+        Raises
+        ------
+        :class:`InvalidGbxFile`
+            If the file is not a ghost or replay.
+        """
+        header, body = _read_body(path)
+        if header.class_id not in GHOST_CLASS_IDS:
+            raise InvalidGbxFile(
+                f"{path} is not a ghost, class id {header.class_id:#010x}"
+            )
+
+        return cls(*_parse_ghost(body))
+
+
+class GhostDownload(TMMapObject):
+    """
+    .. versionadded :: 0.5
+
+    Represents the result of downloading and reading one ghost of a :class:`GhostBatch`.
+
+    Parameters
+    ----------
+    leaderboard : :class:`Leaderboard`
+        The leaderboard position the ghost belongs to.
+    path : :class:`Path` | None
+        The path of the ghost file, None if the download failed.
+    ghost : :class:`Ghost` | None
+        The ghost, None if it could not be downloaded or read.
+    latency : float
+        The seconds it took to download and read the ghost.
+    from_cache : bool
+        Whether the ghost was already downloaded.
+    error : :class:`Exception` | None
+        The error that occurred, if any.
+    """
+
+    def __init__(
+        self,
+        leaderboard: Leaderboard,
+        path: Path | None,
+        ghost: Ghost | None,
+        latency: float,
+        from_cache: bool,
+        error: Exception | None = None,
+    ):
+        self.leaderboard = leaderboard
+        self.path = path
+        self.ghost = ghost
+        self.latency = latency
+        self.from_cache = from_cache
+        self.error = error
+
+
+class GhostBatch(TMMapObject):
+    """
+    .. versionadded :: 0.5
+
+    Downloads and reads the ghosts of many leaderboard positions, at most `max_concurrent` at a
+    time, yielding a :class:`GhostDownload` for each as soon as it finishes. Ghost files are read
+    in a thread so downloads keep running meanwhile. Once iterated, the batch holds its stats.
+
+    Parameters
+    ----------
+    leaderboards : Iterable[:class:`Leaderboard`]
+        The leaderboard positions.
+    manager : :class:`DownloadManager` | None, optional
+        The manager to download with, by default the shared one.
+    max_concurrent : int | None, optional
+        The maximum number of ghosts handled at the same time, by default the manager's `max_concurrent`.
+    completed : int
+        The number of ghosts read.
+    failed : int
+        The number of ghosts that could not be downloaded or read.
+    total_bytes : int
+        The size of every ghost read.
+    elapsed : float
+        The seconds the batch took.
+    """
+
+    def __init__(
+        self,
+        leaderboards: Iterable[Leaderboard],
+        manager: DownloadManager | None = None,
+        max_concurrent: int | None = None,
+    ):
+        self.leaderboards = list(leaderboards)
+        self.manager = manager or _get_default_manager()
+        self.max_concurrent = max_concurrent or self.manager.max_concurrent
+        self.completed = 0
+        self.failed = 0
+        self.total_bytes = 0
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """The number of ghosts handled per second."""
+        if self.elapsed == 0:
+            return 0.0
+        return (self.completed + self.failed) / self.elapsed
+
+    @property
+    def bytes_per_second(self) -> float:
+        """The number of ghost bytes read per second."""
+        if self.elapsed == 0:
+            return 0.0
+        return self.total_bytes / self.elapsed
+
+    async def _fetch(
+        self, leaderboard: Leaderboard, semaphore: asyncio.Semaphore
+    ) -> GhostDownload:
+        async with semaphore:
+            started = time.perf_counter()
+            if not leaderboard.ghost:
+                return GhostDownload(
+                    leaderboard, None, None, 0.0, False, ValueError("No ghost url")
+                )
+
+            url = leaderboard._ghost_url()
+            from_cache = self.manager.get_path(url) is not None
+            path = None
+            try:
+                path = await self.manager.download(url)
+                ghost = await asyncio.get_running_loop().run_in_executor(
+                    None, Ghost.from_file, path
+                )
+            except (
+                aiohttp.ClientError,
+                ResponseCodeError,
+                InvalidGbxFile,
+                OSError,
+            ) as e:
+                _log.warning(f"Could not get the ghost {url}: {e}")
+                return GhostDownload(
+                    leaderboard,
+                    path,
+                    None,
+                    time.perf_counter() - started,
+                    from_cache,
+                    e,
+                )
+
+            return GhostDownload(
+                leaderboard, path, ghost, time.perf_counter() - started, from_cache
+            )
+
+    async def __aiter__(self) -> AsyncIterator[GhostDownload]:
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        started = time.perf_counter()
+        tasks = [
+            asyncio.ensure_future(self._fetch(leaderboard, semaphore))
+            for leaderboard in self.leaderboards
+        ]
+
+        try:
+            for next_download in asyncio.as_completed(tasks):
+                download = await next_download
+                if download.ghost is None:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+                    self.total_bytes += download.path.stat().st_size
+                self.elapsed = time.perf_counter() - started
+                yield download
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.elapsed = time.perf_counter() - started
+            _log.info(
+                f"Read {self.completed} ghosts ({self.failed} failed) in {self.elapsed:.2f}s, "
+                f"{self.throughput:.1f} ghosts/s, {self.bytes_per_second / 1024:.1f} KiB/s"
+            )
+
+
+class PlayerRecord(TMMapObject):
+    """
+    .. versionadded :: 0.5
+
+    Represents a player's record on a map.
+
+    Parameters
+    ----------
+    map_uid : str
+        The uid of the map.
+    player_id : str
+        The player's id.
+    position : int
+        The player's position in the map's leaderboard.
+    time : int
+        The player's time in ms.
+    """
+
+    def __init__(self, map_uid: str, player_id: str, position: int, time: int):
+        self.map_uid = map_uid
+        self.player_id = player_id
+        self.position = position
+        self.time = time
+
 
 class TMMap(TMMapObject):
     """
@@ -244,6 +707,7 @@ class TMMap(TMMapObject):
         self._offset = 0
         self.length = 100
         self._lb_loaded = False
+        self._author: Player | None = None
 
     @property
     def offset(self):
@@ -253,12 +717,25 @@ class TMMap(TMMapObject):
     def lb_loaded(self):
         return self._lb_loaded
 
+    def _copy(self) -> Self:
+        # Shares the parsed data, the leaderboard pagination belongs to each caller.
+        tmmap = copy.copy(self)
+        tmmap.leaderboard = None
+        tmmap._offset = 0
+        tmmap.length = 100
+        tmmap._lb_loaded = False
+        return tmmap
+
     @classmethod
     def _from_dict(cls: Self, raw: dict) -> Self:
+        shared = _get_shared(cls, raw.get("mapUid"))
+        if shared is not None:
+            return shared._copy()
+
         _log.debug("Creating a Map class from given dictionary")
 
-        author_id = raw.get("author")
-        author_name = _regex_it(raw.get("authorplayer").get("name"))
+        author_id = _intern(raw.get("author"))
+        author_name = _intern(_regex_it(raw.get("authorplayer").get("name")))
         environment = raw.get("collectionName")
         exchange_id = raw.get("exchangeid", None)
         file_name = raw.get("filename")
@@ -271,14 +748,16 @@ class TMMap(TMMapObject):
             raw.get("authorScore"),
         )
         name = _regex_it(raw.get("name"))
-        submitter_id = raw.get("submitter")
-        submitter_name = raw.get("submitterplayer").get("name")
+        submitter_id = _intern(raw.get("submitter"))
+        submitter_name = _intern(raw.get("submitterplayer").get("name"))
+        _NAME_INDEX.add(author_id, author_name)
+        _NAME_INDEX.add(submitter_id, submitter_name)
         thumbnail = raw.get("thumbnailUrl")
         uid = raw.get("mapUid")
         uploaded = _frmt_str_to_datetime(raw.get("timestamp"))
         url = raw.get("fileUrl")
 
-        return cls(
+        tmmap = cls(
             author_id,
             author_name,
             environment,
@@ -296,6 +775,9 @@ class TMMap(TMMapObject):
             url,
         )
 
+        shared = _share(cls, uid, tmmap)
+        return tmmap if shared is tmmap else shared._copy()
+
     @classmethod
     async def get_map(cls: Self, map_uid: str) -> Self:
         """
@@ -310,24 +792,69 @@ class TMMap(TMMapObject):
         """
         _log.debug(f"Getting the map with the UID {map_uid}")
 
-        map_data = get_from_cache(f"map:{map_uid}")
+        map_data = get_from_cache(_cache_key("map", map_uid))
         if map_data is not None:
             return cls._from_dict(map_data)
 
-        api_client = _APIClient()
-        map_data = await api_client.get(_TMIO.build([_TMIO.TABS.MAP, map_uid]))
-        await api_client.close()
-
-        with suppress(KeyError, TypeError):
-            raise TMIOException(map_data["error"])
+        async with _APIClient() as api_client:
+            map_data = await _fetch_map(map_uid, api_client)
 
-        set_in_cache(f"map:{map_uid}", json.dumps(map_data))
+        set_in_cache(_cache_key("map", map_uid), map_data)
 
         return cls._from_dict(map_data)
 
+    @classmethod
+    async def get_many(
+        cls: Self,
+        map_uids: list[str],
+        max_concurrent: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Self | Exception]:
+        """
+        .. versionadded :: 0.5
+
+        Gets many TM Maps from their UIDs.
+        Cached maps are read in one batch and the rest are fetched concurrently over one session.
+
+        Parameters
+        ----------
+        map_uids : list[str]
+            The maps' UIDs.
+        max_concurrent : int | None, optional
+            The maximum number of maps fetched at the same time, by default :attr:`Client.MAX_CONCURRENT_REQUESTS`
+        return_exceptions : bool, optional
+            Whether a map that could not be fetched gets its error in place instead of it being raised, by default False
+
+        Returns
+        -------
+        :class:`list[TMMap | Exception]`
+            The maps in the same order as `map_uids`.
+
+        Raises
+        ------
+        :class:`TMIOException`
+            If a map doesn't exist and `return_exceptions` is False.
+        """
+        maps_data = await _get_many(
+            map_uids,
+            lambda map_uid: _cache_key("map", map_uid),
+            _fetch_map,
+            max_concurrent=max_concurrent,
+            return_exceptions=return_exceptions,
+        )
+
+        return [
+            map_data
+            if isinstance(map_data, BaseException)
+            else cls._from_dict(map_data)
+            for map_data in maps_data
+        ]
+
     async def author(self) -> Player:
         """
         .. versionadded :: 0.3.0
+        .. versionchanged :: 0.5
+            Returns the prefetched author if the map was loaded with its authors included.
 
         Returns the author as a player.
 
@@ -336,6 +863,9 @@ class TMMap(TMMapObject):
         :class:`Player`
             The author as a :class:`Player` object
         """
+        if self._author is not None:
+            return self._author
+
         _log.debug(f"Getting the author of the map {self.uid}")
         return await Player.get_player(self.author_id)
 
@@ -353,11 +883,159 @@ class TMMap(TMMapObject):
         _log.debug(f"Getting the submitter of the map {self.uid}")
         return await Player.get_player(self.submitter_id)
 
+    async def download(self, manager: DownloadManager | None = None) -> Path:
+        """
+        .. versionadded :: 0.5
+
+        Downloads the map's `.Map.Gbx` file.
+
+        Parameters
+        ----------
+        manager : :class:`DownloadManager` | None, optional
+            The manager to download with, by default the shared one.
+
+        Returns
+        -------
+        :class:`Path`
+            The path of the map file.
+        """
+        return await (manager or _get_default_manager()).download(self.url)
+
+    async def download_thumbnail(self, manager: DownloadManager | None = None) -> Path:
+        """
+        .. versionadded :: 0.5
+
+        Downloads the map's thumbnail.
+
+        Parameters
+        ----------
+        manager : :class:`DownloadManager` | None, optional
+            The manager to download with, by default the shared one.
+
+        Returns
+        -------
+        :class:`Path`
+            The path of the thumbnail file.
+        """
+        return await (manager or _get_default_manager()).download(self.thumbnail)
+
+    @staticmethod
+    async def get_player_records(
+        player_id: str,
+        map_uids: list[str],
+        max_depth: int = 1000,
+        return_exceptions: bool = False,
+    ) -> dict[str, PlayerRecord | BaseException | None]:
+        """
+        .. versionadded :: 0.5
+
+        Gets a player's record on many maps.
+
+        Every map keeps a cached index of the player ids in the part of its leaderboard that has
+        been fetched so far. A player already in the index is found without any request,
+        otherwise the leaderboard is fetched a page further at a time until the player is found,
+        the leaderboard ends or `max_depth` is reached, for every map concurrently. An index is
+        rebuilt an hour after it was created, like the leaderboard pages themselves.
+
+        Parameters
+        ----------
+        player_id : str
+            The player's id.
+        map_uids : list[str]
+            The uids of the maps.
+        max_depth : int, optional
+            How deep into a leaderboard to look for the player, by default 1000
+        return_exceptions : bool, optional
+            Whether the maps whose leaderboard could not be searched hold the exception instead
+            of it being raised, by default False
+
+        Returns
+        -------
+        dict[str, :class:`PlayerRecord` | :class:`BaseException` | None]
+            The records by map uid, in the order of `map_uids`.
+            None if the player has no record within the first `max_depth` positions.
+
+        Raises
+        ------
+        :class:`TMIOException`
+            If a leaderboard could not be searched and `return_exceptions` is False. The pages
+            fetched before the error are still cached.
+        """
+        _log.debug(f"Getting the records of {player_id} on {len(map_uids)} maps")
+
+        map_uids = list(dict.fromkeys(map_uids))
+        keys = [_cache_key("leaderboard_index", map_uid) for map_uid in map_uids]
+        # An index is never kept longer than the leaderboard pages it was built from.
+        now = time.time()
+        indexes = [
+            index
+            if isinstance(index, dict) and now - index.get("created_at", 0) < 3600
+            else {"depth": 0, "complete": False, "players": {}, "created_at": now}
+            for index in get_many_from_cache(keys)
+        ]
+
+        missing = [
+            (map_uid, index)
+            for map_uid, index in zip(map_uids, indexes)
+            if player_id not in index["players"]
+            and not index["complete"]
+            and index["depth"] < max_depth
+        ]
+        errors = {}
+        if len(missing) != 0:
+            depths = [index["depth"] for _, index in missing]
+            async with _APIClient() as api_client:
+                results = await asyncio.gather(
+                    *(
+                        _find_in_leaderboard(
+                            map_uid, player_id, index, max_depth, api_client
+                        )
+                        for map_uid, index in missing
+                    ),
+                    return_exceptions=True,
+                )
+
+            # Pages fetched before a failure are kept, the next call continues from there.
+            # Every index expires an hour after it was created, however often it is extended.
+            expiring = {}
+            now = time.time()
+            for (map_uid, index), depth in zip(missing, depths):
+                if index["depth"] != depth:
+                    ex = max(1, math.ceil(index["created_at"] + 3600 - now))
+                    expiring.setdefault(ex, {})[
+                        _cache_key("leaderboard_index", map_uid)
+                    ] = index
+            for ex, values in expiring.items():
+                set_many_in_cache(values, ex=ex)
+            errors = {
+                map_uid: result
+                for (map_uid, _), result in zip(missing, results)
+                if isinstance(result, BaseException)
+            }
+            for map_uid, error in errors.items():
+                _log.warning(f"Could not search the leaderboard of {map_uid}: {error}")
+            if len(errors) != 0 and not return_exceptions:
+                raise next(iter(errors.values()))
+
+        records = {}
+        for map_uid, index in zip(map_uids, indexes):
+            record = index["players"].get(player_id)
+            if map_uid in errors:
+                records[map_uid] = errors[map_uid]
+            elif record is not None:
+                records[map_uid] = PlayerRecord(map_uid, player_id, *record)
+            else:
+                records[map_uid] = None
+
+        return records
+
     async def get_leaderboard(
-        self, offset: int = 0, length: int = 100
+        self, offset: int = 0, length: int = 100, include: list[str] | None = None
     ) -> list[Leaderboard]:
         """
         .. versionadded :: 0.3.0
+        .. versionchanged :: 0.5
+            Added the `include` parameter.
 
         Get's the leaderboard of a map.
 
@@ -367,6 +1045,10 @@ class TMMap(TMMapObject):
             The offset of the leaderboard. Defaults to 0.
         length : int, optional
             How many leaderpositions to get. Should be between 1 and 100 both inclusive. by default 100
+        include : list[str] | None, optional
+            Related objects to fetch in one batch and attach to the positions, by default None.
+            `"players"` makes :meth:`Leaderboard.get_player` return without a request. A lookup
+            that fails does not fail the leaderboard, its accessor requests it again when called.
 
         Returns
         -------
@@ -376,50 +1058,28 @@ class TMMap(TMMapObject):
         Raises
         ------
         :class:`ValueError`
-            If the length is not between 1 and 100.
+            If the length is not between 1 and 100 or something unknown is included.
         """
+        includes = _check_include(include, ("players",))
         if length < 1:
             raise ValueError("Length must be greater than 0")
         length = min(length, 100)
 
-        _log.debug(
-            f"Getting Leaderboard of the Map with Length {length} and offset {offset}"
-        )
-
         self._offset = offset
         self.length = length
 
-        leaderboards_data = get_from_cache(
-            f"leaderboard:{self.uid}:{self.offset}:{self.length}"
-        )
-        if leaderboards_data is not None:
-            leaderboards = []
-            for lb in leaderboards_data.get("tops", []):
-                leaderboards.append(Leaderboard._from_dict(lb))
-
-            return leaderboards
-
-        api_client = _APIClient()
-        lb_data = await api_client.get(
-            _TMIO.build([_TMIO.TABS.LEADERBOARD, _TMIO.TABS.MAP, self.uid])
-            + f"?offset={self.offset}&length={self.length}"
-        )
-        await api_client.close()
-
-        with suppress(KeyError, TypeError):
-            raise TMIOException(lb_data["error"])
-
-        set_in_cache(
-            f"leaderboard:{self.uid}:{self.offset}:{self.length}", json.dumps(lb_data)
-        )
+        lb_data = await _get_leaderboard(self.uid, self._offset, self.length)
 
         self._offset += self.length
         self._lb_loaded = True
 
         leaderboards = []
-        for lb in lb_data["tops"]:
+        for lb in lb_data.get("tops", []):
             leaderboards.append(Leaderboard._from_dict(lb))
 
+        if "players" in includes:
+            await Leaderboard._prefetch_players(leaderboards)
+
         return leaderboards
 
     async def load_more_leaderboard(self, length: int = 100) -> list[Leaderboard]:
@@ -438,40 +1098,17 @@ class TMMap(TMMapObject):
         :class:`list[Leaderboard]`
             The leaderboard positions.
         """
-        leaderboard_data = get_from_cache(
-            f"leaderboard:{self.uid}:{self.offset}:{self.length}"
-        )
-        if leaderboard_data is not None:
-            leaderboards = []
-            for lb in leaderboard_data.get("tops", []):
-                leaderboards.append(Leaderboard._from_dict(lb))
-
-            return leaderboards
-
         if not self._lb_loaded:
             _log.warn("Leaderboard is not loaded yet, loading from start")
             return await self.get_leaderboard(length=length)
 
-        api_client = _APIClient()
-        leaderboards = await api_client.get(
-            _TMIO.build([_TMIO.TABS.LEADERBOARD, _TMIO.TABS.MAP, self.uid])
-            + f"?offset={self._offset}&length={length}"
-        )
-        await api_client.close()
-
-        with suppress(KeyError, TypeError):
-            raise TMIOException(leaderboards["error"])
-
-        set_in_cache(
-            f"leaderboard:{self.uid}:{self.offset}:{self.length}",
-            json.dumps(leaderboards),
-        )
+        leaderboards = await _get_leaderboard(self.uid, self._offset, length)
 
         self._offset += length
         self._lb_loaded = True
 
         lbs = []
-        for lb in leaderboards["tops"]:
+        for lb in leaderboards.get("tops", []):
             lbs.append(Leaderboard._from_dict(lb))
 
         return lbs
@@ -1,16 +1,40 @@
+import asyncio
 import logging
+import os
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing, suppress
 from datetime import datetime
+from pathlib import Path
 
+import aiohttp
 from typing_extensions import Self
 
 from trackmania.api import _APIClient
 
+from ._gbx import (
+    MAP_XML_CHUNK,
+    _int_or_none,
+    _parse_xml_chunk,
+    _read_map_header,
+    _xml_attributes,
+)
 from ._util import _frmt_str_to_datetime, _regex_it
-from .api import _APIClient
+from .api import ResponseCodeError, _APIClient
 from .base import TMXObject
-from .config import get_from_cache, set_in_cache
+from .config import (
+    Client,
+    _cache_key,
+    get_from_cache,
+    get_keys_from_cache,
+    get_many_from_cache,
+    set_in_cache,
+    set_many_in_cache,
+)
 from .constants import _TMX
-from .errors import InvalidTMXCode
+from .downloads import DownloadManager, _get_default_manager
+from .errors import InvalidGbxFile, InvalidTMXCode, TMXException
 
 _log = logging.getLogger(__name__)
 
@@ -21,13 +45,14 @@ __all__ = (
     "ReplayWRData",
     "TMXMetadata",
     "TMXMap",
+    "TMXCatalogue",
 )
 
 
 async def _get_map(tmx_id: int) -> dict:
     _log.info(f"Getting map data for tmx id {tmx_id}")
 
-    tmx_map = get_from_cache(f"tmxmap:{tmx_id}")
+    tmx_map = get_from_cache(_cache_key("tmx_map", tmx_id))
     if tmx_map is not None:
         return tmx_map
 
@@ -40,23 +65,285 @@ async def _get_map(tmx_id: int) -> dict:
     if not isinstance(map_data, dict):
         raise InvalidTMXCode("Invalid TMX code")
 
-    set_in_cache(f"tmxmap:{tmx_id}", map_data)
+    set_in_cache(_cache_key("tmx_map", tmx_id), map_data)
 
     return map_data
 
 
-async def _get_random_map() -> dict:
+async def _get_maps(tmx_ids: list[int]) -> dict[int, dict]:
+    _log.info(f"Getting map data for {len(tmx_ids)} tmx ids")
+
+    tmx_ids = list(dict.fromkeys(tmx_ids))
+    cached_maps = get_many_from_cache(
+        [_cache_key("tmx_map", tmx_id) for tmx_id in tmx_ids]
+    )
+    maps = {
+        tmx_id: map_data
+        for tmx_id, map_data in zip(tmx_ids, cached_maps)
+        if isinstance(map_data, dict)
+    }
+
+    missing_ids = [tmx_id for tmx_id in tmx_ids if tmx_id not in maps]
+    if len(missing_ids) == 0:
+        return maps
+
+    chunks = [
+        missing_ids[i : i + _TMX.MULTI_LIMIT]
+        for i in range(0, len(missing_ids), _TMX.MULTI_LIMIT)
+    ]
+
+    # A managed client, so a failed chunk does not close the session the other chunks still use.
+    async with _APIClient() as api_client:
+        responses = await asyncio.gather(
+            *(
+                api_client.get(
+                    _TMX.build(
+                        [
+                            _TMX.TABS.MAPS,
+                            _TMX.TABS.GET_MAP_INFO,
+                            _TMX.TABS.MULTI,
+                            ",".join(str(tmx_id) for tmx_id in chunk),
+                        ]
+                    )
+                )
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+
+    fetched_maps = {}
+    failed_ids = []
+    error = None
+    for chunk, response in zip(chunks, responses):
+        if not isinstance(response, list):
+            _log.warning(f"Could not get tmx ids {chunk}: {response}")
+            failed_ids.extend(chunk)
+            if error is None:
+                error = response
+            continue
+        for map_data in response:
+            if isinstance(map_data, dict) and map_data.get("TrackID") in chunk:
+                fetched_maps[map_data["TrackID"]] = map_data
+
+    # The chunks that succeeded are cached first, so retrying only requests the failed ones.
+    set_many_in_cache(
+        {
+            _cache_key("tmx_map", tmx_id): map_data
+            for tmx_id, map_data in fetched_maps.items()
+        }
+    )
+    maps.update(fetched_maps)
+
+    if len(failed_ids) != 0:
+        raise TMXException(
+            f"Could not get {len(failed_ids)} tmx ids: {failed_ids}"
+        ) from (error if isinstance(error, BaseException) else None)
+
+    return maps
+
+
+async def _get_random_map(api_client: _APIClient | None = None) -> dict:
     _log.info(f"Getting a random map from trackmania.exchange")
 
-    api_client = _APIClient()
+    close_client = api_client is None
+    if close_client:
+        api_client = _APIClient()
     map_data = await api_client.get(
         "https://trackmania.exchange/mapsearch2/search?api=on&random=1&format=json"
     )  # Not using _TMX.build here because it doesn't need _TMX.api in the url
-    await api_client.close()
+    if close_client:
+        await api_client.close()
 
     return map_data["results"][0]
 
 
+def _enum_value(enums: dict, value: int | str, kind: str) -> int:
+    if isinstance(value, int):
+        if value in enums:
+            return value
+    else:
+        for enum_id, enum_name in enums.items():
+            if enum_name.lower() == value.lower():
+                return enum_id
+
+    raise ValueError(f"Invalid {kind}: {value}")
+
+
+def _search_params(
+    name: str | None,
+    author: str | None,
+    tags: list[int | str] | None,
+    difficulty: int | str | None,
+    length: int | str | None,
+    length_operator: int,
+    page_size: int,
+) -> dict:
+    params = {"api": "on", "format": "json", "limit": str(page_size)}
+
+    if name is not None:
+        params["trackname"] = name
+    if author is not None:
+        params["author"] = author
+    if tags:
+        params["tags"] = ",".join(
+            str(_enum_value(_TMX.MAP_TYPE_ENUMS, tag, "tag")) for tag in tags
+        )
+    if difficulty is not None:
+        params["difficulty"] = str(
+            _enum_value(_TMX.DIFFICULTY_ENUMS, difficulty, "difficulty")
+        )
+    if length is not None:
+        params["length"] = str(_enum_value(_TMX.LENGTH_ENUMS, length, "length"))
+        params["lengthop"] = str(length_operator)
+
+    return params
+
+
+async def _search_page(api_client: _APIClient, params: dict, page: int) -> dict:
+    _log.info(f"Getting page {page} of a trackmania.exchange map search")
+
+    page_data = await api_client.get(
+        f"{_TMX.PROTOCOL}://{_TMX.BASE}/{_TMX.TABS.MAPSEARCHTWO}/{_TMX.TABS.SEARCH}",
+        params={**params, "page": str(page)},
+    )  # Not using _TMX.build here because it doesn't need _TMX.api in the url
+
+    if not isinstance(page_data, dict):
+        raise TMXException(f"Invalid search response: {page_data}")
+
+    set_many_in_cache(
+        {
+            _cache_key("tmx_map", map_data["TrackID"]): map_data
+            for map_data in page_data.get("results", [])
+            if "TrackID" in map_data
+        }
+    )
+
+    return page_data
+
+
+async def _search(
+    params: dict, page_size: int, limit: int | None = None
+) -> AsyncIterator[dict]:
+    api_client = _APIClient()
+    page = 1
+    next_page = asyncio.ensure_future(_search_page(api_client, params, page))
+    yielded = 0
+
+    try:
+        while next_page is not None:
+            page_data = await next_page
+            results = page_data.get("results", [])
+            total = page_data.get("totalItemCount")
+
+            next_page = None
+            if (
+                len(results) == page_size
+                and (total is None or page * page_size < total)
+                and (limit is None or yielded + len(results) < limit)
+            ):
+                page += 1
+                next_page = asyncio.ensure_future(
+                    _search_page(api_client, params, page)
+                )
+
+            for map_data in results:
+                if limit is not None and yielded >= limit:
+                    return
+                yield map_data
+                yielded += 1
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await next_page
+        await api_client.close()
+
+
+class _RandomMapPool:
+    """
+    .. versionadded :: 0.5
+
+    A buffer of prefetched random maps.
+    Maps are taken from the front of the buffer. Once :attr:`Client.TMX_RANDOM_POOL_LOW` or fewer
+    are left, a single background task refills it up to :attr:`Client.TMX_RANDOM_POOL_HIGH`, one
+    request at a time with :attr:`Client.TMX_RANDOM_POOL_DELAY` seconds between requests.
+    """
+
+    def __init__(self):
+        self._maps: deque[dict] = deque()
+        self._refill_task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._maps)
+
+    async def get(self) -> dict:
+        """
+        Takes a random map from the pool, fetching one directly if the pool is empty.
+
+        Returns
+        -------
+        :class:`dict`
+            The raw map data.
+        """
+        if len(self._maps) != 0:
+            map_data = self._maps.popleft()
+        else:
+            _log.debug("Random map pool is empty, fetching a map directly")
+            map_data = await _get_random_map()
+
+        self._maybe_refill()
+        return map_data
+
+    def _maybe_refill(self) -> None:
+        if len(self._maps) > Client.TMX_RANDOM_POOL_LOW:
+            return
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._refill_task is not None
+            and not self._refill_task.done()
+            and self._refill_task.get_loop() is loop
+        ):
+            return
+
+        self._refill_task = loop.create_task(self._refill())
+
+    async def _refill(self) -> None:
+        _log.debug(f"Refilling random map pool from {len(self._maps)} maps")
+
+        api_client = _APIClient()
+        try:
+            while len(self._maps) < Client.TMX_RANDOM_POOL_HIGH:
+                map_data = await _get_random_map(api_client)
+                self._maps.append(map_data)
+                set_in_cache(_cache_key("tmx_map", map_data["TrackID"]), map_data)
+
+                if len(self._maps) < Client.TMX_RANDOM_POOL_HIGH:
+                    await asyncio.sleep(Client.TMX_RANDOM_POOL_DELAY)
+        except (
+            aiohttp.ClientError,
+            ResponseCodeError,
+            KeyError,
+            IndexError,
+            TypeError,
+        ) as e:
+            _log.warning(f"Stopped refilling random map pool: {e}")
+        finally:
+            await api_client.close()
+
+    def clear(self) -> None:
+        """
+        Empties the pool and cancels a running refill.
+        """
+        if self._refill_task is not None and not self._refill_task.done():
+            self._refill_task.cancel()
+        self._refill_task = None
+        self._maps.clear()
+
+
+_RANDOM_MAP_POOL = _RandomMapPool()
+
+
 class TMXMapTimes(TMXObject):
     """
     .. versionadded :: 0.3.3
@@ -173,7 +460,7 @@ class GbxFileMetadata(TMXObject):
             raw.get("ModName"),
             raw.get("Lightmap"),
             raw.get("ExeVersion"),
-            datetime.strptime(raw.get("ExeBuild"), "%Y-%m-%d_%H_%M"),
+            _frmt_str_to_datetime(raw.get("ExeBuild")),
             raw.get("AuthorTime"),
             raw.get("EnvironmentName"),
             raw.get("VehicleName"),
@@ -181,6 +468,63 @@ class GbxFileMetadata(TMXObject):
 
         return cls(*args)
 
+    @classmethod
+    def from_file(cls: Self, path: str | os.PathLike) -> Self:
+        """
+        .. versionadded :: 0.5
+
+        Reads the metadata straight from a local `.Map.Gbx` file.
+        Only the header of the file is read, not the map itself.
+
+        Parameters
+        ----------
+        path : str | :class:`os.PathLike`
+            The path of the map file.
+
+        Returns
+        -------
+        :class:`GbxFileMetadata`
+            The metadata of the map.
+
+        Raises
+        ------
+        :class:`InvalidGbxFile`
+            If the file is not a map or has no XML header chunk.
+        """
+        header = _read_map_header(path)
+        if MAP_XML_CHUNK not in header.chunks:
+            raise InvalidGbxFile(f"{path} has no XML header chunk")
+
+        xml = _parse_xml_chunk(header.chunks[MAP_XML_CHUNK])
+        header_data = _xml_attributes(xml, "header")
+        ident = _xml_attributes(xml, "ident")
+        desc = _xml_attributes(xml, "desc")
+        times = _xml_attributes(xml, "times")
+        player_model = _xml_attributes(xml, "playermodel")
+
+        map_type = desc.get("maptype")
+        if map_type is not None:
+            map_type = map_type.rsplit("\\", 1)[-1]
+
+        args = [
+            ident.get("name"),
+            ident.get("author"),
+            map_type,
+            header_data.get("title"),
+            ident.get("uid"),
+            desc.get("mood"),
+            _int_or_none(desc.get("displaycost")),
+            desc.get("mod") or None,
+            _int_or_none(header_data.get("lightmap")),
+            header_data.get("exever"),
+            _frmt_str_to_datetime(header_data.get("exebuild")),
+            _int_or_none(times.get("authortime")),
+            desc.get("envir"),
+            player_model.get("id") or None,
+        ]
+
+        return cls(*args)
+
 
 class TMXTags(TMXObject):
     """
@@ -501,9 +845,137 @@ class TMXMap:
         tmx_map_data = await _get_map(tmx_id)
         return cls._from_dict(tmx_map_data)
 
+    @classmethod
+    async def get_maps(cls: Self, tmx_ids: list[int]) -> list[Self | None]:
+        """
+        .. versionadded :: 0.5
+
+        Gets many maps using their tmx ids.
+        Cached maps are read in one batch and the rest are requested from the TMX `multi`
+        endpoint, :attr:`_TMX.MULTI_LIMIT` ids at a time. Every map is cached on its own, so
+        :meth:`get_map` is served from the same cache.
+
+        Parameters
+        ----------
+        tmx_ids : list[int]
+            The tmx ids.
+
+        Returns
+        -------
+        :class:`list[TMXMap | None]`
+            The maps in the same order as `tmx_ids`. Ids that do not belong to a map are `None`.
+
+        Raises
+        ------
+        :class:`TMXException`
+            If a request failed. The maps from the requests that succeeded are still cached.
+        """
+        tmx_ids = [int(tmx_id) for tmx_id in tmx_ids]
+        maps = await _get_maps(tmx_ids)
+
+        invalid_ids = [tmx_id for tmx_id in tmx_ids if tmx_id not in maps]
+        if len(invalid_ids) != 0:
+            _log.warning(f"Invalid TMX codes: {invalid_ids}")
+
+        parsed_maps = {
+            tmx_id: cls._from_dict(map_data) for tmx_id, map_data in maps.items()
+        }
+        return [parsed_maps.get(tmx_id) for tmx_id in tmx_ids]
+
+    @classmethod
+    async def search(
+        cls: Self,
+        *,
+        name: str | None = None,
+        author: str | None = None,
+        tags: list[int | str] | None = None,
+        difficulty: int | str | None = None,
+        length: int | str | None = None,
+        length_operator: int = 0,
+        page_size: int = 100,
+        limit: int | None = None,
+    ) -> AsyncIterator[Self]:
+        """
+        .. versionadded :: 0.5
+
+        Searches trackmania.exchange for maps, yielding them one by one.
+        Pages are requested lazily and the next page is fetched while the current one is
+        being consumed, so only two pages are held in memory at a time. Every map found is
+        also cached for :meth:`get_map`.
+
+        The search holds an open session until it is exhausted. If you stop iterating early,
+        use :func:`contextlib.aclosing` to close it right away.
+
+        Parameters
+        ----------
+        name : str | None, optional
+            Only maps whose name contains this, by default None
+        author : str | None, optional
+            Only maps by this author, by default None
+        tags : list[int | str] | None, optional
+            Only maps with all of these tags, either their ids or names from `_TMX.MAP_TYPE_ENUMS`, by default None
+        difficulty : int | str | None, optional
+            Only maps of this difficulty, either its id or name from `_TMX.DIFFICULTY_ENUMS`, by default None
+        length : int | str | None, optional
+            Only maps of this length, either its id or name from `_TMX.LENGTH_ENUMS`, by default None
+        length_operator : int, optional
+            How `length` is compared. 0 is exact, 1 is shorter, 2 is longer, 3 is longer or equal
+            and 4 is shorter or equal, by default 0
+        page_size : int, optional
+            The number of maps requested at a time. Should be between 1 and 100 both inclusive, by default 100
+        limit : int | None, optional
+            The maximum number of maps to yield. None for every result, by default None
+
+        Yields
+        ------
+        :class:`TMXMap`
+            The maps found.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If the page size is less than 1 or a tag, difficulty or length is not known.
+        :class:`TMXException`
+            If trackmania.exchange does not return search results.
+        """
+        if page_size < 1:
+            raise ValueError("Page size must be greater than 0")
+        page_size = min(page_size, _TMX.SEARCH_LIMIT)
+
+        params = _search_params(
+            name, author, tags, difficulty, length, length_operator, page_size
+        )
+
+        async with aclosing(_search(params, page_size, limit)) as results:
+            async for map_data in results:
+                yield cls._from_dict(map_data)
+
+    async def download(self, manager: DownloadManager | None = None) -> Path:
+        """
+        .. versionadded :: 0.5
+
+        Downloads the map's `.Map.Gbx` file from trackmania.exchange.
+
+        Parameters
+        ----------
+        manager : :class:`DownloadManager` | None, optional
+            The manager to download with, by default the shared one.
+
+        Returns
+        -------
+        :class:`Path`
+            The path of the map file.
+        """
+        return await (manager or _get_default_manager()).download(
+            f"{_TMX.PROTOCOL}://{_TMX.BASE}/maps/download/{self.track_id}"
+        )
+
     @classmethod
     async def get_random_map(cls: Self) -> Self:
         """
+        .. versionchanged :: 0.5
+            Maps are taken from a pool of prefetched random maps that is refilled in the background.
+
         Gets a random map from trackmania.exchange
 
         Returns
@@ -511,5 +983,316 @@ class TMXMap:
         :class:`TMXMap`
             The random map.
         """
-        map_data = await _get_random_map()
+        map_data = await _RANDOM_MAP_POOL.get()
         return cls._from_dict(map_data)
+
+
+class _CatalogueEntry:
+    __slots__ = (
+        "raw",
+        "tags",
+        "author",
+        "difficulty",
+        "length",
+        "author_time",
+        "award_count",
+        "uploaded",
+    )
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+        self.tags = 0
+        for tag in (raw.get("Tags") or "").split(","):
+            if tag.strip().isdigit():
+                self.tags |= 1 << int(tag)
+        self.author = (raw.get("Username") or "").lower()
+        self.difficulty = raw.get("DifficultyName")
+        self.length = raw.get("LengthName")
+        self.author_time = raw.get("AuthorTime") or 0
+        self.award_count = raw.get("AwardCount") or 0
+        uploaded = _frmt_str_to_datetime(raw.get("UploadedAt"))
+        self.uploaded = uploaded.timestamp() if uploaded is not None else 0.0
+
+
+class TMXCatalogue(TMXObject):
+    """
+    .. versionadded :: 0.5
+
+    An in-memory index of TMX maps for repeated filter and sort queries without network requests.
+    Tags are stored as bitsets and the maps are kept sorted by author time, award count and upload
+    date, so a query only walks the part of an index that can match.
+
+    Build one from the maps already cached with :meth:`from_cache`, add maps with :meth:`add`
+    and pull new maps from the TMX search with :meth:`refresh`.
+    """
+
+    SORT_KEYS: tuple = ("author_time", "award_count", "uploaded")
+
+    def __init__(self):
+        self._entries: dict[int, _CatalogueEntry] = {}
+        self._parsed: dict[int, TMXMap] = {}
+        self._indexes: dict[str, list[tuple]] = {key: [] for key in self.SORT_KEYS}
+        self._newest: dict[tuple, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, tmx_id: int) -> bool:
+        return tmx_id in self._entries
+
+    @classmethod
+    def from_cache(cls: Self) -> Self:
+        """
+        .. versionadded :: 0.5
+
+        Builds a catalogue from every TMX map in cache.
+
+        Returns
+        -------
+        :class:`TMXCatalogue`
+            The catalogue, empty if the cache is unavailable.
+        """
+        catalogue = cls()
+        keys = get_keys_from_cache(_cache_key("tmx_map", "*"))
+        _log.debug(f"Building a TMX catalogue from {len(keys)} cached maps")
+
+        for i in range(0, len(keys), 500):
+            for map_data in get_many_from_cache(keys[i : i + 500]):
+                if isinstance(map_data, dict):
+                    catalogue.add(map_data)
+
+        return catalogue
+
+    def add(self, map_data: dict) -> bool:
+        """
+        .. versionadded :: 0.5
+
+        Adds a map to the catalogue, replacing the map with the same track id.
+
+        Parameters
+        ----------
+        map_data : dict
+            The raw map data from TMX.
+
+        Returns
+        -------
+        bool
+            True if the map was not in the catalogue before.
+        """
+        tmx_id = map_data.get("TrackID")
+        if tmx_id is None:
+            return False
+
+        new = tmx_id not in self._entries
+        if not new:
+            self._remove(tmx_id)
+
+        entry = _CatalogueEntry(map_data)
+        self._entries[tmx_id] = entry
+        for key in self.SORT_KEYS:
+            insort(self._indexes[key], (getattr(entry, key), tmx_id))
+
+        return new
+
+    def _remove(self, tmx_id: int) -> None:
+        entry = self._entries.pop(tmx_id)
+        self._parsed.pop(tmx_id, None)
+        for key in self.SORT_KEYS:
+            index = self._indexes[key]
+            del index[bisect_left(index, (getattr(entry, key), tmx_id))]
+
+    def query(
+        self,
+        *,
+        tags: list[int | str] | None = None,
+        exclude_tags: list[int | str] | None = None,
+        author: str | None = None,
+        difficulty: str | None = None,
+        length: str | None = None,
+        min_author_time: int | None = None,
+        max_author_time: int | None = None,
+        min_awards: int | None = None,
+        uploaded_after: datetime | None = None,
+        uploaded_before: datetime | None = None,
+        sort_by: str = "uploaded",
+        reverse: bool = False,
+        limit: int | None = None,
+    ) -> list[TMXMap]:
+        """
+        .. versionadded :: 0.5
+
+        Filters and sorts the maps in the catalogue.
+
+        Parameters
+        ----------
+        tags : list[int | str] | None, optional
+            Only maps with all of these tags, either their ids or names, by default None
+        exclude_tags : list[int | str] | None, optional
+            Only maps with none of these tags, either their ids or names, by default None
+        author : str | None, optional
+            Only maps by this author, case insensitive, by default None
+        difficulty : str | None, optional
+            Only maps of this difficulty name, by default None
+        length : str | None, optional
+            Only maps of this length name, by default None
+        min_author_time : int | None, optional
+            Only maps with an author time of at least this many ms, by default None
+        max_author_time : int | None, optional
+            Only maps with an author time of at most this many ms, by default None
+        min_awards : int | None, optional
+            Only maps with at least this many awards, by default None
+        uploaded_after : :class:`datetime` | None, optional
+            Only maps uploaded at or after this time, by default None
+        uploaded_before : :class:`datetime` | None, optional
+            Only maps uploaded at or before this time, by default None
+        sort_by : str, optional
+            One of `author_time`, `award_count` or `uploaded`, by default "uploaded"
+        reverse : bool, optional
+            Whether to sort in descending order, by default False
+        limit : int | None, optional
+            The maximum number of maps to return, by default None
+
+        Returns
+        -------
+        :class:`list[TMXMap]`
+            The matching maps.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `sort_by` or a tag is not known.
+        """
+        if sort_by not in self.SORT_KEYS:
+            raise ValueError(f"Cannot sort by {sort_by}")
+
+        tag_mask = self._tag_mask(tags)
+        exclude_mask = self._tag_mask(exclude_tags)
+        if author is not None:
+            author = author.lower()
+
+        bounds = {
+            "author_time": (min_author_time, max_author_time),
+            "award_count": (min_awards, None),
+            "uploaded": (
+                uploaded_after.timestamp() if uploaded_after is not None else None,
+                uploaded_before.timestamp() if uploaded_before is not None else None,
+            ),
+        }
+
+        index = self._indexes[sort_by]
+        low, high = bounds.pop(sort_by)
+        start = 0 if low is None else bisect_left(index, (low,))
+        end = len(index) if high is None else bisect_right(index, (high, float("inf")))
+        candidates = index[start:end]
+        if reverse:
+            candidates.reverse()
+
+        matches = []
+        for _, tmx_id in candidates:
+            entry = self._entries[tmx_id]
+            if entry.tags & tag_mask != tag_mask or entry.tags & exclude_mask:
+                continue
+            if author is not None and entry.author != author:
+                continue
+            if difficulty is not None and entry.difficulty != difficulty:
+                continue
+            if length is not None and entry.length != length:
+                continue
+            if not all(
+                (lower is None or getattr(entry, key) >= lower)
+                and (upper is None or getattr(entry, key) <= upper)
+                for key, (lower, upper) in bounds.items()
+            ):
+                continue
+
+            matches.append(tmx_id)
+            if limit is not None and len(matches) >= limit:
+                break
+
+        return [self._get_parsed(tmx_id) for tmx_id in matches]
+
+    @staticmethod
+    def _tag_mask(tags: list[int | str] | None) -> int:
+        mask = 0
+        for tag in tags or []:
+            mask |= 1 << _enum_value(_TMX.MAP_TYPE_ENUMS, tag, "tag")
+        return mask
+
+    def _get_parsed(self, tmx_id: int) -> TMXMap:
+        if tmx_id not in self._parsed:
+            self._parsed[tmx_id] = TMXMap._from_dict(self._entries[tmx_id].raw)
+        return self._parsed[tmx_id]
+
+    async def refresh(self, *, full: bool = False, **filters) -> int:
+        """
+        .. versionadded :: 0.5
+
+        Adds the maps found by a TMX search to the catalogue.
+        Search results come newest first, so unless `full` is True the search stops at the first
+        map uploaded before the newest map a previous refresh with the same filters found. Without
+        filters, the newest map already in the catalogue is used instead.
+
+        Parameters
+        ----------
+        full : bool, optional
+            Whether to go through every search result, also picking up updates to older maps, by default False
+        **filters
+            The filters passed to :meth:`TMXMap.search`.
+
+        Returns
+        -------
+        int
+            The number of maps that were not in the catalogue before.
+        """
+        page_size = min(filters.pop("page_size", _TMX.SEARCH_LIMIT), _TMX.SEARCH_LIMIT)
+        limit = filters.pop("limit", None)
+        params = _search_params(
+            filters.pop("name", None),
+            filters.pop("author", None),
+            filters.pop("tags", None),
+            filters.pop("difficulty", None),
+            filters.pop("length", None),
+            filters.pop("length_operator", 0),
+            page_size,
+        )
+        if len(filters) != 0:
+            raise TypeError(f"Unknown search filters: {', '.join(filters)}")
+
+        # A filtered search only returns some of the catalogue's maps, so each set of filters
+        # keeps the upload date of the newest map it found.
+        filters_key = tuple(
+            sorted(
+                (key, value)
+                for key, value in params.items()
+                if key not in ("api", "format", "limit")
+            )
+        )
+        newest = self._newest.get(filters_key)
+        if newest is None and len(filters_key) == 0 and len(self) != 0:
+            newest = self._indexes["uploaded"][-1][0]
+
+        added = 0
+        seen = 0
+        found_newest = newest
+        async with aclosing(_search(params, page_size, limit)) as results:
+            async for map_data in results:
+                seen += 1
+                added += self.add(map_data)
+
+                entry = self._entries.get(map_data.get("TrackID"))
+                if entry is None:
+                    continue
+                if found_newest is None or entry.uploaded > found_newest:
+                    found_newest = entry.uploaded
+                if not full and newest is not None and entry.uploaded < newest:
+                    caught_up = True
+                    break
+            else:
+                # Cut short by `limit`, the maps between this refresh and the last one are missing.
+                caught_up = limit is None or seen < limit
+
+        if caught_up and found_newest is not None:
+            self._newest[filters_key] = found_newest
+
+        _log.debug(f"Added {added} maps to the TMX catalogue")
+        return added
@@ -1,4 +1,3 @@
-import json
 import logging
 from contextlib import suppress
 from datetime import datetime
@@ -9,7 +8,7 @@ from trackmania.errors import InvalidTOTDDate, TMIOException
 
 from .api import _APIClient
 from .base import TOTDObject
-from .config import get_from_cache, set_in_cache
+from .config import _cache_key, get_from_cache, set_in_cache
 from .constants import _TMIO
 from .errors import TMIOException, TrackmaniaException
 from .tmmap import TMMap
@@ -118,10 +117,10 @@ class TOTD(TOTDObject):
         _log.debug("Getting TOTD for date: %s", date)
 
         if __get_latest:
-            latest_totd_data = get_from_cache("totd:latest")
+            latest_totd_data = get_from_cache(_cache_key("totd", "latest"))
         else:
             latest_totd_data = get_from_cache(
-                f"totd:{date.year}:{date.month}:{date.day}"
+                _cache_key("totd", date.year, date.month, date.day)
             )
 
         if latest_totd_data is not None:
@@ -151,9 +150,9 @@ class TOTD(TOTDObject):
             ) from excp
 
         if __get_latest:
-            set_in_cache("totd:latest", json.dumps(totd))
+            set_in_cache(_cache_key("totd", "latest"), totd, ex=3600)
         else:
-            set_in_cache(f"totd:{date.year}:{date.month}:{date.day}", json.dumps(totd))
+            set_in_cache(_cache_key("totd", date.year, date.month, date.day), totd)
 
         return cls._from_dict(totd)
 
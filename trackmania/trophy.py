@@ -1,14 +1,16 @@
-import json
 import logging
 from contextlib import suppress
 from datetime import datetime
 
 from typing_extensions import Self
 
+from ._identity import _intern
+from ._names import _NAME_INDEX
+from ._pages import _locate_by_score
 from ._util import _add_commas, _frmt_str_to_datetime, _regex_it
 from .api import _APIClient
 from .base import TrophyObject
-from .config import get_from_cache, set_in_cache
+from .config import _cache_key, get_from_cache, set_in_cache
 from .constants import _TMIO
 from .errors import InvalidIDError, InvalidTrophyNumber, TMIOException
 
@@ -17,6 +19,27 @@ _log = logging.getLogger(__name__)
 __all__ = ("PlayerTrophies", "TrophyLeaderboardPlayer")
 
 
+async def _get_top_trophies(page: int) -> dict:
+    _log.debug(f"Getting Page {page} of Trophy Leaderboards")
+
+    top_trophies = get_from_cache(_cache_key("top_trophies", page))
+    if top_trophies is not None:
+        return top_trophies
+
+    api_client = _APIClient()
+    top_trophies = await api_client.get(
+        _TMIO.build([_TMIO.TABS.TOP_TROPHIES, str(page)])
+    )
+    await api_client.close()
+
+    with suppress(KeyError, TypeError):
+        raise TMIOException(top_trophies["error"])
+
+    set_in_cache(_cache_key("top_trophies", page), top_trophies, ex=3600)
+
+    return top_trophies
+
+
 class TrophyLeaderboardPlayer(TrophyObject):
     """
     .. versionadded :: 0.4.0
@@ -61,12 +84,13 @@ class TrophyLeaderboardPlayer(TrophyObject):
 
         args = []
         player = raw.get("player")
-        args.append(player.get("name"))
-        args.append(_regex_it(player.get("tag", None)))
-        args.append(player.get("id"))
+        _NAME_INDEX.add(player.get("id"), player.get("name"))
+        args.append(_intern(player.get("name")))
+        args.append(_intern(_regex_it(player.get("tag", None))))
+        args.append(_intern(player.get("id")))
         args.append(raw.get("rank"))
         args.append(_add_commas(int(raw.get("score"))))
-        args.append(PlayerZone._parse_zones(player.get("zone"), [0, 0, 0, 0, 0]))
+        args.append(PlayerZone._parse_zones(player.get("zone")))
 
         return cls(*args)
 
@@ -226,6 +250,8 @@ class PlayerTrophies(TrophyObject):
     async def history(self, page: int = 0) -> dict:
         """
         .. versionadded :: 0.3.0
+        .. versionchanged :: 0.5
+            History pages are cached per player.
 
         Retrieves Trophy Gain and Loss history of a player.
 
@@ -248,15 +274,16 @@ class PlayerTrophies(TrophyObject):
             f"Getting Trophy Leaderboard for Page: {page} and Player Id: {self.player_id}"
         )
 
-        trophy_leaderboard_data = get_from_cache(f"trophy:{page}")
-        if trophy_leaderboard_data is not None:
-            return trophy_leaderboard_data.get("gains")
-
-        api_client = _APIClient()
-
         if self.player_id is None:
             raise InvalidIDError("ID Has not been set for the Object")
 
+        trophy_history_data = get_from_cache(
+            _cache_key("trophy_history", self.player_id, page)
+        )
+        if trophy_history_data is not None:
+            return trophy_history_data.get("gains")
+
+        api_client = _APIClient()
         history = await api_client.get(
             _TMIO.build(
                 [_TMIO.TABS.PLAYER, self.player_id, _TMIO.TABS.TROPHIES, str(page)]
@@ -268,7 +295,9 @@ class PlayerTrophies(TrophyObject):
         with suppress(KeyError, TypeError):
             raise TMIOException(history["error"])
 
-        set_in_cache(f"trophy:{page}", json.dumps(history), ex=3600)
+        set_in_cache(
+            _cache_key("trophy_history", self.player_id, page), history, ex=3600
+        )
 
         return history["gains"]
 
@@ -276,6 +305,8 @@ class PlayerTrophies(TrophyObject):
     async def top_trophies(page: int = 0) -> list[TrophyLeaderboardPlayer]:
         """
         .. versionadded :: 0.3.0
+        .. versionchanged :: 0.5
+            Cached pages are returned without making a request.
 
         Get's the top players ranked by trophies
 
@@ -289,29 +320,41 @@ class PlayerTrophies(TrophyObject):
         :class:`list[TrophyLeaderboardPlayer]`
             The players as a list of :class:`TrophyLeaderboardPlayer` objects.
         """
-        _log.debug(f"Getting Page {page} of Trophy Leaderboards")
+        top_trophies = await _get_top_trophies(page)
 
-        trophy_leaderboard_data = get_from_cache(f"trophies:{page}")
-        if trophy_leaderboard_data is not None:
-            lb_players = []
-            for top_player in trophy_leaderboard_data.get("ranks", []):
-                lb_players.append(TrophyLeaderboardPlayer._from_dict(top_player))
+        lb_players = []
+        for top_player in top_trophies.get("ranks", []):
+            lb_players.append(TrophyLeaderboardPlayer._from_dict(top_player))
 
-        api_client = _APIClient()
+        return lb_players
 
-        top_trophies = await api_client.get(
-            _TMIO.build([_TMIO.TABS.TOP_TROPHIES, str(page)])
-        )
+    @staticmethod
+    async def locate_by_score(score: int) -> tuple[int, int] | None:
+        """
+        .. versionadded :: 0.5
 
-        await api_client.close()
+        Finds the page of :meth:`PlayerTrophies.top_trophies` a trophy score lands on and the
+        rank it would have, requesting O(log pages) pages instead of walking them from 0.
 
-        with suppress(KeyError, TypeError):
-            raise TMIOException(top_trophies["error"])
+        Parameters
+        ----------
+        score : int
+            The trophy score.
 
-        set_in_cache(f"trophies:{page}", json.dumps(top_trophies), ex=3600)
+        Returns
+        -------
+        tuple[int, int] | None
+            The page and the rank of the first player with a score lower than or equal to `score`.
+            None if every player on the leaderboard has a higher score.
+        """
 
-        lb_players = []
-        for top_player in top_trophies["ranks"]:
-            lb_players.append(TrophyLeaderboardPlayer._from_dict(top_player))
+        async def get_page(page: int) -> list[tuple[int, int]]:
+            top_trophies = await _get_top_trophies(page)
+            return [
+                (int(rank.get("score")), rank.get("rank"))
+                for rank in top_trophies.get("ranks", [])
+            ]
 
-        return lb_players
+        return await _locate_by_score(
+            score, get_page, _cache_key("top_trophies_bounds"), ex=3600
+        )
@@ -0,0 +1,208 @@
+import logging
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+
+from typing_extensions import Self
+
+from .base import ZoneObject
+from .config import _cache_key, get_keys_from_cache, get_many_from_cache
+from .constants import _TMIO
+from .matchmaking import MatchmakingLeaderboardPlayer
+from .player import ZoneNode
+from .tmmap import Leaderboard
+from .trophy import TrophyLeaderboardPlayer
+
+_log = logging.getLogger(__name__)
+
+__all__ = ("ZoneLeaderboard",)
+
+
+def _position(row) -> int:
+    # Map leaderboards have positions, trophy and matchmaking leaderboards have ranks.
+    position = getattr(row, "position", None)
+    return position if position is not None else row.rank
+
+
+class ZoneLeaderboard(ZoneObject):
+    """
+    .. versionadded :: 0.5
+
+    Indexes the rows of a global leaderboard by zone, so the top players of a country or a
+    player's rank in their region are answered without paging through the leaderboard again.
+    Rows can be added as more pages arrive, a player added again replaces their previous row.
+    Ranks are relative to the rows added, so they are only as complete as the pages loaded.
+
+    Parameters
+    ----------
+    rows : Iterable[:class:`Leaderboard` | :class:`TrophyLeaderboardPlayer` | :class:`MatchmakingLeaderboardPlayer`], optional
+        The rows to index. Rows without a player id or zones are skipped.
+    """
+
+    def __init__(self, rows: Iterable = ()):
+        self._rows: dict[str, object] = {}
+        self._entries: dict[ZoneNode, list[tuple[int, str]]] = {}
+        self._nodes: dict[str, ZoneNode] = {}
+        self.add(rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, rows: Iterable) -> None:
+        """
+        Adds rows to the index, replacing the previous rows of the same players.
+
+        Parameters
+        ----------
+        rows : Iterable[:class:`Leaderboard` | :class:`TrophyLeaderboardPlayer` | :class:`MatchmakingLeaderboardPlayer`]
+            The rows to add.
+        """
+        new_rows = {
+            row.player_id: row
+            for row in rows
+            if row.player_id is not None and row.zones
+        }
+
+        for player_id in new_rows:
+            old_row = self._rows.get(player_id)
+            if old_row is None:
+                continue
+            entry = (_position(old_row), player_id)
+            for zone in old_row.zones:
+                entries = self._entries[zone.node]
+                del entries[bisect_left(entries, entry)]
+
+        # Appended then sorted once per zone, cheaper than inserting row by row for whole pages.
+        changed = set()
+        for player_id, row in new_rows.items():
+            self._rows[player_id] = row
+            entry = (_position(row), player_id)
+            for zone in row.zones:
+                self._entries.setdefault(zone.node, []).append(entry)
+                self._nodes.setdefault(zone.node.name.lower(), zone.node)
+                changed.add(zone.node)
+
+        for node in changed:
+            self._entries[node].sort()
+
+    def _node(self, zone: str | ZoneNode) -> ZoneNode | None:
+        if isinstance(zone, ZoneNode):
+            return zone
+        return self._nodes.get(zone.lower())
+
+    def top(self, zone: str | ZoneNode, length: int = 10) -> list:
+        """
+        Gets the best rows in a zone.
+
+        Parameters
+        ----------
+        zone : str | :class:`ZoneNode`
+            The zone or its name, e.g. `"France"`.
+        length : int, optional
+            The maximum number of rows, by default 10
+
+        Returns
+        -------
+        list
+            The rows, best first. Empty if no row is in the zone.
+        """
+        node = self._node(zone)
+        if node is None:
+            return []
+
+        return [
+            self._rows[player_id]
+            for _, player_id in self._entries.get(node, [])[:length]
+        ]
+
+    def rank(self, player_id: str, zone: str | ZoneNode | None = None) -> int | None:
+        """
+        Gets a player's rank within a zone.
+
+        Parameters
+        ----------
+        player_id : str
+            The player's id.
+        zone : str | :class:`ZoneNode` | None, optional
+            The zone or its name, by default the player's smallest zone.
+
+        Returns
+        -------
+        int | None
+            The rank, starting at 1. None if the player is not indexed or not in the zone.
+        """
+        row = self._rows.get(player_id)
+        if row is None:
+            return None
+
+        node = row.zones[0].node if zone is None else self._node(zone)
+        if node is None or node not in (player_zone.node for player_zone in row.zones):
+            return None
+
+        return bisect_left(self._entries[node], (_position(row), player_id)) + 1
+
+    @classmethod
+    def _from_cache(cls: Self, pattern: str, rows_key: str, parse: Callable) -> Self:
+        pages = get_many_from_cache(get_keys_from_cache(pattern))
+        _log.debug(f"Indexing {len(pages)} cached pages matching {pattern}")
+
+        return cls(
+            parse(row)
+            for page in pages
+            if isinstance(page, dict)
+            for row in page.get(rows_key, [])
+        )
+
+    @classmethod
+    def trophies_from_cache(cls: Self) -> Self:
+        """
+        Indexes every cached page of the trophy leaderboard, see :meth:`PlayerTrophies.top_trophies`.
+
+        Returns
+        -------
+        :class:`ZoneLeaderboard`
+            The index.
+        """
+        return cls._from_cache(
+            _cache_key("top_trophies", "*"), "ranks", TrophyLeaderboardPlayer._from_dict
+        )
+
+    @classmethod
+    def matchmaking_from_cache(cls: Self, royal: bool = False) -> Self:
+        """
+        Indexes every cached page of the matchmaking leaderboard, see :meth:`PlayerMatchmaking.top_matchmaking`.
+
+        Parameters
+        ----------
+        royal : bool, optional
+            Whether to index the royal leaderboard instead of 3v3, by default False
+
+        Returns
+        -------
+        :class:`ZoneLeaderboard`
+            The index.
+        """
+        type_id = _TMIO.TABS.ROYAL_ID if royal else _TMIO.TABS.MATCHMAKING_ID
+        return cls._from_cache(
+            _cache_key("top_matchmaking", type_id, "*"),
+            "ranks",
+            MatchmakingLeaderboardPlayer._from_dict,
+        )
+
+    @classmethod
+    def map_from_cache(cls: Self, map_uid: str) -> Self:
+        """
+        Indexes every cached page of a map's leaderboard, see :meth:`TMMap.get_leaderboard`.
+
+        Parameters
+        ----------
+        map_uid : str
+            The map's uid.
+
+        Returns
+        -------
+        :class:`ZoneLeaderboard`
+            The index.
+        """
+        return cls._from_cache(
+            _cache_key("map_leaderboard", map_uid, "*"), "tops", Leaderboard._from_dict
+        )